@@ -248,6 +248,61 @@ Max = 700
 Time → O(n*k)
 Space → O(1)
 
+===============================================================================
+Approach 5 — Two-Stack Window Aggregate (MonoidQueue, O(n))
+===============================================================================
+
+Idea
+----
+Brute force re-adds k numbers for EVERY window. The sliding window avoids
+that by subtracting the element that leaves — which only works because
++ has an inverse (-). For max / min / gcd there is no "subtract".
+
+MonoidQueue (08_Stack_Queue_FAANG_Interview_Questions/
+06_Monoid_Queue_Sliding_Window.py) keeps the window in two stacks that
+store running aggregates, so ANY associative function (sum, max, gcd, ...)
+of the window is available in O(1) amortized — no subtraction needed.
+
+Code
+----
+"""
+
+def load_monoid_queue_module():
+    """Load 06_Monoid_Queue_Sliding_Window.py (file name starts with a digit)."""
+    import importlib.util
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(here, "..", "08_Stack_Queue_FAANG_Interview_Questions",
+                        "06_Monoid_Queue_Sliding_Window.py")
+    spec = importlib.util.spec_from_file_location("monoid_queue", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class SolutionMonoidQueue:
+    def maxSubarraySum(self, arr, k):
+        import operator
+        sliding_window = load_monoid_queue_module().sliding_window
+        return max(sliding_window(arr, k, operator.add))
+
+"""
+Dry Run
+-------
+arr = [100,200,300,400]
+k = 2
+
+IN = [100,200]        in_agg = 300          → window sum 300
+transfer → OUT aggs = [200, 300] → pop      → IN = [300], in_agg = 300
+out_agg 200 + in_agg 300                     → window sum 500
+...                                          → window sum 700
+
+Max = 700
+
+Time → O(n)   (each element combined at most twice)
+Space → O(k)
+
 ===============================================================================
 DETAILED COMPLETE DRY RUNS (STEP‑BY‑STEP)
 ===============================================================================
@@ -391,6 +446,7 @@ Sliding Window    | O(n)     | O(1)  | ⭐ Best
 Prefix Sum        | O(n)     | O(n)  | Good
 Clean Sliding     | O(n)     | O(1)  | ⭐ Best
 Brute Force       | O(n*k)   | O(1)  | ❌
+MonoidQueue       | O(n)     | O(k)  | Any window aggregate
 
 ===============================================================================
 Demo Execution (Run All Approaches)
@@ -416,6 +472,9 @@ if __name__ == "__main__":
     print("\nBrute Force:")
     print(SolutionBrute().maxSubarraySum(arr, k))
 
+    print("\nMonoidQueue (two stacks):")
+    print(SolutionMonoidQueue().maxSubarraySum(arr, k))
+
 """
 ===============================================================================
 Interview Cheat Sheet
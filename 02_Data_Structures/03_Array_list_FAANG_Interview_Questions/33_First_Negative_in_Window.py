@@ -263,6 +263,51 @@ ans = [-1, -1, -7, -15, -15, 0]
 
 Final Answer = [-1, -1, -7, -15, -15, 0]
 
+===============================================================================
+Approach 3 — Two-Stack Window Aggregate (MonoidQueue)
+===============================================================================
+
+"First negative of the window" is an ASSOCIATIVE combine:
+
+    first_neg(a, b) = a if a < 0 else b        (0 = "no negative")
+
+    first_neg(first_neg(a, b), c) == first_neg(a, first_neg(b, c))
+
+so the generic sliding-window aggregator from
+08_Stack_Queue_FAANG_Interview_Questions/06_Monoid_Queue_Sliding_Window.py
+answers every window in O(1) amortized — no problem-specific deque logic.
+"""
+
+def load_monoid_queue_module():
+    """Load 06_Monoid_Queue_Sliding_Window.py (file name starts with a digit)."""
+    import importlib.util
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(here, "..", "08_Stack_Queue_FAANG_Interview_Questions",
+                        "06_Monoid_Queue_Sliding_Window.py")
+    spec = importlib.util.spec_from_file_location("monoid_queue", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class SolutionMonoidQueue:
+    def firstNegInt(self, arr, k):
+        """
+        🔹 Steps
+        1. Map every element: negative → itself, otherwise → 0
+        2. Slide a window of size k with combine = first_neg
+
+        ⏱️ Time: O(n)
+        ⏱️ Space: O(k)
+        """
+        sliding_window = load_monoid_queue_module().sliding_window
+        first_neg = lambda a, b: a if a < 0 else b
+        marked = (x if x < 0 else 0 for x in arr)
+        return list(sliding_window(marked, k, first_neg))
+
+"""
 ===============================================================================
 Comparison
 ===============================================================================
@@ -271,6 +316,7 @@ Method            | Time | Space | Recommended
 ------------------|------|-------|------------
 List + Pointer    | O(n) | O(k)  | Good
 Deque             | O(n) | O(k)  | ⭐ Best
+MonoidQueue       | O(n) | O(k)  | Generic (any associative combine)
 
 ===============================================================================
 Demo Execution
@@ -283,6 +329,7 @@ if __name__ == "__main__":
 
     print("List Pointer:", SolutionListPointer().firstNegInt(arr, k))
     print("Deque:", SolutionDeque().firstNegInt(arr, k))
+    print("MonoidQueue:", SolutionMonoidQueue().firstNegInt(arr, k))
 """
 ===============================================================================
 Interview Cheat Sheet
@@ -1,6 +1,16 @@
 # ============================================================
 # Singly Linked List - Full Notes + Implementation
 # ============================================================
+# Optional "skip index" mode: LinkedList(skip_index=True) keeps a sparse
+# table of checkpoint nodes (one every ≈ √n positions) so get / insert /
+# remove / pop are O(√n) instead of O(n). Notes, diagrams and the benchmark
+# of both modes: 18_Skip_Index_SLL.py
+
+from bisect import bisect_right
+from math import isqrt
+
+MIN_STEP = 8    # smallest distance between two skip-index checkpoints
+
 
 # ---------------- NODE CLASS ----------------
 class Node:
@@ -11,10 +21,107 @@ class Node:
 
 # ---------------- LINKED LIST CLASS ----------------
 class LinkedList:
-    def __init__(self):
+    def __init__(self, skip_index=False):
         self.head = None
         self.tail = None
         self.length = 0
+        self.skip_index = skip_index
+        self._step = MIN_STEP
+        self._nodes = []     # checkpoint nodes
+        self._pos = []       # checkpoint positions (actual = stored + _shift)
+        self._shift = 0
+
+    # =======================================================
+    # SKIP INDEX HELPERS
+    # =======================================================
+    """
+    _locate(index):
+    1. k = last checkpoint whose position <= index (binary search)
+    2. Start from that checkpoint (or head if k == -1)
+    3. Walk the remaining links
+
+    Returns (k, node) so callers know which checkpoint entries follow.
+
+    Time Complexity: O(√n) with skip index, O(n) without
+    """
+    def _locate(self, index):
+        k = -1
+        node = self.head
+        start = 0
+        if self.skip_index and self._pos:
+            k = bisect_right(self._pos, index - self._shift) - 1
+            if k >= 0:
+                node = self._nodes[k]
+                start = self._pos[k] + self._shift
+        for _ in range(index - start):
+            node = node.next
+        return k, node
+
+    """
+    _fix_gap(k):
+    1. Gap = distance from checkpoint k (or head when k == -1) to the next
+       checkpoint (or to the end of the list)
+    2. If gap > 2·step: walk `step` links and add a new checkpoint there
+
+    Time Complexity: O(step) when splitting, O(1) otherwise
+    """
+    def _fix_gap(self, k):
+        if k < 0:
+            left, node = 0, self.head
+        else:
+            left, node = self._pos[k] + self._shift, self._nodes[k]
+        right = self._pos[k + 1] + self._shift if k + 1 < len(self._pos) else self.length
+        if right - left > 2 * self._step:
+            for _ in range(self._step):
+                node = node.next
+            self._nodes.insert(k + 1, node)
+            self._pos.insert(k + 1, left + self._step - self._shift)
+
+    """
+    _fix_gaps_from(k):
+    Run _fix_gap on checkpoint k and every checkpoint after it (new ones
+    included) → used after extend / splice added a whole batch at the end.
+
+    Time Complexity: O(checkpoints after k + new nodes walked)
+    """
+    def _fix_gaps_from(self, k):
+        while k < len(self._pos):
+            self._fix_gap(k)
+            k += 1
+
+    """
+    _maybe_rebuild():
+    Rebuild when step is far from √n (list grew or shrank ×4),
+    or when removals left too many checkpoints.
+
+    Time Complexity: O(1) check, O(n) rebuild (amortized O(1))
+    """
+    def _maybe_rebuild(self):
+        step = self._step
+        n = self.length
+        if (n > 4 * step * step
+                or (step > MIN_STEP and 4 * n < step * step)
+                or len(self._pos) > 2 * (n // step) + 2):
+            self._rebuild()
+
+    def _rebuild(self):
+        self._step = max(MIN_STEP, isqrt(self.length))
+        self._nodes = []
+        self._pos = []
+        self._shift = 0
+        node = self.head
+        index = 0
+        while node:
+            if index and index % self._step == 0:
+                self._nodes.append(node)
+                self._pos.append(index)
+            node = node.next
+            index += 1
+
+    def _shift_after(self, k, delta):
+        pos = self._pos
+        for j in range(k, len(pos)):
+            pos[j] += delta
 
     # =======================================================
     # APPEND METHOD
@@ -29,13 +136,15 @@ class LinkedList:
          - tail.next = new_node
          - tail = new_node
     4. Increase length
+    5. Skip index: the gap after the LAST checkpoint grew by one
+         → _fix_gap(last)
 
     ASCII:
     Before: 10 --> 20
     append(30)
     After:  10 --> 20 --> 30
 
-    Time Complexity: O(1)
+    Time Complexity: O(1) (amortized with skip index)
     Space Complexity: O(1)
     """
     def append(self, value):
@@ -47,6 +156,9 @@ class LinkedList:
             self.tail.next = new_node
             self.tail = new_node
         self.length += 1
+        if self.skip_index:
+            self._fix_gap(len(self._pos) - 1)
+            self._maybe_rebuild()
 
     # =======================================================
     # PREPEND METHOD
@@ -61,13 +173,15 @@ class LinkedList:
          - new_node.next = head
          - head = new_node
     4. Increase length
+    5. Skip index: every position moves by +1 → _shift += 1,
+       then the gap before the FIRST checkpoint grew → _fix_gap(-1)
 
     ASCII:
     Before: 10 --> 20 --> 30
     prepend(5)
     After:  5 --> 10 --> 20 --> 30
 
-    Time Complexity: O(1)
+    Time Complexity: O(1) (amortized with skip index)
     Space Complexity: O(1)
     """
     def prepend(self, value):
@@ -79,6 +193,10 @@ class LinkedList:
             new_node.next = self.head
             self.head = new_node
         self.length += 1
+        if self.skip_index:
+            self._shift += 1
+            self._fix_gap(-1)
+            self._maybe_rebuild()
 
     # =======================================================
     # INSERT METHOD
@@ -88,17 +206,18 @@ class LinkedList:
     1. If index == 0: call prepend
     2. If index == length: call append
     3. Else:
-         - Traverse to index-1 node
+         - (k, temp) = _locate(index - 1)
          - new_node.next = temp.next
          - temp.next = new_node
     4. Increase length
+    5. Skip index: checkpoints after k move by +1, then _fix_gap(k)
 
     ASCII:
     Before: 10 --> 30 --> 40
     insert(1, 20)
     After:  10 --> 20 --> 30 --> 40
 
-    Time Complexity: O(n)
+    Time Complexity: O(n), O(√n) with skip index
     Space Complexity: O(1)
     """
     def insert(self, index, value):
@@ -110,13 +229,15 @@ class LinkedList:
         if index == self.length:
             self.append(value)
             return "Inserted Successfully"
+        k, temp_node = self._locate(index - 1)
         new_node = Node(value)
-        temp_node = self.head
-        for _ in range(index - 1):
-            temp_node = temp_node.next
         new_node.next = temp_node.next
         temp_node.next = new_node
         self.length += 1
+        if self.skip_index:
+            self._shift_after(k + 1, 1)
+            self._fix_gap(k)
+            self._maybe_rebuild()
         return "Inserted Successfully"
 
     # =======================================================
@@ -132,6 +253,8 @@ class LinkedList:
          - head = head.next
          - popped_node.next = None
     5. Decrease length
+    6. Skip index: if head was a checkpoint, drop it;
+       every position moves by -1 → _shift -= 1
 
     ASCII:
     Before: 10 --> 20 --> 30
@@ -152,6 +275,12 @@ class LinkedList:
             self.head = self.head.next
             popped_node.next = None
         self.length -= 1
+        if self.skip_index:
+            if self._nodes and self._nodes[0] is popped_node:
+                del self._nodes[0]
+                del self._pos[0]
+            self._shift -= 1
+            self._maybe_rebuild()
         return f"Popped first node: {popped_node.value}"
 
     # =======================================================
@@ -165,6 +294,7 @@ class LinkedList:
          - head = None, tail = None
     4. Else:
          - Traverse till second last node
+           (skip index: _unlink(length - 1) → O(√n))
          - tail = second_last, tail.next = None
     5. Decrease length
 
@@ -173,16 +303,20 @@ class LinkedList:
     pop()
     After:  10 --> 20   (popped: 30)
 
-    Time Complexity: O(n)
+    Time Complexity: O(n), O(√n) with skip index
     Space Complexity: O(1)
     """
     def pop(self):
         if self.length == 0:
             return "No Node to Pop"
         popped_node = self.tail
+        if self.skip_index and self.length > 1:
+            self._unlink(self.length - 1)
+            return f"Popped last node: {popped_node.value}"
         if self.length == 1:
             self.head = None
             self.tail = None
+            self._nodes, self._pos, self._shift = [], [], 0
         else:
             temp_node = self.head
             while temp_node.next != self.tail:
@@ -199,22 +333,20 @@ class LinkedList:
     Steps:
     1. If index < 0 or index >= length: return None
     2. Traverse index times to reach node
+       (skip index: start from the nearest checkpoint before it)
     3. Return node
 
     ASCII:
     List: 5 --> 10 --> 15 --> 20
     get(2) → Node(15)
 
-    Time Complexity: O(n)
+    Time Complexity: O(n), O(√n) with skip index
     Space Complexity: O(1)
     """
     def get(self, index):
         if index < 0 or index >= self.length:
             return None
-        current_node = self.head
-        for _ in range(index):
-            current_node = current_node.next
-        return current_node
+        return self._locate(index)[1]
 
     # =======================================================
     # REMOVE METHOD
@@ -228,13 +360,15 @@ class LinkedList:
          - prev.next = popped_node.next
     3. If removing last node, update tail
     4. Decrease length
+    5. Skip index: if the removed node was checkpoint k+1, drop it;
+       checkpoints after it move by -1
 
     ASCII:
     Before: 5 --> 10 --> 15 --> 20
     remove(2)
     After:  5 --> 10 --> 20  (removed: 15)
 
-    Time Complexity: O(n)
+    Time Complexity: O(n), O(√n) with skip index
     Space Complexity: O(1)
     """
     def remove(self, index):
@@ -242,14 +376,24 @@ class LinkedList:
             return "Index out of range"
         if index == 0:
             return self.pop_first()
-        prev_node = self.get(index - 1)
+        popped_node = self._unlink(index)
+        return f"Removed node with value {popped_node.value} from index {index}"
+
+    def _unlink(self, index):
+        k, prev_node = self._locate(index - 1)
         popped_node = prev_node.next
         prev_node.next = popped_node.next
-        if index == self.length - 1:
+        if popped_node is self.tail:
             self.tail = prev_node
         popped_node.next = None
         self.length -= 1
-        return f"Removed node with value {popped_node.value} from index {index}"
+        if self.skip_index:
+            if k + 1 < len(self._nodes) and self._nodes[k + 1] is popped_node:
+                del self._nodes[k + 1]
+                del self._pos[k + 1]
+            self._shift_after(k + 1, -1)
+            self._maybe_rebuild()
+        return popped_node
 
     # =======================================================
     # DELETE_ALL METHOD
@@ -259,6 +403,7 @@ class LinkedList:
     1. Set head = None
     2. Set tail = None
     3. Set length = 0
+    4. Clear the skip index (checkpoints, shift, step)
 
     ASCII:
     Before: 10 --> 20 --> 30
@@ -272,8 +417,121 @@ class LinkedList:
         self.head = None
         self.tail = None
         self.length = 0
+        self._step = MIN_STEP
+        self._nodes, self._pos, self._shift = [], [], 0
         return "All nodes deleted!"
 
+    # =======================================================
+    # EXTEND METHOD (bulk append)
+    # =======================================================
+    """
+    Steps:
+    1. Link all new nodes into a private chain (dummy --> n1 --> n2 ...)
+       - no empty-list check, tail fix-up or length update per element
+    2. If chain is empty: nothing to do
+    3. Attach the chain once:
+         - empty list: head = first
+         - else:       tail.next = first
+    4. tail = last, length += count
+    5. Skip index: split the (now long) gap after the last checkpoint
+       into checkpoints every `step` nodes → _fix_gaps_from(last)
+
+    ASCII:
+    Before: 10 --> 20
+    extend([30, 40, 50])
+    After:  10 --> 20 --> 30 --> 40 --> 50
+
+    Time Complexity: O(k)   (k = number of new items, with or without skip index)
+    Space Complexity: O(k)
+    """
+    def extend(self, iterable):
+        dummy = Node(None)
+        last = dummy
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            last.next = new_node
+            last = new_node
+            count += 1
+        if count == 0:
+            return "Nothing to extend"
+        if self.length == 0:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = last
+        self.length += count
+        if self.skip_index:
+            self._fix_gaps_from(len(self._pos) - 1)
+            self._maybe_rebuild()
+        return "Extended Successfully"
+
+    # =======================================================
+    # FROM_ITERABLE (bulk construction)
+    # =======================================================
+    """
+    Steps:
+    1. Create empty list (skip_index=True for an indexed one)
+    2. extend(iterable)
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+    """
+    @classmethod
+    def from_iterable(cls, iterable, skip_index=False):
+        ll = cls(skip_index=skip_index)
+        ll.extend(iterable)
+        return ll
+
+    # =======================================================
+    # SPLICE METHOD (O(1) concatenation)
+    # =======================================================
+    """
+    Steps:
+    1. If other is empty: nothing to do
+    2. If self is empty: head = other.head
+       Else:             tail.next = other.head
+    3. tail = other.tail, length += other.length
+    4. Skip index: other's checkpoints are re-based (position + old length)
+       and appended; then every gap from self's last old checkpoint on is
+       checked / split → _fix_gaps_from(junction)
+    5. Empty `other` (its nodes now belong to self)
+
+    ASCII:
+    self:  10 --> 20        other: 30 --> 40
+    splice(other)
+    self:  10 --> 20 --> 30 --> 40        other: (empty)
+
+    Time Complexity: O(1) without skip index;
+                     with it O(√k) if other is indexed too, else O(k)
+    Space Complexity: O(1)
+    """
+    def splice(self, other):
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if other.length == 0:
+            return "Nothing to splice"
+        old_length = self.length
+        if self.length == 0:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.length += other.length
+        if self.skip_index:
+            junction = len(self._pos) - 1
+            if other.skip_index:
+                base = old_length + other._shift - self._shift
+                self._nodes.extend(other._nodes)
+                self._pos.extend(p + base for p in other._pos)
+            self._fix_gaps_from(junction)
+            self._maybe_rebuild()
+        other.head = None
+        other.tail = None
+        other.length = 0
+        other._nodes, other._pos, other._shift = [], [], 0
+        return "Spliced Successfully"
+
     # =======================================================
     # STRING REPRESENTATION
     # =======================================================
@@ -307,3 +565,28 @@ if __name__ == "__main__":
     print("After Remove Index 1:", ll)
     print(ll.delete_all())
     print("After Delete All:", ll)
+
+    ll = LinkedList.from_iterable([1, 2, 3])
+    ll.extend([4, 5])
+    ll.splice(LinkedList.from_iterable([6, 7]))
+    print("Bulk built:", ll)
+
+    ll = LinkedList.from_iterable(range(100), skip_index=True)
+    ll.insert(50, "x")
+    print("Skip index: get(50) →", ll.get(50).value, "| get(99) →", ll.get(99).value,
+          "| checkpoints:", len(ll._pos))
+
+    # ---------------- BULK LOADING THROUGHPUT ----------------
+    import time
+
+    N = 1_000_000
+    start = time.perf_counter()
+    ll = LinkedList()
+    for i in range(N):
+        ll.append(i)
+    append_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    ll = LinkedList.from_iterable(range(N))
+    bulk_secs = time.perf_counter() - start
+    print(f"Load {N:,} items: append loop {N / append_secs:,.0f} items/s, "
+          f"from_iterable {N / bulk_secs:,.0f} items/s")
@@ -0,0 +1,392 @@
+# ============================================================
+# Array-Backed (Compact) Singly Linked List - Notes + Implementation
+# ============================================================
+"""
+Why an array-backed linked list?
+--------------------------------
+The classic SLL in 15_All_Methods_of_SLL.py creates ONE Python object per
+element:
+
+    Node(value) --> instance + its own __dict__ (value, next)
+
+For millions of elements this costs well over 100 bytes per element and
+gives the garbage collector millions of objects to track.
+
+Idea: keep the SAME linked structure, but store it in parallel arrays and
+use integer INDEXES instead of object references.
+
+    slot:      0     1     2     3     4
+    values: [ 10 ,  20 ,  30 ,  -- ,  -- ]
+    next:   [  1 ,   2 ,  -1 ,   4 ,  -1 ]
+                              ^free list: 3 --> 4 --> -1
+
+    head = 0, tail = 2, free = 3
+
+    Logical list:  10 --> 20 --> 30
+
+- `next` is an array('q') of machine integers (8 bytes per slot, no boxing).
+- `-1` plays the role of `None`.
+- Removed slots are pushed on a FREE LIST (chained through `next`), so
+  pop / pop_first / remove recycle memory instead of leaving holes.
+- `values` is a plain Python list by default (any object), or an
+  array(typecode) for numeric payloads (e.g. typecode="q" or "d").
+
+Same method surface as LinkedList:
+    append, prepend, insert, get, pop_first, pop, remove, delete_all, __str__
+
+Difference: get(index) returns the VALUE (there is no Node object to return).
+"""
+
+from array import array
+
+NIL = -1    # "None" for index links
+
+
+# ---------------- COMPACT LINKED LIST CLASS ----------------
+class CompactLinkedList:
+    def __init__(self, typecode=None):
+        self.typecode = typecode
+        self._values = array(typecode) if typecode else []
+        self._next = array("q")
+        self._free = NIL
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+
+    # =======================================================
+    # SLOT ALLOCATOR (free-list)
+    # =======================================================
+    """
+    Steps:
+    1. If free list not empty:
+         - slot = free
+         - free = next[slot]
+         - values[slot] = value
+    2. Else:
+         - grow both arrays by one (amortized O(1))
+    3. next[slot] = NIL
+
+    ASCII:
+    free: 3 --> 4 --> -1
+    _alloc(99) → slot 3
+    free: 4 --> -1
+
+    Time Complexity: O(1) amortized
+    Space Complexity: O(1)
+    """
+    def _alloc(self, value):
+        slot = self._free
+        if slot != NIL:
+            self._free = self._next[slot]
+            self._values[slot] = value
+            self._next[slot] = NIL
+        else:
+            slot = len(self._next)
+            self._values.append(value)
+            self._next.append(NIL)
+        return slot
+
+    """
+    Steps:
+    1. next[slot] = free
+    2. free = slot
+    3. For object storage, drop the reference so the value can be collected
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+    def _release(self, slot):
+        if self.typecode is None:
+            self._values[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _slot_at(self, index):
+        slot = self.head
+        for _ in range(index):
+            slot = self._next[slot]
+        return slot
+
+    # =======================================================
+    # APPEND METHOD
+    # =======================================================
+    """
+    Steps:
+    1. slot = _alloc(value)
+    2. If list empty: head = tail = slot
+    3. Else: next[tail] = slot; tail = slot
+    4. Increase length
+
+    Time Complexity: O(1) amortized
+    Space Complexity: O(1)
+    """
+    def append(self, value):
+        slot = self._alloc(value)
+        if self.length == 0:
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+        self.tail = slot
+        self.length += 1
+
+    # =======================================================
+    # PREPEND METHOD
+    # =======================================================
+    """
+    Steps:
+    1. slot = _alloc(value)
+    2. If list empty: head = tail = slot
+    3. Else: next[slot] = head; head = slot
+    4. Increase length
+
+    Time Complexity: O(1) amortized
+    Space Complexity: O(1)
+    """
+    def prepend(self, value):
+        slot = self._alloc(value)
+        if self.length == 0:
+            self.tail = slot
+        else:
+            self._next[slot] = self.head
+        self.head = slot
+        self.length += 1
+
+    # =======================================================
+    # INSERT METHOD
+    # =======================================================
+    """
+    Steps:
+    1. index == 0 → prepend, index == length → append
+    2. Else:
+         - walk to slot at index-1 (prev)
+         - next[new] = next[prev]
+         - next[prev] = new
+    3. Increase length
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return "Index out of range"
+        if index == 0:
+            self.prepend(value)
+            return "Inserted Successfully"
+        if index == self.length:
+            self.append(value)
+            return "Inserted Successfully"
+        prev = self._slot_at(index - 1)
+        slot = self._alloc(value)
+        self._next[slot] = self._next[prev]
+        self._next[prev] = slot
+        self.length += 1
+        return "Inserted Successfully"
+
+    # =======================================================
+    # POP_FIRST METHOD
+    # =======================================================
+    """
+    Steps:
+    1. If empty: return "No Node to pop"
+    2. slot = head; head = next[head]
+    3. If list became empty: tail = NIL
+    4. Release slot to free list, decrease length
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+    def pop_first(self):
+        if self.length == 0:
+            return "No Node to pop"
+        slot = self.head
+        value = self._values[slot]
+        self.head = self._next[slot]
+        if self.length == 1:
+            self.tail = NIL
+        self._release(slot)
+        self.length -= 1
+        return f"Popped first node: {value}"
+
+    # =======================================================
+    # POP METHOD
+    # =======================================================
+    """
+    Steps:
+    1. If empty: return "No Node to Pop"
+    2. If one element: head = tail = NIL
+    3. Else: walk to second-last slot, make it tail, next[tail] = NIL
+    4. Release old tail slot, decrease length
+
+    Time Complexity: O(n)  (singly linked → must find previous slot)
+    Space Complexity: O(1)
+    """
+    def pop(self):
+        if self.length == 0:
+            return "No Node to Pop"
+        slot = self.tail
+        value = self._values[slot]
+        if self.length == 1:
+            self.head = NIL
+            self.tail = NIL
+        else:
+            prev = self._slot_at(self.length - 2)
+            self._next[prev] = NIL
+            self.tail = prev
+        self._release(slot)
+        self.length -= 1
+        return f"Popped last node: {value}"
+
+    # =======================================================
+    # GET METHOD
+    # =======================================================
+    """
+    Steps:
+    1. If index invalid: return None
+    2. Walk index links from head
+    3. Return the stored value
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        return self._values[self._slot_at(index)]
+
+    # =======================================================
+    # REMOVE METHOD
+    # =======================================================
+    """
+    Steps:
+    1. index == 0 → pop_first
+    2. Else:
+         - prev = slot at index-1, slot = next[prev]
+         - next[prev] = next[slot]
+         - if slot was tail: tail = prev
+    3. Release slot, decrease length
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return "Index out of range"
+        if index == 0:
+            return self.pop_first()
+        prev = self._slot_at(index - 1)
+        slot = self._next[prev]
+        value = self._values[slot]
+        self._next[prev] = self._next[slot]
+        if slot == self.tail:
+            self.tail = prev
+        self._release(slot)
+        self.length -= 1
+        return f"Removed node with value {value} from index {index}"
+
+    # =======================================================
+    # DELETE_ALL METHOD
+    # =======================================================
+    """
+    Steps:
+    1. Drop both arrays and reset head, tail, free and length
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+    def delete_all(self):
+        self._values = array(self.typecode) if self.typecode else []
+        self._next = array("q")
+        self._free = NIL
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        return "All nodes deleted!"
+
+    # =======================================================
+    # ITERATION + STRING REPRESENTATION
+    # =======================================================
+    def __iter__(self):
+        values = self._values
+        nxt = self._next
+        slot = self.head
+        while slot != NIL:
+            yield values[slot]
+            slot = nxt[slot]
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        return " --> ".join(str(value) for value in self)
+
+
+# ============================================================
+# MEMORY BENCHMARK: Node-per-element vs array-backed
+# ============================================================
+def load_node_linked_list():
+    """Load LinkedList from 15_All_Methods_of_SLL.py (file name starts with a digit)."""
+    import importlib.util
+    import os
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "15_All_Methods_of_SLL.py")
+    spec = importlib.util.spec_from_file_location("all_methods_sll", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod.LinkedList
+
+
+def measure_memory(factory, n):
+    """Return (bytes allocated, seconds) to append n ints to a fresh list."""
+    import time
+    import tracemalloc
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    ll = factory()
+    for i in range(n):
+        ll.append(i)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, elapsed
+
+
+# ============================================================
+# USAGE EXAMPLE
+# ============================================================
+if __name__ == "__main__":
+    ll = CompactLinkedList()
+    ll.append(10)
+    ll.append(20)
+    ll.append(30)
+    ll.prepend(5)
+    ll.insert(2, 15)
+    print("Compact Linked List:", ll)
+    print(ll.pop_first())
+    print(ll.pop())
+    print(ll.remove(1))
+    print("After pops/remove:", ll)
+    ll.append(99)                   # reuses a freed slot
+    print("After append(99):", ll, "| slots allocated:", len(ll._next))
+
+    N = 1_000_000
+    LinkedList = load_node_linked_list()
+    print(f"\nMemory to hold {N:,} ints:")
+    for name, factory in [
+        ("Node LinkedList", LinkedList),
+        ("CompactLinkedList (list values)", CompactLinkedList),
+        ("CompactLinkedList (array 'q')", lambda: CompactLinkedList("q")),
+    ]:
+        used, secs = measure_memory(factory, N)
+        print(f"  {name:<34} {used / N:6.1f} bytes/element   build {secs:.2f}s")
+
+# ============================================================
+# COMPLEXITIES (summary)
+# ============================================================
+"""
+- append / prepend:     O(1) amortized (array growth)
+- pop_first:            O(1)
+- insert / get / remove / pop:  O(n)
+- Memory per element:   8 bytes (next) + 8 bytes (list slot) + value object
+                        or 8 + 8 bytes total with typecode="q"
+"""
@@ -0,0 +1,134 @@
+# ============================================================
+# Singly Linked List with optional "Skip Index" - Notes + Benchmark
+# ============================================================
+"""
+Problem
+-------
+get(index), insert(index, value) and remove(index) in 15_All_Methods_of_SLL.py
+always walk from head:
+
+    for i in range(n):
+        ll.get(i)          # 0 + 1 + 2 + ... + n-1 steps  → O(n²)
+
+Skip index idea
+---------------
+Keep a SPARSE side table of "checkpoint" nodes, roughly one every
+step ≈ √n positions, together with the position of each checkpoint:
+
+    positions:  [  4 ,      8 ,      12 ]
+    nodes:      [  ↓        ↓         ↓ ]
+    head → a → b → c → d → e → f → g → h → i → j → k → l → m → n → None
+                           ^4                  ^8                 ^12
+
+    get(10):
+      1. binary search positions → last checkpoint ≤ 10 is 8 (node i)
+      2. walk 2 links from i → k
+
+    → at most ~2·step links per lookup → O(√n)
+
+Keeping the table correct incrementally:
+    - insert/remove at i shifts the positions of every checkpoint after i
+      by ±1 → one pass over the table, O(√n).
+    - prepend / pop_first shift EVERY checkpoint, so positions are stored
+      relative to a shared offset (`_shift`) and only that counter changes
+      → still O(1).
+    - If a gap between two checkpoints grows beyond 2·step it is split by
+      walking `step` links once (amortized O(1) for append/prepend).
+    - If the list grows/shrinks so much that step is far from √n, or the
+      table gets too crowded after many removals, it is rebuilt in O(n)
+      (amortized over the Θ(n) operations that caused it).
+
+The skip index is OPTIONAL:
+    LinkedList()                 → classic behaviour (walk from head)
+    LinkedList(skip_index=True)  → O(√n) get/insert/remove/pop
+
+Where the code lives
+--------------------
+The skip index is built into LinkedList in 15_All_Methods_of_SLL.py
+(skip_index=True), so the indexed list keeps every method of the classic
+one, including extend / from_iterable / splice:
+
+    extend(values)      → the new tail gap is split into checkpoints, O(k)
+    splice(other)       → other's checkpoints are re-based by the old
+                          length and appended, long gaps split
+                          → O(√k) if other is indexed, else O(k)
+
+This note keeps the explanation above and the benchmark of both modes.
+"""
+
+import importlib.util
+import os
+
+
+def load_sll_module():
+    """Load 15_All_Methods_of_SLL.py (its name starts with a digit)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "all_methods_of_sll", os.path.join(here, "15_All_Methods_of_SLL.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+LinkedList = load_sll_module().LinkedList
+
+
+# ============================================================
+# BENCHMARK: classic walk vs skip index
+# ============================================================
+def benchmark(n, ops=200, seed=1):
+    """Time `ops` random get + insert + remove calls at list size n."""
+    import random
+    import time
+
+    results = {}
+    for mode in (False, True):
+        rng = random.Random(seed)
+        ll = LinkedList.from_iterable(range(n), skip_index=mode)
+        start = time.perf_counter()
+        for _ in range(ops):
+            ll.get(rng.randrange(n))
+            ll.insert(rng.randrange(1, n), -1)
+            ll.remove(rng.randrange(1, n))
+        results[mode] = time.perf_counter() - start
+    return results[False], results[True]
+
+
+# ============================================================
+# USAGE EXAMPLE
+# ============================================================
+if __name__ == "__main__":
+    ll = LinkedList(skip_index=True)
+    for v in range(10, 60, 10):
+        ll.append(v)
+    ll.prepend(5)
+    ll.insert(2, 15)
+    print("Linked List:", ll)
+    print("get(3) →", ll.get(3).value)
+    print(ll.pop_first())
+    print(ll.pop())
+    print(ll.remove(1))
+    print("After pops/remove:", ll)
+    ll.extend([70, 80])
+    ll.splice(LinkedList.from_iterable([90, 100], skip_index=True))
+    print("After extend + splice:", ll, "| get(6) →", ll.get(6).value)
+
+    print("\nRandom get+insert+remove (200 each):")
+    print(f"{'n':>10} {'classic':>10} {'skip index':>12} {'speed-up':>9}")
+    for n in (10_000, 100_000, 1_000_000):
+        classic, skip = benchmark(n)
+        print(f"{n:>10,} {classic:>9.3f}s {skip:>11.3f}s {classic / skip:>8.0f}x")
+
+# ============================================================
+# COMPLEXITIES (summary)
+# ============================================================
+"""
+                      classic     skip index
+- append / prepend:   O(1)        O(1) amortized
+- extend(k values):   O(k)        O(k)
+- splice(other):      O(1)        O(√k) indexed other, else O(k)
+- pop_first:          O(1)        O(1)
+- get / insert:       O(n)        O(√n)
+- remove / pop:       O(n)        O(√n)
+- Extra space:        O(1)        O(√n)
+"""
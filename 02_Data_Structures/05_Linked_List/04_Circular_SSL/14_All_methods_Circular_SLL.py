@@ -393,6 +393,100 @@ class CircularSinglyLinkedList:
         self.length = 0
         return "All nodes deleted!"
 
+    # =======================================================
+    # EXTEND (bulk append)
+    # =======================================================
+    """
+    Steps:
+    1. Link all new nodes into a private chain (dummy -> n1 -> n2 ...)
+    2. If chain is empty -> nothing to do
+    3. Attach chain once:
+         - empty list: head = first
+         - else:       tail.next = first
+    4. tail = last; tail.next = head (close the circle once)
+    5. length += count
+
+    ASCII:
+    Before: 10 --> 20 (tail.next -> head)
+    extend([30, 40])
+    After:  10 --> 20 --> 30 --> 40  (tail.next -> head)
+
+    Time Complexity: O(k) (k = number of new items)
+    Space Complexity: O(k)
+    """
+    def extend(self, iterable):
+        dummy = Node(None)
+        last = dummy
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            last.next = new_node
+            last = new_node
+            count += 1
+        if count == 0:
+            return "Nothing to extend"
+        if self.length == 0:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = last
+        self.tail.next = self.head
+        self.length += count
+        return "Extended Successfully"
+
+    # =======================================================
+    # FROM_ITERABLE (bulk construction)
+    # =======================================================
+    """
+    Steps:
+    1. Create empty list
+    2. extend(iterable)
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+    """
+    @classmethod
+    def from_iterable(cls, iterable):
+        csll = cls()
+        csll.extend(iterable)
+        return csll
+
+    # =======================================================
+    # SPLICE (O(1) concatenation)
+    # =======================================================
+    """
+    Steps:
+    1. If other empty -> nothing to do
+    2. If self empty -> head = other.head
+       Else          -> tail.next = other.head
+    3. tail = other.tail; tail.next = head
+    4. length += other.length; empty `other`
+
+    ASCII:
+    self: 10 --> 20       other: 30 --> 40
+    splice(other)
+    self: 10 --> 20 --> 30 --> 40  (tail.next -> head)
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+    def splice(self, other):
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if other.length == 0:
+            return "Nothing to splice"
+        if self.length == 0:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.tail.next = self.head
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+        return "Spliced Successfully"
+
     # =======================================================
     # STRING REPRESENTATION
     # =======================================================
@@ -451,6 +545,27 @@ if __name__ == "__main__":
     print("Delete all:", csll.delete_all())
     print("After delete_all:", csll)
 
+    # bulk operations
+    csll = CircularSinglyLinkedList.from_iterable([1, 2, 3])
+    csll.extend([4, 5])
+    csll.splice(CircularSinglyLinkedList.from_iterable([6, 7]))
+    print("Bulk built:", csll, "| tail.next:", csll.tail.next)
+
+    # bulk loading throughput
+    import time
+
+    N = 1_000_000
+    start = time.perf_counter()
+    csll = CircularSinglyLinkedList()
+    for i in range(N):
+        csll.append(i)
+    append_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    csll = CircularSinglyLinkedList.from_iterable(range(N))
+    bulk_secs = time.perf_counter() - start
+    print(f"Load {N:,} items: append loop {N / append_secs:,.0f} items/s, "
+          f"from_iterable {N / bulk_secs:,.0f} items/s")
+
 # ============================================================
 # COMPLEXITIES (summary)
 # ============================================================
@@ -466,4 +581,7 @@ if __name__ == "__main__":
 - Pop Last:      O(n) time, O(1) space
 - Remove:        O(n) time, O(1) space
 - Delete All:    O(1) time, O(1) space
+- Extend:        O(k) time, O(k) space (k new items, one pass)
+- From Iterable: O(n) time, O(n) space
+- Splice:        O(1) time, O(1) space
 """
@@ -0,0 +1,249 @@
+"""
+note_josephus_fast.py - Josephus Problem without simulating every step
+
+📌 Question:
+07_Josephus_Problem_using_Circular_SLL.py walks the circle (step - 1) links
+for every elimination → O(n * k). Past ~10^5 people that is far too slow.
+Give faster solvers for:
+    1) the survivor only
+    2) the full elimination order
+
+Positions are 1-based (person 1 .. person n), counting starts at person 1,
+exactly like the CSLL simulation (n=7, k=3 → order 3,6,2,7,5,1 → survivor 4).
+
+---
+
+📖 1) Survivor in O(n) — the recurrence
+---------------------------------------
+Number people 0..m-1. After the first elimination (person k-1 % m) the
+circle has m-1 people and counting restarts at person k % m. So the
+survivor of m people is the survivor of m-1 people shifted by k:
+
+    J(1) = 0
+    J(m) = (J(m-1) + k) % m
+
+    answer = J(n) + 1
+
+Time: O(n), Space: O(1)
+
+---
+
+📖 2) Survivor in O(k log n) — skip a whole lap at once
+------------------------------------------------------
+When m >= k, one lap around the circle removes every k-th person:
+floor(m / k) people in one go. Solve the smaller circle of
+m - floor(m/k) people, then map its answer back:
+
+    res = J(m - m//k) - m % k
+    if res < 0:  res += m               (wrapped past the end)
+    else:        res += res // (k - 1)  (skip over the removed people)
+
+Each lap shrinks m by a factor (1 - 1/k) → about k·ln(n/k) laps,
+then the O(k) recurrence finishes the last m < k people.
+Best when k is small (k = 2 with n = 10^18 takes ~60 laps).
+
+---
+
+📖 3) Full elimination order in O(n log n) — Fenwick tree
+--------------------------------------------------------
+Keep a Fenwick (Binary Indexed) tree with a 1 for every person still
+standing. The next victim is the (r+1)-th survivor where
+
+    r = (r + k - 1) % remaining
+
+and "find the i-th 1" is a binary-lifting walk down the tree: O(log n).
+
+    alive:   1 1 0 1 1 0 1       (people 3 and 6 eliminated)
+    3rd one → person 4
+
+---
+
+🧮 Complexity:
+- josephus_survivor:         O(n) time,          O(1) space
+- josephus_survivor_small_k: O(k log n) time,    O(k log n) space
+- josephus_order:            O(n log n) time,    O(n) space
+"""
+
+
+# ============================================================
+# 1) O(n) recurrence
+# ============================================================
+def josephus_survivor(n, k):
+    """Return the 1-based position of the last person standing. O(n)."""
+    if n <= 0:
+        raise ValueError("n must be a positive integer")
+    if k <= 0:
+        raise ValueError("step must be a positive integer")
+    res = 0
+    for m in range(2, n + 1):
+        res = (res + k) % m
+    return res + 1
+
+
+# ============================================================
+# 2) O(k log n) lap-skipping recurrence (iterative, no recursion limit)
+# ============================================================
+def josephus_survivor_small_k(n, k):
+    """Return the 1-based survivor in O(k log n). Fast for small k, huge n."""
+    if n <= 0:
+        raise ValueError("n must be a positive integer")
+    if k <= 0:
+        raise ValueError("step must be a positive integer")
+    if k == 1:
+        return n                        # everyone in order, last one survives
+
+    # shrink the circle one full lap at a time, remember each size
+    sizes = []
+    m = n
+    while m >= k:
+        sizes.append(m)
+        m -= m // k
+
+    # small circle (m < k): plain recurrence
+    res = 0
+    for i in range(2, m + 1):
+        res = (res + k) % i
+
+    # map the answer back through every lap
+    while sizes:
+        m = sizes.pop()
+        res -= m % k
+        if res < 0:
+            res += m
+        else:
+            res += res // (k - 1)
+    return res + 1
+
+
+# ============================================================
+# 3) O(n log n) elimination order with a Fenwick tree
+# ============================================================
+class FenwickTree:
+    """Binary Indexed Tree over positions 1..n (all counts start at 1)."""
+
+    def __init__(self, n):
+        self.n = n
+        # O(n) build of an all-ones tree: tree[i] covers (i - lowbit(i), i]
+        self.tree = [i & -i for i in range(n + 1)]
+        self.log = n.bit_length()
+
+    def add(self, i, delta):
+        """Add delta at position i. O(log n)"""
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, i):
+        """Sum of positions 1..i. O(log n)"""
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def find_kth(self, kth):
+        """Smallest position whose prefix sum reaches kth (1-based). O(log n)"""
+        pos = 0
+        tree = self.tree
+        bit = 1 << self.log
+        while bit:
+            nxt = pos + bit
+            if nxt <= self.n and tree[nxt] < kth:
+                pos = nxt
+                kth -= tree[nxt]
+            bit >>= 1
+        return pos + 1
+
+
+def josephus_order(n, k):
+    """
+    Yield people (1-based) in the order they are eliminated;
+    the last value yielded is the survivor. O(n log n) total.
+    """
+    if n <= 0:
+        raise ValueError("n must be a positive integer")
+    if k <= 0:
+        raise ValueError("step must be a positive integer")
+    alive = FenwickTree(n)
+    r = 0
+    for remaining in range(n, 0, -1):
+        r = (r + k - 1) % remaining
+        person = alive.find_kth(r + 1)
+        alive.add(person, -1)
+        yield person
+
+
+# ============================================================
+# Solver API
+# ============================================================
+def josephus(n, k, order=False):
+    """
+    order=False → survivor (picks the cheaper of O(n) and O(k log n))
+    order=True  → list with the full elimination order (O(n log n))
+    """
+    if order:
+        return list(josephus_order(n, k))
+    if k < 2 or k * n.bit_length() < n:
+        return josephus_survivor_small_k(n, k)
+    return josephus_survivor(n, k)
+
+
+# ============================================================
+# Cross-check against the CSLL simulation (07_Josephus_...)
+# ============================================================
+def load_csll_module():
+    """Load 07_Josephus_Problem_using_Circular_SLL.py (name starts with a digit)."""
+    import importlib.util
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(here, "07_Josephus_Problem_using_Circular_SLL.py")
+    spec = importlib.util.spec_from_file_location("josephus_csll", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def simulate(mod, n, k):
+    """Run CircularLinkedList.josephus_circle_direct and return the survivor."""
+    # link people 1..n directly (append() walks the whole circle each time)
+    head = tail = mod.Node(1)
+    for person in range(2, n + 1):
+        tail.next = mod.Node(person)
+        tail = tail.next
+    tail.next = head
+    csll = mod.CircularLinkedList()
+    csll.head = head
+    result = csll.josephus_circle_direct(k)
+    return int(result.rsplit(":", 1)[1])
+
+
+if __name__ == "__main__":
+    import time
+
+    print("n=7, k=3 order:", josephus(7, 3, order=True))      # [3, 6, 2, 7, 5, 1, 4]
+    print("n=7, k=3 survivor:", josephus(7, 3))               # 4
+
+    csll_module = load_csll_module()
+    for n in range(1, 60):
+        for k in range(1, 12):
+            expected = simulate(csll_module, n, k)
+            assert josephus_survivor(n, k) == expected, (n, k)
+            assert josephus_survivor_small_k(n, k) == expected, (n, k)
+            assert list(josephus_order(n, k))[-1] == expected, (n, k)
+    print("Cross-check vs CSLL simulation: OK (n < 60, k < 12)")
+
+    n, k = 100_000, 50
+    for name, func in [
+        ("CSLL simulation", lambda: simulate(csll_module, n, k)),
+        ("O(n) recurrence", lambda: josephus_survivor(n, k)),
+        ("O(k log n) laps", lambda: josephus_survivor_small_k(n, k)),
+        ("O(n log n) order", lambda: list(josephus_order(n, k))[-1]),
+    ]:
+        start = time.perf_counter()
+        survivor = func()
+        print(f"  n={n:,} k={k}: {name:<18} survivor {survivor:>6}  {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    big = josephus_survivor_small_k(10**18, 2)
+    print(f"  n=10^18 k=2 survivor {big} in {time.perf_counter() - start:.5f}s")
@@ -4,7 +4,9 @@
 # Methods included:
 #  append, __str__, prepend, traverse, reverse_traverse,
 #  search_element, get_node, set_value,
-#  insert_element, pop_first, pop_last, remove_element, remove_by_value
+#  insert_element, pop_first, pop_last, remove_element, remove_by_value,
+#  extend, from_iterable, splice,
+#  append_node, remove_node, pop_first_node (O(1) node-level, no search)
 #
 # This file intentionally excludes the "direct" (no-helper) versions.
 # Only one helper is provided: get_node (returns a Node).
@@ -29,9 +31,10 @@ class DoublyLinkedList:
         self.head = None
         self.tail = None
         self.length = 0
+        self._cursor = None             # last node returned by get_node
+        self._cursor_index = -1         # ... and its index
         if iterable:
-            for x in iterable:
-                self.append(x)
+            self.extend(iterable)
 
     # ------------------------------
     # Representation
@@ -76,8 +79,113 @@ class DoublyLinkedList:
             self.head.prev = new_node
             self.head = new_node
         self.length += 1
+        if self._cursor is not None:    # every index moved by +1
+            self._cursor_index += 1
         return True
 
+    # ------------------------------
+    # Bulk modifications
+    # ------------------------------
+    def extend(self, iterable):
+        """
+        Append every value from iterable in one pass.
+        Nodes are linked into a private chain first, then attached to the
+        tail once (single empty-list check and length update).
+        Time: O(k), Space: O(k) for k new values
+        """
+        dummy = Node(None)
+        last = dummy
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            last.next = new_node
+            new_node.prev = last
+            last = new_node
+            count += 1
+        if count == 0:
+            return False
+        first = dummy.next
+        if self.head is None:           # empty list
+            first.prev = None
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        dummy.next = None
+        self.tail = last
+        self.length += count
+        return True
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a new list from iterable using extend. Time: O(n)"""
+        return cls(iterable)
+
+    def splice(self, other):
+        """
+        Move all nodes of other to the end of this list; other becomes empty.
+        Time: O(1), Space: O(1)
+        """
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if other.head is None:
+            return False
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self.length += other.length
+        other.head = other.tail = None
+        other.length = 0
+        other._reset_cursor()
+        return True
+
+    # ------------------------------
+    # Node-level operations (caller already holds the Node → no search)
+    # ------------------------------
+    def append_node(self, node):
+        """
+        Link an existing, unlinked Node at the tail (used by 16_LRU_LFU_Cache).
+        Time: O(1), Space: O(1)
+        """
+        node.prev = self.tail
+        node.next = None
+        if self.head is None:           # empty list
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
+        return node
+
+    def remove_node(self, node):
+        """
+        Unlink a Node that belongs to this list and return it.
+        Unlike remove_by_value there is no search: prev / next are enough.
+        Time: O(1), Space: O(1)
+        """
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+        self.length -= 1
+        if self._cursor is not None:    # index of node unknown → drop the cursor
+            self._reset_cursor()
+        return node
+
+    def pop_first_node(self):
+        """Unlink and return the head Node (None if empty). Time: O(1)"""
+        if self.head is None:
+            return None
+        return self.remove_node(self.head)
+
     # ------------------------------
     # Traversal helpers
     # ------------------------------
@@ -115,25 +223,40 @@ class DoublyLinkedList:
     def get_node(self, index):
         """
         Helper: return Node at index, or None if index invalid.
-        Optimized traversal: start from head or tail depending on index.
-        Time: O(min(index, n-index)), Space: O(1)
+        Optimized traversal: start from whichever is closest —
+        head, tail, or the cached cursor (last node returned).
+        Sequential access (get_node(0), get_node(1), ...) walks one link
+        per call, so it is amortized O(1).
+        Time: O(min(index, n-index, |index-cursor|)), Space: O(1)
         """
         if index < 0 or index >= self.length:
             return None
 
-        # traverse from head if closer to head
-        if index < self.length // 2:
-            cur = self.head
-            for _ in range(index):
+        # pick the closest starting point
+        cur, start = self.head, 0
+        best = index
+        if self.length - 1 - index < best:
+            cur, start = self.tail, self.length - 1
+            best = self.length - 1 - index
+        if self._cursor is not None and abs(index - self._cursor_index) < best:
+            cur, start = self._cursor, self._cursor_index
+
+        if start < index:                 # walk forward
+            for _ in range(index - start):
                 cur = cur.next
-            return cur
+        else:                             # walk backward
+            for _ in range(start - index):
+                cur = cur.prev
 
-        # traverse from tail if closer to tail
-        cur = self.tail
-        for _ in range(self.length - 1, index, -1):
-            cur = cur.prev
+        self._cursor = cur
+        self._cursor_index = index
         return cur
 
+    def _reset_cursor(self):
+        """Forget the cached cursor (its node left the list)."""
+        self._cursor = None
+        self._cursor_index = -1
+
     # ------------------------------
     # Set using helper
     # ------------------------------
@@ -182,6 +305,7 @@ class DoublyLinkedList:
             next_node.prev = new_node
 
         self.length += 1
+        # cursor sits on prev_node (index-1) after get_node → still valid
         return True
 
     # ------------------------------
@@ -202,6 +326,10 @@ class DoublyLinkedList:
             self.head.prev = None
             removed.next = None
         self.length -= 1
+        if self._cursor is removed:
+            self._reset_cursor()
+        elif self._cursor is not None:  # every index moved by -1
+            self._cursor_index -= 1
         return removed.value
 
     def pop_last(self):
@@ -219,6 +347,8 @@ class DoublyLinkedList:
             self.tail.next = None
             removed.prev = None
         self.length -= 1
+        if self._cursor is removed:
+            self._reset_cursor()
         return removed.value
 
     # --------------------------------------------------
@@ -243,6 +373,9 @@ class DoublyLinkedList:
         # unlink popped node from its neighbors
         popped.prev.next = popped.next
         popped.next.prev = popped.prev
+        # cursor was left on popped by get_node → move it to the predecessor
+        self._cursor = popped.prev
+        self._cursor_index = index - 1
         # fully disconnect popped node
         popped.prev = None
         popped.next = None
@@ -284,6 +417,7 @@ class DoublyLinkedList:
         self.head = None
         self.tail = None
         self.length = 0
+        self._reset_cursor()
 
 
 # ---------------------------------------------------------------------
@@ -324,3 +458,29 @@ if __name__ == "__main__":
     print("Final list as python list:", dll.to_list())
     dll.clear()
     print("Cleared ->", dll, "Length:", dll.length)
+
+    dll = DoublyLinkedList.from_iterable([1, 2, 3])
+    dll.extend([4, 5])
+    dll.splice(DoublyLinkedList([6, 7]))
+    print("Bulk built:", dll, "| reversed:", list(dll.reverse_traverse()))
+
+    middle = dll.get_node(3)
+    dll.remove_node(middle)                        # O(1): no search
+    dll.append_node(middle)
+    print("Node 4 moved to tail:", dll)
+    print("pop_first_node ->", dll.pop_first_node(), "| now:", dll)
+
+    # bulk loading throughput
+    import time
+
+    N = 1_000_000
+    start = time.perf_counter()
+    dll = DoublyLinkedList()
+    for i in range(N):
+        dll.append(i)
+    append_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    dll = DoublyLinkedList.from_iterable(range(N))
+    bulk_secs = time.perf_counter() - start
+    print(f"Load {N:,} items: append loop {N / append_secs:,.0f} items/s, "
+          f"from_iterable {N / bulk_secs:,.0f} items/s")
@@ -0,0 +1,295 @@
+# note.py
+# ---------------------------------------------------------------------
+# 📘 LRU & LFU Cache using Doubly Linked List + Dictionary
+#
+# Problem with a plain DLL as eviction order:
+#   remove_by_value(key) must SEARCH the list → O(n) per access.
+#
+# Fix: keep a dict  key -> Node  next to the DLL.
+#   - dict lookup finds the node in O(1)
+#   - DLL unlinks / relinks a known node in O(1) (prev + next pointers)
+#
+# The DLL is DoublyLinkedList from 14_All_Methods_Doubly_LL.py, through its
+# node-level methods append_node / remove_node / pop_first_node.
+# CacheNode extends its Node with the cache key (and a use count for LFU).
+#
+# Classes:
+#   LRUCache  - evicts the Least Recently Used key
+#   LFUCache  - evicts the Least Frequently Used key
+#               (ties broken by least recently used, one DLL per frequency)
+# Both: get, put, __contains__, __len__, hits / misses / evictions, memoize
+# ---------------------------------------------------------------------
+
+import functools
+import importlib.util
+import os
+
+
+def load_dll_module():
+    """Load 14_All_Methods_Doubly_LL.py (its name starts with a digit)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "all_methods_doubly_ll", os.path.join(here, "14_All_Methods_Doubly_LL.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+_dll = load_dll_module()
+DoublyLinkedList = _dll.DoublyLinkedList
+
+_MISSING = object()     # sentinel: lets None be a valid cached value
+_KWMARK = object()      # sentinel: separates positional from keyword args in memoize keys
+
+
+class CacheNode(_dll.Node):
+    """DLL node holding one cache entry: value from Node, plus key and freq."""
+    def __init__(self, key, value):
+        super().__init__(value)
+        self.key = key
+        self.freq = 1           # used by LFUCache only
+
+    def __repr__(self):
+        return f"CacheNode({self.key!r}: {self.value!r})"
+
+
+def _entries(dll):
+    """'key:value <-> ...' for a DLL of CacheNodes."""
+    parts = []
+    cur = dll.head
+    while cur:
+        parts.append(f"{cur.key}:{cur.value}")
+        cur = cur.next
+    return " <-> ".join(parts) if parts else "Empty DLL"
+
+
+class CacheBase:
+    """Shared counters + memoization decorator for LRUCache / LFUCache."""
+
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.map = {}           # key -> Node
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.map)
+
+    def __contains__(self, key):
+        """Membership test (does NOT count as an access)."""
+        return key in self.map
+
+    def stats(self):
+        """Return counters as a dict (hit_rate is 0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.map),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def memoize(self, func):
+        """
+        Decorator mode: cache results of func by its arguments.
+
+            cache = LRUCache(1000)
+
+            @cache.memoize
+            def fib(n): ...
+
+        Arguments must be hashable. The key starts with func itself, so
+        several functions (and plain put / get calls) can share one cache
+        without colliding.
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func,) + args
+            if kwargs:
+                key += (_KWMARK,) + tuple(sorted(kwargs.items()))
+            result = self.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                self.put(key, result)
+            return result
+
+        wrapper.cache = self
+        return wrapper
+
+
+# ---------------------------------------------------------------------
+# LRU CACHE
+# ---------------------------------------------------------------------
+class LRUCache(CacheBase):
+    """
+    Order of the DLL = recency:
+        head (least recently used)  <->  ...  <->  tail (most recently used)
+
+    get(k):  dict lookup → move node to tail                 O(1)
+    put(k):  update + move to tail, or append new node;
+             if over capacity → pop head (evict)             O(1)
+    """
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self.order = DoublyLinkedList()
+
+    def get(self, key, default=None):
+        node = self.map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.order.remove_node(node)     # mark as most recently used
+        self.order.append_node(node)
+        return node.value
+
+    def put(self, key, value):
+        node = self.map.get(key)
+        if node is not None:
+            node.value = value
+            self.order.remove_node(node)
+            self.order.append_node(node)
+            return
+        if len(self.map) >= self.capacity:
+            oldest = self.order.pop_first_node()
+            del self.map[oldest.key]
+            self.evictions += 1
+        node = CacheNode(key, value)
+        self.map[key] = node
+        self.order.append_node(node)
+
+    def __str__(self):
+        return _entries(self.order)
+
+
+# ---------------------------------------------------------------------
+# LFU CACHE
+# ---------------------------------------------------------------------
+class LFUCache(CacheBase):
+    """
+    Frequency buckets: freq -> DLL of nodes used exactly `freq` times
+    (each DLL is ordered by recency, oldest at head).
+
+        min_freq = 1
+        1: [d] <-> [e]          ← evict head of the min_freq bucket (d)
+        2: [b]
+        5: [a] <-> [c]
+
+    get(k):  move node from bucket f to bucket f+1;
+             if bucket f was min_freq and is now empty → min_freq += 1   O(1)
+    put(k):  new key → evict head of bucket[min_freq] if full,
+             insert with freq 1, min_freq = 1                            O(1)
+    """
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self.buckets = {}       # freq -> DoublyLinkedList
+        self.min_freq = 0
+
+    def _touch(self, node):
+        """Move node to the next frequency bucket."""
+        bucket = self.buckets[node.freq]
+        bucket.remove_node(node)
+        if bucket.length == 0:
+            del self.buckets[node.freq]
+            if self.min_freq == node.freq:
+                self.min_freq += 1
+        node.freq += 1
+        self.buckets.setdefault(node.freq, DoublyLinkedList()).append_node(node)
+
+    def get(self, key, default=None):
+        node = self.map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value
+
+    def put(self, key, value):
+        node = self.map.get(key)
+        if node is not None:
+            node.value = value
+            self._touch(node)
+            return
+        if len(self.map) >= self.capacity:
+            bucket = self.buckets[self.min_freq]
+            victim = bucket.pop_first_node()
+            if bucket.length == 0:
+                del self.buckets[self.min_freq]
+            del self.map[victim.key]
+            self.evictions += 1
+        node = CacheNode(key, value)
+        self.map[key] = node
+        self.buckets.setdefault(1, DoublyLinkedList()).append_node(node)
+        self.min_freq = 1
+
+    def __str__(self):
+        return "\n".join(f"freq {f}: {_entries(self.buckets[f])}" for f in sorted(self.buckets))
+
+
+# ---------------------------------------------------------------------
+# Quick self-check examples (run this file directly)
+# ---------------------------------------------------------------------
+if __name__ == "__main__":
+    lru = LRUCache(3)
+    for k in "abc":
+        lru.put(k, k.upper())
+    lru.get("a")                    # a becomes most recent
+    lru.put("d", "D")               # evicts b (least recently used)
+    print("LRU order:", lru)        # c:C <-> a:A <-> d:D
+    print("LRU stats:", lru.stats())
+
+    lfu = LFUCache(3)
+    for k in "abc":
+        lfu.put(k, k.upper())
+    lfu.get("a")
+    lfu.get("a")
+    lfu.get("b")
+    lfu.put("d", "D")               # evicts c (used least often)
+    print("\nLFU buckets:\n" + str(lfu))
+    print("LFU stats:", lfu.stats())
+
+    cache = LRUCache(256)
+
+    @cache.memoize
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print("\nfib(200) =", fib(200))
+    print("memoize stats:", fib.cache.stats())
+
+    # -----------------------------------------------------------------
+    # Throughput at 100k entries (each op is O(1), independent of size)
+    # -----------------------------------------------------------------
+    import random
+    import time
+
+    N = 100_000
+    OPS = 500_000
+    rng = random.Random(7)
+    keys = [rng.randrange(2 * N) for _ in range(OPS)]
+    print(f"\n{OPS:,} mixed get/put over {2 * N:,} keys, capacity {N:,}:")
+    for cls in (LRUCache, LFUCache):
+        c = cls(N)
+        start = time.perf_counter()
+        for k in keys:
+            if c.get(k) is None:
+                c.put(k, k)
+        secs = time.perf_counter() - start
+        s = c.stats()
+        print(f"  {cls.__name__:<9} {OPS / secs:>12,.0f} ops/s   hit_rate {s['hit_rate']:.2%}"
+              f"   evictions {s['evictions']:,}")
+
+# ---------------------------------------------------------------------
+# 📊 Complexity Summary
+# ---------------------------------------------------------------------
+# LRUCache.get / put / eviction:   O(1) time
+# LFUCache.get / put / eviction:   O(1) time
+# Space:                           O(capacity) nodes + dict entries
+# ---------------------------------------------------------------------
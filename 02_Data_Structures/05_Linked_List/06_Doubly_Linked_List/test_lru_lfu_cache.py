@@ -0,0 +1,132 @@
+import os
+import importlib.util
+import unittest
+
+
+def load_cache_module():
+    here = os.path.dirname(__file__)
+    path = os.path.join(here, "16_LRU_LFU_Cache_Doubly_LL.py")
+    spec = importlib.util.spec_from_file_location("lru_lfu_cache_mod", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+mod = load_cache_module()
+LRUCache, LFUCache = mod.LRUCache, mod.LFUCache
+
+
+def keys_in_order(dll):
+    keys = []
+    cur = dll.head
+    while cur:
+        keys.append(cur.key)
+        cur = cur.next
+    return keys
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(3)
+        for k in "abc":
+            cache.put(k, k.upper())
+        self.assertEqual(cache.get("a"), "A")      # a becomes most recent
+        cache.put("d", "D")                         # evicts b
+        self.assertNotIn("b", cache)
+        self.assertEqual(keys_in_order(cache.order), ["c", "a", "d"])
+        self.assertEqual(cache.order.length, len(cache))
+
+    def test_put_existing_key_updates_and_refreshes(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("a", 10)                          # a is now most recent
+        cache.put("c", 3)                           # evicts b
+        self.assertEqual(cache.get("a"), 10)
+        self.assertIsNone(cache.get("b"))
+
+    def test_counters_and_none_values(self):
+        cache = LRUCache(1)
+        cache.put("x", None)
+        self.assertIsNone(cache.get("x", "missing"))   # None is a valid value
+        self.assertEqual(cache.get("y", "missing"), "missing")
+        cache.put("y", 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+
+class TestLFUCache(unittest.TestCase):
+    def test_evicts_least_frequently_used(self):
+        cache = LFUCache(3)
+        for k in "abc":
+            cache.put(k, k.upper())
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.put("d", "D")                         # c was used least often
+        self.assertNotIn("c", cache)
+        self.assertEqual(cache.min_freq, 1)
+        self.assertEqual({f: keys_in_order(b) for f, b in cache.buckets.items()},
+                         {1: ["d"], 2: ["b"], 3: ["a"]})
+
+    def test_ties_broken_by_least_recently_used(self):
+        cache = LFUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)                           # both used once, a is older
+        cache.put("c", 3)
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+
+
+class TestMemoize(unittest.TestCase):
+    def test_caches_results(self):
+        calls = []
+        cache = LRUCache(10)
+
+        @cache.memoize
+        def square(x):
+            """Square x."""
+            calls.append(x)
+            return x * x
+
+        self.assertEqual([square(3), square(3), square(4)], [9, 9, 16])
+        self.assertEqual(calls, [3, 4])
+        self.assertEqual(square.__name__, "square")
+        self.assertEqual(square.__doc__, "Square x.")
+        self.assertIs(square.cache, cache)
+
+    def test_functions_sharing_a_cache_do_not_collide(self):
+        cache = LFUCache(10)
+
+        @cache.memoize
+        def f(x):
+            return x + 1
+
+        @cache.memoize
+        def g(x):
+            return x * 100
+
+        cache.put((1,), "plain")
+        self.assertEqual(f(1), 2)
+        self.assertEqual(g(1), 100)
+        self.assertEqual(cache.get((1,)), "plain")
+
+    def test_keyword_arguments_are_separated(self):
+        cache = LRUCache(10)
+
+        @cache.memoize
+        def echo(*args, **kwargs):
+            return args, kwargs
+
+        self.assertEqual(echo(1, b=2), ((1,), {"b": 2}))
+        self.assertEqual(echo((1,), (("b", 2),)), (((1,), (("b", 2),)), {}))
+        self.assertEqual(echo(b=2, c=3), echo(c=3, b=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
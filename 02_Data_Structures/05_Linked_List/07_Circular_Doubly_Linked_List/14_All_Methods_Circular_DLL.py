@@ -3,7 +3,8 @@
 # 📘 Circular Doubly Linked List (CDLL) - Notes File
 # ✅ Complete implementation: append | prepend | traverse |
 #    reverse_traverse | __str__ | get | set_value | insert |
-#    Pop_first | Pop_last | remove | delete_all
+#    Pop_first | Pop_last | remove | delete_all |
+#    extend | from_iterable | splice
 # ------------------------------------------------------
 
 # 🔷 Node Structure
@@ -23,6 +24,8 @@ class CircularDoublyLinkedList:
         self.head = None    # First node
         self.tail = None    # Last node
         self.length = 0     # Total number of nodes
+        self._cursor = None         # Last node returned by get()
+        self._cursor_index = -1     # ... and its index
 
     # ---------------------------------------------------------------
     # 1️⃣ append(value) → Insert node at the end
@@ -96,6 +99,8 @@ class CircularDoublyLinkedList:
             self.tail.next = new_node
             self.head = new_node
         self.length += 1
+        if self._cursor is not None:    # every index moved by +1
+            self._cursor_index += 1
 
     # ---------------------------------------------------------------
     # 3️⃣ traverse() → Print all node values (forward)
@@ -167,23 +172,38 @@ class CircularDoublyLinkedList:
         Return the Node object at 0-based `index`, or None if invalid.
 
         Optimization:
-        - If index < length//2: walk from head forward.
-        - Else: walk from tail backward.
+        - Start from the closest of: head, tail, or the cached cursor
+          (the node returned by the previous get()).
+        - Walk forward (next) or backward (prev) from there.
+        - Sequential access get(0), get(1), ... walks one link per call
+          → amortized O(1).
 
-        Time: O(n) worst-case, O(n/2) average; Space: O(1)
+        Time: O(min(index, n-index, |index-cursor|)); Space: O(1)
         """
         if index < 0 or index >= self.length:
             return None
-        if index < self.length // 2:
-            current = self.head
-            for _ in range(index):
+        current, start = self.head, 0
+        best = index
+        if self.length - 1 - index < best:
+            current, start = self.tail, self.length - 1
+            best = self.length - 1 - index
+        if self._cursor is not None and abs(index - self._cursor_index) < best:
+            current, start = self._cursor, self._cursor_index
+        if start < index:
+            for _ in range(index - start):
                 current = current.next
         else:
-            current = self.tail
-            for _ in range(self.length - 1, index, -1):
+            for _ in range(start - index):
                 current = current.prev
+        self._cursor = current
+        self._cursor_index = index
         return current
 
+    def _reset_cursor(self):
+        """Forget the cached cursor (its node left the list)."""
+        self._cursor = None
+        self._cursor_index = -1
+
     # ---------------------------------------------------------------
     # 7️⃣ set_value(index, value) → update node's value using get()
     # ---------------------------------------------------------------
@@ -224,7 +244,7 @@ class CircularDoublyLinkedList:
             return
 
         new_node = Node(value)
-        prev_node = self.get(index - 1)   # not None here
+        prev_node = self.get(index - 1)   # not None here (cursor = index-1, still valid)
         new_node.next = prev_node.next
         new_node.prev = prev_node
         prev_node.next.prev = new_node
@@ -252,6 +272,10 @@ class CircularDoublyLinkedList:
             self.head.prev = self.tail
             self.tail.next = self.head
         self.length -= 1
+        if self._cursor is popped:
+            self._reset_cursor()
+        elif self._cursor is not None:  # every index moved by -1
+            self._cursor_index -= 1
         return popped
 
     # ---------------------------------------------------------------
@@ -275,6 +299,8 @@ class CircularDoublyLinkedList:
             self.tail.next = self.head
             self.head.prev = self.tail
         self.length -= 1
+        if self._cursor is popped:
+            self._reset_cursor()
         return popped
 
     # ---------------------------------------------------------------
@@ -305,6 +331,8 @@ class CircularDoublyLinkedList:
         node = self.get(index)
         node.prev.next = node.next
         node.next.prev = node.prev
+        self._cursor = node.prev        # get() left cursor on node → move to predecessor
+        self._cursor_index = index - 1
         node.next = None
         node.prev = None
         self.length -= 1
@@ -330,6 +358,101 @@ class CircularDoublyLinkedList:
         self.head = None
         self.tail = None
         self.length = 0
+        self._reset_cursor()
+        return None
+
+    # ---------------------------------------------------------------
+    # 1️⃣3️⃣ extend(iterable) → Bulk append in one pass
+    # ---------------------------------------------------------------
+    def extend(self, iterable):
+        """
+        Purpose:
+        Append every value from `iterable` at the tail in a single pass.
+
+        Steps:
+        1. Link new nodes into a private chain (dummy <-> n1 <-> n2 ...).
+        2. If chain empty -> nothing to do.
+        3. Attach chain once:
+             - empty list: head = first
+             - else: tail.next = first; first.prev = tail
+        4. Close the circle once: tail = last; tail.next = head; head.prev = tail
+        5. length += count
+
+        Time: O(k) for k new values, Space: O(k)
+        """
+        dummy = Node(None)
+        last = dummy
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            last.next = new_node
+            new_node.prev = last
+            last = new_node
+            count += 1
+        if count == 0:
+            return None
+        first = dummy.next
+        dummy.next = None
+        if self.length == 0:
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        self.tail = last
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        self.length += count
+        return None
+
+    # ---------------------------------------------------------------
+    # 1️⃣4️⃣ from_iterable(iterable) → Build a new CDLL in one pass
+    # ---------------------------------------------------------------
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Purpose:
+        Create a new CDLL filled from `iterable` using extend().
+
+        Time: O(n), Space: O(n)
+        """
+        cdll = cls()
+        cdll.extend(iterable)
+        return cdll
+
+    # ---------------------------------------------------------------
+    # 1️⃣5️⃣ splice(other) → O(1) concatenation of another CDLL
+    # ---------------------------------------------------------------
+    def splice(self, other):
+        """
+        Purpose:
+        Move all nodes of `other` to the end of this list; `other` becomes empty.
+
+        Steps:
+        1. If other empty -> nothing to do.
+        2. If self empty -> head = other.head
+           Else -> tail.next = other.head; other.head.prev = tail
+        3. tail = other.tail; re-close the circle (tail.next = head; head.prev = tail)
+        4. length += other.length; reset other
+
+        Time: O(1), Space: O(1)
+        """
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if other.length == 0:
+            return None
+        if self.length == 0:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+        other._reset_cursor()
         return None
 
 
@@ -403,13 +526,38 @@ if __name__ == "__main__":
     dll.delete_all()
     print("\nAfter delete_all:", dll)       # Empty CDLL
 
+    # bulk operations
+    dll = CircularDoublyLinkedList.from_iterable([1, 2, 3])
+    dll.extend([4, 5])
+    dll.splice(CircularDoublyLinkedList.from_iterable([6, 7]))
+    print("\nBulk built:", dll)             # 1 ◀——▶ 2 ◀——▶ ... ◀——▶ 7
+
+    # bulk loading throughput
+    import time
+
+    N = 1_000_000
+    start = time.perf_counter()
+    dll = CircularDoublyLinkedList()
+    for i in range(N):
+        dll.append(i)
+    append_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    dll = CircularDoublyLinkedList.from_iterable(range(N))
+    bulk_secs = time.perf_counter() - start
+    print(f"Load {N:,} items: append loop {N / append_secs:,.0f} items/s, "
+          f"from_iterable {N / bulk_secs:,.0f} items/s")
+
 # ---------------------------------------------------------------
 # 📊 Complexity Summary
 # ---------------------------------------------------------------
-# append/prepend/Pop_first/Pop_last/delete_all:
+# append/prepend/Pop_first/Pop_last/delete_all/splice:
 # - Time: O(1), Space: O(1)
 #
+# extend / from_iterable:
+# - Time: O(k) one pass for k items, Space: O(k)
+#
 # traverse / reverse_traverse / get / insert / remove / set_value:
 # - Time: O(n) worst-case; get/insert/remove optimized average O(n/2) when using get()
+# - get() near the previous get() (cursor cache): O(distance), sequential scans amortized O(1)
 # - Space: O(1)
 # ---------------------------------------------------------------
@@ -0,0 +1,414 @@
+# note.py
+# ---------------------------------------------------------------------
+# 📘 Unrolled Linked List (ULL) — Notes + Implementation
+#
+# Same method surface as DoublyLinkedList (06_Doubly_Linked_List/14_...):
+#  append, prepend, traverse, reverse_traverse, search_element,
+#  get, set_value, insert_element, pop_first, pop_last,
+#  remove_element, to_list, clear
+# ---------------------------------------------------------------------
+"""
+What is an unrolled linked list?
+--------------------------------
+A doubly linked list of CHUNKS. Each chunk holds up to `capacity`
+values in a Python list (or an array.array for numbers):
+
+    head                                              tail
+     ↓                                                 ↓
+   [10 20 30 40] <-> [50 60 -- --] <-> [70 80 90 --]
+     chunk 1            chunk 2           chunk 3
+
+Why?
+- One node per element = one Python object + two pointers per value.
+  One node per CHUNK = the pointer overhead is shared by `capacity` values.
+- Sequential scans iterate a contiguous list inside each chunk
+  (fast C-level iteration, fewer pointer hops → cache friendly).
+
+Keeping chunks healthy:
+- SPLIT: inserting into a full chunk moves its upper half to a new chunk.
+- MERGE: when a chunk drops below half full it borrows from / merges
+  with its next chunk, so every chunk (except possibly the last) stays
+  at least half full → memory use is never worse than 2× the data.
+
+Positional operations walk CHUNKS, not elements: O(n / capacity).
+"""
+
+from array import array
+
+
+class Chunk:
+    """Unrolled list node: a small list of values + prev/next links."""
+    def __init__(self, items):
+        self.items = items
+        self.prev = None
+        self.next = None
+
+    def __repr__(self):
+        return f"Chunk({list(self.items)!r})"
+
+
+class UnrolledLinkedList:
+    """Doubly linked list of fixed-capacity chunks."""
+
+    def __init__(self, iterable=None, capacity=64, typecode=None):
+        """
+        capacity: max values per chunk (>= 2)
+        typecode: None → chunks are Python lists (any value)
+                  'q', 'd', ... → chunks are array.array (numbers only)
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.typecode = typecode
+        self.head = None
+        self.tail = None
+        self.length = 0
+        if iterable:
+            for x in iterable:
+                self.append(x)
+
+    # ------------------------------
+    # Representation
+    # ------------------------------
+    def __str__(self):
+        """Return values as: '10 <-> 20 <-> 30' or 'Empty ULL'."""
+        vals = [str(v) for v in self.traverse()]
+        return " <-> ".join(vals) if vals else "Empty ULL"
+
+    def __len__(self):
+        return self.length
+
+    # ------------------------------
+    # Chunk helpers
+    # ------------------------------
+    def _new_items(self, values=()):
+        return array(self.typecode, values) if self.typecode else list(values)
+
+    def _link_after(self, chunk, new_chunk):
+        """Insert new_chunk right after chunk (chunk=None → at head)."""
+        if chunk is None:
+            new_chunk.next = self.head
+            if self.head:
+                self.head.prev = new_chunk
+            self.head = new_chunk
+            if self.tail is None:
+                self.tail = new_chunk
+            return
+        new_chunk.prev = chunk
+        new_chunk.next = chunk.next
+        if chunk.next:
+            chunk.next.prev = new_chunk
+        else:
+            self.tail = new_chunk
+        chunk.next = new_chunk
+
+    def _unlink(self, chunk):
+        if chunk.prev:
+            chunk.prev.next = chunk.next
+        else:
+            self.head = chunk.next
+        if chunk.next:
+            chunk.next.prev = chunk.prev
+        else:
+            self.tail = chunk.prev
+        chunk.prev = chunk.next = None
+
+    def _split(self, chunk):
+        """
+        Move the upper half of a full chunk into a new chunk after it.
+            [1 2 3 4 5]  →  [1 2] <-> [3 4 5]
+        Time: O(capacity)
+        """
+        half = len(chunk.items) // 2
+        new_chunk = Chunk(chunk.items[half:])
+        del chunk.items[half:]
+        self._link_after(chunk, new_chunk)
+
+    def _rebalance(self, chunk):
+        """
+        After a removal: keep chunk at least half full.
+        - empty → unlink it
+        - merge with next if both fit in one chunk
+        - otherwise borrow values from next until chunk is half full
+        Time: O(capacity)
+        """
+        if not chunk.items:
+            self._unlink(chunk)
+            return
+        nxt = chunk.next
+        if nxt is None or len(chunk.items) >= self.capacity // 2:
+            return
+        if len(chunk.items) + len(nxt.items) <= self.capacity:
+            chunk.items.extend(nxt.items)
+            self._unlink(nxt)
+        else:
+            need = self.capacity // 2 - len(chunk.items)
+            chunk.items.extend(nxt.items[:need])
+            del nxt.items[:need]
+
+    def _locate(self, index):
+        """
+        Return (chunk, offset) for 0-based index.
+        Walks chunks from the closer end.
+        Time: O(n / capacity)
+        """
+        if index < self.length // 2:
+            chunk = self.head
+            while index >= len(chunk.items):
+                index -= len(chunk.items)
+                chunk = chunk.next
+            return chunk, index
+        index = self.length - 1 - index      # distance from the end
+        chunk = self.tail
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            chunk = chunk.prev
+        return chunk, len(chunk.items) - 1 - index
+
+    # ------------------------------
+    # Basic modifications
+    # ------------------------------
+    def append(self, value):
+        """
+        Append value at the end (new chunk only when tail chunk is full).
+        Time: O(1) amortized, Space: O(1)
+        """
+        if self.tail is None or len(self.tail.items) >= self.capacity:
+            self._link_after(self.tail, Chunk(self._new_items()))
+        self.tail.items.append(value)
+        self.length += 1
+        return True
+
+    def prepend(self, value):
+        """
+        Insert value at the beginning (new chunk only when head chunk is full).
+        Time: O(capacity) worst-case shift inside the head chunk, Space: O(1)
+        """
+        if self.head is None or len(self.head.items) >= self.capacity:
+            self._link_after(None, Chunk(self._new_items()))
+        self.head.items.insert(0, value)
+        self.length += 1
+        return True
+
+    # ------------------------------
+    # Traversal helpers
+    # ------------------------------
+    def traverse(self):
+        """Yield values from head -> tail (use: for v in ull.traverse())."""
+        chunk = self.head
+        while chunk:
+            yield from chunk.items
+            chunk = chunk.next
+
+    def reverse_traverse(self):
+        """Yield values from tail -> head."""
+        chunk = self.tail
+        while chunk:
+            yield from reversed(chunk.items)
+            chunk = chunk.prev
+
+    def iter_chunks(self):
+        """Yield each chunk's items (read-only) for bulk work: sum(map(sum, ull.iter_chunks()))."""
+        chunk = self.head
+        while chunk:
+            yield chunk.items
+            chunk = chunk.next
+
+    # ------------------------------
+    # Search / access
+    # ------------------------------
+    def search_element(self, target):
+        """
+        Return index of the first occurrence of target, or -1 if not found.
+        Uses list.index inside each chunk (C speed).
+        Time: O(n), Space: O(1)
+        """
+        base = 0
+        chunk = self.head
+        while chunk:
+            if target in chunk.items:
+                return base + chunk.items.index(target)
+            base += len(chunk.items)
+            chunk = chunk.next
+        return -1
+
+    def get(self, index):
+        """Return value at index, or None if index invalid. Time: O(n / capacity)"""
+        if index < 0 or index >= self.length:
+            return None
+        chunk, offset = self._locate(index)
+        return chunk.items[offset]
+
+    def set_value(self, index, value):
+        """Update value at index. Returns True if successful, False if index invalid."""
+        if index < 0 or index >= self.length:
+            return False
+        chunk, offset = self._locate(index)
+        chunk.items[offset] = value
+        return True
+
+    # ------------------------------
+    # Insert / remove
+    # ------------------------------
+    def insert_element(self, index, value):
+        """
+        Insert value at position index:
+          - index == 0 -> prepend, index == length -> append
+          - else locate (chunk, offset), insert, split chunk if over capacity
+        Raises IndexError for index < 0 or index > length.
+        Time: O(n / capacity + capacity), Space: O(1)
+        """
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+        chunk, offset = self._locate(index)
+        chunk.items.insert(offset, value)
+        if len(chunk.items) > self.capacity:
+            self._split(chunk)
+        self.length += 1
+        return True
+
+    def pop_first(self):
+        """Remove and return head value. Return None if empty."""
+        if self.head is None:
+            return None
+        return self.remove_element(0)
+
+    def pop_last(self):
+        """
+        Remove and return tail value. Return None if empty.
+        Time: O(1), Space: O(1)
+        """
+        if self.tail is None:
+            return None
+        value = self.tail.items.pop()
+        if not self.tail.items:
+            self._unlink(self.tail)
+        self.length -= 1
+        return value
+
+    def remove_element(self, index):
+        """
+        Remove value at index and return it (None for invalid index).
+        Merges / borrows from the next chunk when the chunk gets under half full.
+        Time: O(n / capacity + capacity), Space: O(1)
+        """
+        if index < 0 or index >= self.length:
+            return None
+        chunk, offset = self._locate(index)
+        value = chunk.items.pop(offset)
+        self.length -= 1
+        self._rebalance(chunk)
+        return value
+
+    def remove_by_value(self, value):
+        """Remove first occurrence of value. Returns True if removed, False if not found."""
+        idx = self.search_element(value)
+        if idx == -1:
+            return False
+        self.remove_element(idx)
+        return True
+
+    # ------------------------------
+    # Utility helpers
+    # ------------------------------
+    def to_list(self):
+        """Return Python list of values head -> tail."""
+        return list(self.traverse())
+
+    def clear(self):
+        """Drop all chunks and reset length."""
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+
+# ---------------------------------------------------------------------
+# Benchmark: one node per element (DoublyLinkedList) vs unrolled chunks
+# ---------------------------------------------------------------------
+def load_doubly_linked_list():
+    """Load DoublyLinkedList from ../06_Doubly_Linked_List/14_All_Methods_Doubly_LL.py."""
+    import importlib.util
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(here, "..", "06_Doubly_Linked_List", "14_All_Methods_Doubly_LL.py")
+    spec = importlib.util.spec_from_file_location("all_methods_dll", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod.DoublyLinkedList
+
+
+def best_of(func, repeat=5):
+    import time
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(name, factory, n):
+    import tracemalloc
+
+    tracemalloc.start()
+    lst = factory()
+    for i in range(n):
+        lst.append(i)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    scan = best_of(lambda: sum(lst.traverse()))
+    line = f"  {name:<31} {used / n:6.1f} bytes/element   traverse {scan * 1000:6.1f} ms"
+    if hasattr(lst, "iter_chunks"):
+        bulk = best_of(lambda: sum(map(sum, lst.iter_chunks())))
+        line += f"   chunk-wise {bulk * 1000:5.1f} ms"
+    print(line)
+
+
+# ---------------------------------------------------------------------
+# Quick self-check examples (run this file directly)
+# ---------------------------------------------------------------------
+if __name__ == "__main__":
+    ull = UnrolledLinkedList(capacity=4)
+    for v in range(10, 100, 10):
+        ull.append(v)
+    print("Initial:", ull)                        # 10 <-> 20 <-> ... <-> 90
+    chunk, chunks = ull.head, []
+    while chunk:
+        chunks.append(list(chunk.items))
+        chunk = chunk.next
+    print("Chunks:", chunks)                      # [[10,20,30,40],[50,60,70,80],[90]]
+
+    ull.insert_element(2, 25)                     # splits the first chunk
+    print("After insert_element(2,25):", ull)
+    print("Search 70 ->", ull.search_element(70))
+    print("get(3) ->", ull.get(3))
+    print("remove_element(1) ->", ull.remove_element(1))
+    print("pop_first ->", ull.pop_first(), "| pop_last ->", ull.pop_last())
+    print("After removals:", ull)
+    print("Reverse:", list(ull.reverse_traverse()))
+
+    N = 1_000_000
+    DoublyLinkedList = load_doubly_linked_list()
+    print(f"\nMemory + full traversal at {N:,} ints:")
+    benchmark("DoublyLinkedList (1 per node)", DoublyLinkedList, N)
+    benchmark("UnrolledLinkedList (list x64)", UnrolledLinkedList, N)
+    benchmark("UnrolledLinkedList (array 'q')", lambda: UnrolledLinkedList(typecode="q"), N)
+
+# ---------------------------------------------------------------------
+# 📊 Complexity Summary (n values, B = capacity)
+# ---------------------------------------------------------------------
+# append / pop_last:                     O(1) amortized
+# prepend:                               O(B)
+# get / set_value:                       O(n / B)
+# insert_element / remove_element:       O(n / B + B)
+# traverse / search_element:             O(n), far fewer pointer hops
+# Space:                                 O(n) with ~n/B chunk objects,
+#                                        chunks kept >= half full
+# ---------------------------------------------------------------------
@@ -0,0 +1,321 @@
+# note.py
+# ------------------------------------------------------
+# 📘 STACK (typed array.array implementation)
+# ✅ Topic: contiguous numeric storage, geometric grow/shrink,
+#           push_many / pop_many with zero-copy memoryview export
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+StackList (08_All_methods_Stack_using_List.py) keeps a Python list of
+POINTERS to boxed objects:
+
+    list:  [ptr, ptr, ptr]  →  int(10)  int(20)  int(30)   (~36 bytes each)
+
+For numeric work (operand stack of an evaluator, DFS index stack, ...)
+every value can live directly in ONE contiguous buffer:
+
+    array('q'):  | 10 | 20 | 30 | __ | __ | __ | __ | __ |     (8 bytes each)
+                                 ↑ top = 3         capacity = 8
+
+TypedStack(typecode):
+    - self.items  → array.array of `capacity` slots (unused slots stay allocated)
+    - self.top    → number of live elements (slot top-1 is the stack top)
+    - geometric growth: full → capacity × 2
+    - geometric shrink: top ≤ capacity / 4 → capacity / 2
+      (the gap between ×2 and /4 stops push/pop at the boundary from
+       resizing every time → every operation stays O(1) amortized)
+    - push_many(values) → one slice copy
+    - pop_many(k)       → memoryview over the popped slots, NOTHING copied
+"""
+
+# ---------------------------------------------------------------
+# 🧱 VISUAL: pop_many(3) returns a view, not a copy
+# ---------------------------------------------------------------
+"""
+    before:  | 10 | 20 | 30 | 40 | 50 | __ | __ | __ |   top = 5
+    pop_many(3):
+             | 10 | 20 | 30 | 40 | 50 | __ | __ | __ |   top = 2
+                        └─── view ────┘
+             view.tolist() → [30, 40, 50]   (bottom → top order)
+
+The popped slots are simply "above the top" now. The view stays valid until
+the next push writes into those slots — copy it (view.tolist(), bytes(view))
+if it must outlive later pushes.
+
+Resizing never happens in place: grow/shrink builds a NEW array and rebinds
+self.items. An exported view keeps the old buffer alive, so no BufferError
+("cannot resize an array that is exporting buffers") can occur.
+"""
+
+from array import array
+
+
+# ---------------------------------------------------------------
+# 🧩 CLASS IMPLEMENTATION
+# ---------------------------------------------------------------
+class TypedStack:
+    """
+    Stack of C numbers stored contiguously in an array.array.
+
+    Attributes:
+        items    → array.array buffer (len(items) == capacity)
+        top      → number of elements on the stack
+        typecode → 'q' (int64), 'd' (float64), 'i', 'f', ...
+    """
+    MIN_CAPACITY = 16
+
+    def __init__(self, typecode="q", capacity=MIN_CAPACITY):
+        """
+        ⏱️ Time Complexity: O(capacity)
+        💾 Space Complexity: O(capacity)
+        """
+        self.typecode = typecode
+        self.items = self._new_buffer(max(capacity, self.MIN_CAPACITY))
+        self.top = 0
+
+    def _new_buffer(self, capacity):
+        return array(self.typecode, bytes(array(self.typecode).itemsize * capacity))
+
+    # -----------------------------------------------------------
+    # Capacity management
+    # -----------------------------------------------------------
+    def capacity(self):
+        return len(self.items)
+
+    def _resize(self, new_capacity):
+        """Copy live elements into a fresh buffer. ⏱️ O(top)"""
+        new_items = self._new_buffer(new_capacity)
+        new_items[:self.top] = self.items[:self.top]
+        self.items = new_items
+
+    def _grow_to(self, needed):
+        capacity = len(self.items)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+
+    def _maybe_shrink(self):
+        capacity = len(self.items)
+        if capacity > self.MIN_CAPACITY and self.top <= capacity // 4:
+            while capacity > self.MIN_CAPACITY and self.top <= capacity // 4:
+                capacity //= 2
+            self._resize(capacity)
+
+    # -----------------------------------------------------------
+    # 1️⃣ PUSH / PUSH_MANY
+    # -----------------------------------------------------------
+    def push(self, element):
+        """
+        Write element into slot `top`, doubling the buffer when full.
+        ⏱️ O(1) amortized | 💾 O(1)
+        """
+        top = self.top
+        if top == len(self.items):
+            self._resize(2 * top)
+        self.items[top] = element
+        self.top = top + 1
+
+    def push_many(self, values):
+        """
+        Push every value (values[-1] ends on top) with ONE slice copy.
+        values: array of the same typecode (fastest) or any iterable of numbers.
+        ⏱️ O(k) amortized | 💾 O(1) extra for an array argument
+        """
+        if not isinstance(values, array) or values.typecode != self.typecode:
+            values = array(self.typecode, values)
+        k = len(values)
+        self._grow_to(self.top + k)
+        self.items[self.top:self.top + k] = values
+        self.top += k
+
+    # -----------------------------------------------------------
+    # 2️⃣ POP / POP_MANY
+    # -----------------------------------------------------------
+    def pop(self):
+        """
+        Remove and return the top element.
+        Raises IndexError on an empty stack (a typed stack cannot hold the
+        "Stack is Empty" string that StackList returns).
+        ⏱️ O(1) amortized | 💾 O(1)
+        """
+        if self.top == 0:
+            raise IndexError("pop from empty stack")
+        self.top -= 1
+        value = self.items[self.top]
+        if self.top <= len(self.items) // 4:
+            self._maybe_shrink()
+        return value
+
+    def pop_many(self, k):
+        """
+        Remove the top k elements and return them as a memoryview
+        (bottom → top order) — zero-copy, see the notes above.
+        ⏱️ O(1) (+ O(top) when a shrink is due) | 💾 O(1)
+        """
+        if k < 0 or k > self.top:
+            raise IndexError(f"cannot pop {k} elements from a stack of {self.top}")
+        old_items = self.items
+        start = self.top - k
+        self.top = start
+        view = memoryview(old_items)[start:start + k]
+        self._maybe_shrink()        # rebinds self.items; view keeps old_items alive
+        return view
+
+    # -----------------------------------------------------------
+    # 3️⃣ PEEK / SIZE / IS_EMPTY / CLEAR
+    # -----------------------------------------------------------
+    def peek(self):
+        """Top element without removing it. ⏱️ O(1)"""
+        if self.top == 0:
+            raise IndexError("peek from empty stack")
+        return self.items[self.top - 1]
+
+    def size(self):
+        """⏱️ O(1)"""
+        return self.top
+
+    def __len__(self):
+        return self.top
+
+    def is_empty(self):
+        """⏱️ O(1)"""
+        return self.top == 0
+
+    def clear(self):
+        """Drop all elements and release the large buffer. ⏱️ O(1)"""
+        self.items = self._new_buffer(self.MIN_CAPACITY)
+        self.top = 0
+
+    # -----------------------------------------------------------
+    # 4️⃣ EXPORT / VISUALIZATION
+    # -----------------------------------------------------------
+    def view(self):
+        """Zero-copy memoryview of the live stack (bottom → top). ⏱️ O(1)"""
+        return memoryview(self.items)[:self.top]
+
+    def __str__(self):
+        """Vertical top-first view, walking indices down (no reversed copy). ⏱️ O(n)"""
+        if self.top == 0:
+            return "Stack is Empty"
+        items = self.items
+        return "\n".join(str(items[i]) for i in range(self.top - 1, -1, -1))
+
+
+# ---------------------------------------------------------------
+# ⏱️ BENCHMARK vs StackList and the linked-list Stack
+# ---------------------------------------------------------------
+def load_stack_class(relative_path, class_name):
+    """Load a class from a sibling notes file (file names start with digits)."""
+    import importlib.util
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.normpath(os.path.join(here, relative_path))
+    spec = importlib.util.spec_from_file_location(class_name.lower(), path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return getattr(mod, class_name)
+
+
+def benchmark(ops=10**7, batch=1024):
+    """ops/2 pushes followed by ops/2 pops for every stack."""
+    import time
+
+    half = ops // 2
+    StackList = load_stack_class("08_All_methods_Stack_using_List.py", "StackList")
+    LLStack = load_stack_class("../03_Stack_Using_Linked_List/06_All_methods_Using_LL.py", "Stack")
+
+    def one_by_one(st):
+        push, pop = st.push, st.pop
+        for i in range(half):
+            push(i)
+        for _ in range(half):
+            pop()
+
+    def batched(st):
+        chunk = array("q", range(batch))
+        for _ in range(half // batch):
+            st.push_many(chunk)
+        total = 0
+        for _ in range(half // batch):
+            total += sum(st.pop_many(batch))    # consume the view without copying
+        return total
+
+    print(f"{ops:,} operations ({half:,} push + {half:,} pop):")
+    for name, make, run in [
+        ("Stack (linked list)", LLStack, one_by_one),
+        ("StackList (list)", StackList, one_by_one),
+        ("TypedStack('q')", TypedStack, one_by_one),
+        (f"TypedStack batch={batch}", TypedStack, batched),
+    ]:
+        st = make()
+        start = time.perf_counter()
+        run(st)
+        secs = time.perf_counter() - start
+        print(f"  {name:<24} {secs:>7.2f}s  {ops / secs:>13,.0f} ops/s")
+
+
+def memory_per_element(n=10**6):
+    import tracemalloc
+
+    StackList = load_stack_class("08_All_methods_Stack_using_List.py", "StackList")
+    LLStack = load_stack_class("../03_Stack_Using_Linked_List/06_All_methods_Using_LL.py", "Stack")
+    print(f"\nPeak memory while holding {n:,} distinct ints:")
+    for name, make in [("Stack (linked list)", LLStack), ("StackList (list)", StackList),
+                       ("TypedStack('q')", TypedStack)]:
+        tracemalloc.start()
+        st = make()
+        for i in range(1000, n + 1000):      # skip the small-int cache
+            st.push(i)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name:<24} {peak / n:>6.1f} bytes/element")
+
+
+# ---------------------------------------------------------------
+# ✅ USAGE EXAMPLE & DRY RUN
+# ---------------------------------------------------------------
+if __name__ == "__main__":
+    import sys
+
+    print("✅ STACK (typed array) — Demo\n")
+    st = TypedStack("q")
+    st.push(10)
+    st.push(20)
+    st.push_many([30, 40, 50])
+    print(st)                                   # 50 40 30 20 10
+    print("peek:", st.peek(), "| size:", st.size())
+
+    popped = st.pop_many(3)
+    print("pop_many(3):", popped.tolist())      # [30, 40, 50]
+    print("pop:", st.pop(), "| size:", st.size())
+
+    st.push_many(range(1000))
+    print("capacity after 1000 pushes:", st.capacity())
+    st.pop_many(990)
+    print("capacity after pop_many(990):", st.capacity())
+
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    print()
+    benchmark(ops)
+    memory_per_element()
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITIES
+# ---------------------------------------------------------------
+"""
+Operation        | Time Complexity   | Space Complexity
+-------------------------------------------------------
+push()           | O(1) amortized    | O(1)
+pop()            | O(1) amortized    | O(1)
+push_many(k)     | O(k) amortized    | O(1) (one slice copy)
+pop_many(k)      | O(1) amortized    | O(1) (memoryview, no copy)
+peek() / size()  | O(1)              | O(1)
+clear()          | O(1)              | O(1)
+__str__()        | O(n)              | O(n) strings only
+Storage          | itemsize bytes per slot, ≤ 4 × live elements
+"""
@@ -0,0 +1,410 @@
+# note.py
+# ------------------------------------------------------
+# 📘 PERSISTENT (immutable) STACK & QUEUE
+# ✅ Topic: structural sharing, O(1) snapshots, cons-list stack,
+#           banker's queue (lazy reversal), real-time queue
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+The linked-list Stack (06_All_methods_Using_LL.py) CHANGES itself:
+push/pop move `self.top`. To keep an undo history we had to copy the
+whole stack for every snapshot → O(n) time and memory per snapshot.
+
+A PERSISTENT structure never changes. push/pop return a NEW version and
+the old version stays valid. Versions share all unchanged nodes:
+
+    s1 = EMPTY.push(10).push(20)        s1.top → [20] → [10] → None
+    s2 = s1.push(30)                    s2.top → [30] ─┘
+    s3 = s1.pop()                       s3.top ──────────→ [10]
+
+    3 versions, only 3 nodes in memory. Each push allocates 1 node,
+    each pop allocates nothing (plus one tiny version object).
+    → a snapshot is just "keep a reference" → O(1).
+
+Stack  → cons-list (node = value + next, never modified)
+Queue  → two cons-lists (front + reversed rear):
+    BankersQueue  : rear is reversed LAZILY when it grows longer than
+                    front; memoized lazy cells keep O(1) amortized even
+                    when old versions are reused (plain two-list queue
+                    would redo the same O(n) reversal from every old copy)
+    RealTimeQueue : the reversal is done ONE STEP per operation
+                    (Okasaki's schedule) → O(1) worst case
+"""
+
+# ---------------------------------------------------------------
+# 🧱 VISUAL: BankersQueue rotation
+# ---------------------------------------------------------------
+"""
+invariant: len(rear) <= len(front)
+
+    front: 1 → 2          rear: 4 → 3          (rear is newest-first)
+    enqueue(5) → len(rear) = 3 > 2 → front = front ++ reverse(rear)
+
+    front: 1 → 2 → ⟨reverse of 5 → 4 → 3⟩      rear: None
+                   └── suspended: computed once, when first reached,
+                       then shared by every version that reaches it
+"""
+
+
+# ---------------------------------------------------------------
+# 🧩 NODES
+# ---------------------------------------------------------------
+class Node:
+    """Immutable cons cell. __slots__: no per-node __dict__ (≈ 3x smaller)."""
+    __slots__ = ("value", "next")
+
+    def __init__(self, value, next=None):
+        self.value = value
+        self.next = next
+
+
+class Lazy:
+    """
+    Memoized suspension of a stream cell.
+    force() → None (empty stream) or (value, Lazy tail); computed only once.
+    """
+    __slots__ = ("_thunk", "_cell")
+
+    def __init__(self, thunk=None, cell=None):
+        self._thunk = thunk
+        self._cell = cell
+
+    def force(self):
+        if self._thunk is not None:
+            self._cell = self._thunk()
+            self._thunk = None
+        return self._cell
+
+
+EMPTY_STREAM = Lazy()
+
+
+def _append(front, back):
+    """Lazy front ++ back: one cell of work per cell forced."""
+    def thunk():
+        cell = front.force()
+        if cell is None:
+            return back.force()
+        return cell[0], _append(cell[1], back)
+    return Lazy(thunk)
+
+
+def _reverse(rear):
+    """Lazy reverse of a cons-list: the whole reversal runs on first force."""
+    def thunk():
+        stream = EMPTY_STREAM
+        node = rear
+        while node is not None:
+            stream = Lazy(cell=(node.value, stream))
+            node = node.next
+        return stream.force()
+    return Lazy(thunk)
+
+
+def _rotate(front, rear, acc):
+    """front ++ reverse(rear) one step at a time; requires len(rear) == len(front) + 1."""
+    def thunk():
+        cell = front.force()
+        if cell is None:
+            return rear.value, acc
+        return cell[0], _rotate(cell[1], rear.next, Lazy(cell=(rear.value, acc)))
+    return Lazy(thunk)
+
+
+# ---------------------------------------------------------------
+# 🧱 PERSISTENT STACK (cons-list)
+# ---------------------------------------------------------------
+class PersistentStack:
+    """
+    Immutable stack. Every "modifying" method returns a new version.
+
+    Attributes:
+        top    → first Node (shared with other versions)
+        length → number of elements
+    """
+    __slots__ = ("top", "length")
+
+    def __init__(self, top=None, length=0):
+        self.top = top
+        self.length = length
+
+    def push(self, value):
+        """New version with value on top. ⏱️ O(1) | 💾 one Node"""
+        return PersistentStack(Node(value, self.top), self.length + 1)
+
+    def pop(self):
+        """New version without the top element (read it first with peek). ⏱️ O(1)"""
+        if self.top is None:
+            raise IndexError("pop from empty stack")
+        return PersistentStack(self.top.next, self.length - 1)
+
+    def peek(self):
+        """⏱️ O(1)"""
+        if self.top is None:
+            raise IndexError("peek from empty stack")
+        return self.top.value
+
+    def is_empty(self):
+        return self.top is None
+
+    def size(self):
+        return self.length
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        node = self.top
+        while node is not None:
+            yield node.value
+            node = node.next
+
+    def __str__(self):
+        if self.top is None:
+            return "Stack is Empty"
+        return "\n".join(str(v) for v in self)
+
+
+# ---------------------------------------------------------------
+# 🧱 PERSISTENT QUEUES
+# ---------------------------------------------------------------
+class BankersQueue:
+    """
+    front : lazy stream (oldest first)
+    rear  : cons-list (newest first)
+    invariant: rear_len <= front_len
+    """
+    __slots__ = ("front", "front_len", "rear", "rear_len")
+
+    def __init__(self, front=EMPTY_STREAM, front_len=0, rear=None, rear_len=0):
+        self.front = front
+        self.front_len = front_len
+        self.rear = rear
+        self.rear_len = rear_len
+
+    @staticmethod
+    def _check(front, front_len, rear, rear_len):
+        if rear_len <= front_len:
+            return BankersQueue(front, front_len, rear, rear_len)
+        return BankersQueue(_append(front, _reverse(rear)), front_len + rear_len)
+
+    def enqueue(self, value):
+        """⏱️ O(1) amortized"""
+        return self._check(self.front, self.front_len, Node(value, self.rear), self.rear_len + 1)
+
+    def dequeue(self):
+        """New version without the oldest element. ⏱️ O(1) amortized"""
+        cell = self.front.force()
+        if cell is None:
+            raise IndexError("dequeue from empty queue")
+        return self._check(cell[1], self.front_len - 1, self.rear, self.rear_len)
+
+    def peek(self):
+        cell = self.front.force()
+        if cell is None:
+            raise IndexError("peek from empty queue")
+        return cell[0]
+
+    def __len__(self):
+        return self.front_len + self.rear_len
+
+    def is_empty(self):
+        return self.front_len == 0
+
+    def __iter__(self):
+        q = self
+        while not q.is_empty():
+            yield q.peek()
+            q = q.dequeue()
+
+
+class RealTimeQueue:
+    """
+    Okasaki's real-time queue: rotation is spread over later operations.
+    schedule : the part of `front` not yet forced; each operation forces
+               one cell, so no operation ever pays for a whole reversal.
+    invariant: len(schedule) == len(front) - len(rear)
+    """
+    __slots__ = ("front", "rear", "schedule", "length")
+
+    def __init__(self, front=EMPTY_STREAM, rear=None, schedule=EMPTY_STREAM, length=0):
+        self.front = front
+        self.rear = rear
+        self.schedule = schedule
+        self.length = length
+
+    @staticmethod
+    def _exec(front, rear, schedule, length):
+        cell = schedule.force()
+        if cell is not None:
+            return RealTimeQueue(front, rear, cell[1], length)
+        front = _rotate(front, rear, EMPTY_STREAM)
+        return RealTimeQueue(front, None, front, length)
+
+    def enqueue(self, value):
+        """⏱️ O(1) worst case"""
+        return self._exec(self.front, Node(value, self.rear), self.schedule, self.length + 1)
+
+    def dequeue(self):
+        """⏱️ O(1) worst case"""
+        cell = self.front.force()
+        if cell is None:
+            raise IndexError("dequeue from empty queue")
+        return self._exec(cell[1], self.rear, self.schedule, self.length - 1)
+
+    def peek(self):
+        cell = self.front.force()
+        if cell is None:
+            raise IndexError("peek from empty queue")
+        return cell[0]
+
+    def __len__(self):
+        return self.length
+
+    def is_empty(self):
+        return self.length == 0
+
+    def __iter__(self):
+        q = self
+        while not q.is_empty():
+            yield q.peek()
+            q = q.dequeue()
+
+
+# ---------------------------------------------------------------
+# 📏 MEMORY: undo history with N snapshots
+# ---------------------------------------------------------------
+def load_ll_stack():
+    """Load Stack from 06_All_methods_Using_LL.py (file name starts with a digit)."""
+    import importlib.util
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location("ll_stack", os.path.join(here, "06_All_methods_Using_LL.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod.Stack
+
+
+def copy_ll_stack(Stack, stack):
+    """Snapshot the mutable Stack the old way: rebuild every node. O(n)"""
+    values = []
+    node = stack.top
+    while node:
+        values.append(node.value)
+        node = node.next
+    copy = Stack()
+    for v in reversed(values):
+        copy.push(v)
+    return copy
+
+
+def measure(label, build):
+    import time
+    import tracemalloc
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    history = build()
+    secs = time.perf_counter() - start
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {label:<36} {current / 1024:>10,.0f} KiB  {secs:>7.3f}s  ({len(history):,} snapshots)")
+    return history
+
+
+def memory_benchmark(n=2_000):
+    from collections import deque
+
+    Stack = load_ll_stack()
+    print(f"Undo history: {n:,} pushes, snapshot after every push")
+
+    def mutable_stack_copies():
+        st, history = Stack(), []
+        for i in range(n):
+            st.push(i)
+            history.append(copy_ll_stack(Stack, st))
+        return history
+
+    def persistent_stack():
+        st, history = PersistentStack(), []
+        for i in range(n):
+            st = st.push(i)
+            history.append(st)
+        return history
+
+    measure("Stack (LL) + O(n) copy per snapshot", mutable_stack_copies)
+    stacks = measure("PersistentStack", persistent_stack)
+
+    print(f"\nQueue history: {n:,} enqueues + {n // 2:,} dequeues, snapshot after every op")
+
+    def deque_copies():
+        q, history = deque(), []
+        for i in range(n):
+            q.append(i)
+            history.append(deque(q))
+            if i % 2:
+                q.popleft()
+                history.append(deque(q))
+        return history
+
+    def persistent_queue(cls):
+        def build():
+            q, history = cls(), []
+            for i in range(n):
+                q = q.enqueue(i)
+                history.append(q)
+                if i % 2:
+                    q = q.dequeue()
+                    history.append(q)
+            return history
+        return build
+
+    measure("collections.deque + copy per snapshot", deque_copies)
+    queues = measure("BankersQueue", persistent_queue(BankersQueue))
+    measure("RealTimeQueue", persistent_queue(RealTimeQueue))
+
+    # every snapshot is still intact
+    assert list(stacks[9]) == list(range(9, -1, -1))
+    assert list(queues[2]) == [1]
+
+
+# ---------------------------------------------------------------
+# ✅ USAGE EXAMPLE & DRY RUN
+# ---------------------------------------------------------------
+if __name__ == "__main__":
+    print("✅ PERSISTENT STACK — Demo\n")
+    s1 = PersistentStack().push(10).push(20)
+    s2 = s1.push(30)
+    s3 = s1.pop()
+    print("s1:", list(s1), "| s2:", list(s2), "| s3:", list(s3))
+    print("s2 shares s1's nodes:", s2.top.next is s1.top)
+
+    print("\n✅ PERSISTENT QUEUES — Demo\n")
+    for cls in (BankersQueue, RealTimeQueue):
+        q0 = cls()
+        q3 = q0.enqueue(1).enqueue(2).enqueue(3)
+        q2 = q3.dequeue()
+        q4 = q2.enqueue(4)
+        print(f"{cls.__name__:<14} q3: {list(q3)}  q2: {list(q2)}  q4: {list(q4)}  (q3 unchanged)")
+
+    print()
+    memory_benchmark()
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITIES
+# ---------------------------------------------------------------
+"""
+Operation              | PersistentStack | BankersQueue     | RealTimeQueue
+-----------------------------------------------------------------------------
+push / enqueue         | O(1)            | O(1) amortized   | O(1) worst case
+pop / dequeue          | O(1)            | O(1) amortized   | O(1) worst case
+peek / len             | O(1)            | O(1)             | O(1)
+snapshot (keep ref)    | O(1)            | O(1)             | O(1)
+Space for k versions   | O(k) total — only the changed cells are new
+
+Mutable Stack + copy per snapshot: O(n) time and memory per snapshot.
+"""
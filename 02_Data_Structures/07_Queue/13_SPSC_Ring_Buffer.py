@@ -0,0 +1,370 @@
+# note.py
+# ------------------------------------------------------
+# 📘 SPSC Ring Buffer (Single Producer / Single Consumer)
+# ✅ Topic: Lock-free-style circular queue, batch operations,
+#           typed array / memoryview storage, throughput benchmark
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+The circular Queue in 06_Implement_Circular_Queue_With_Capacity.py has two
+limits when used as a pipe between threads:
+
+    ❌ Both enqueue() and dequeue() write `start` AND `top`
+       → producer and consumer race on the same fields.
+    ❌ Every item is a boxed Python object in a list slot.
+
+SPSC ring buffer = circular queue with ONE writer per index:
+
+    head → total number of items ever DEQUEUED  (written only by consumer)
+    tail → total number of items ever ENQUEUED  (written only by producer)
+
+    size  = tail - head
+    empty → size == 0
+    full  → size == capacity
+    slot  = counter & mask          (ring length is a power of two)
+
+Because each side only READS the other side's counter and only WRITES its
+own, no lock is needed. The producer fills the slot FIRST and publishes
+`tail` AFTER, so the consumer never sees a half-written slot
+(the consumer frees the slot before publishing `head`, for the same reason).
+
+⚠️ Safety relies on CPython's GIL: a single attribute store is atomic and
+   stores are not reordered between threads. Exactly ONE producer thread
+   and ONE consumer thread may use a buffer.
+"""
+
+# ---------------------------------------------------------------
+# 🧱 VISUAL OVERVIEW
+# ---------------------------------------------------------------
+"""
+capacity = 8, mask = 7
+
+    enqueue ×6, dequeue ×3:
+
+    slot:   0    1    2    3    4    5    6    7
+          +----+----+----+----+----+----+----+----+
+          | __ | __ | __ | 40 | 50 | 60 | __ | __ |
+          +----+----+----+----+----+----+----+----+
+                           ↑head=3        ↑tail=6
+
+    enqueue_many([70, 80, 90]) → wraps: slots 6, 7, 0
+          +----+----+----+----+----+----+----+----+
+          | 90 | __ | __ | 40 | 50 | 60 | 70 | 80 |
+          +----+----+----+----+----+----+----+----+
+                           ↑head=3 (slot 3)   tail=9 (slot 1)
+
+Batch operations copy at most TWO contiguous slices (before and after the
+wrap point) instead of looping item by item.
+"""
+
+from array import array
+
+
+# ---------------------------------------------------------------
+# 🧩 CLASS IMPLEMENTATION
+# ---------------------------------------------------------------
+class SPSCRingBuffer:
+    def __init__(self, maxSize, typecode=None):
+        """
+        Args:
+            maxSize (int): capacity (ring length is rounded up to a power of two)
+            typecode (str | None): None → Python list slots (any object)
+                                   'd', 'q', ... → array.array storage
+
+        ⏱️ O(n) | 💾 O(n)
+        """
+        if maxSize <= 0:
+            raise ValueError("maxSize must be positive")
+        size = 1 << (maxSize - 1).bit_length()
+        self.maxSize = maxSize
+        self.typecode = typecode
+        self._mask = size - 1
+        if typecode:
+            self.items = array(typecode, bytes(array(typecode).itemsize * size))
+        else:
+            self.items = size * [None]
+        self._head = 0      # consumer-owned
+        self._tail = 0      # producer-owned
+
+    def __len__(self):
+        return self._tail - self._head
+
+    def __str__(self):
+        size = self._tail - self._head
+        values = [str(self.items[(self._head + i) & self._mask]) for i in range(size)]
+        return " | ".join(values) if values else "Empty Ring Buffer"
+
+    # -----------------------------------------------------------
+    # 1️⃣ isFull() / isEmpty()
+    # -----------------------------------------------------------
+    def isFull(self):
+        """⏱️ O(1) — exact for the producer, approximate for the consumer."""
+        return self._tail - self._head >= self.maxSize
+
+    def isEmpty(self):
+        """⏱️ O(1) — exact for the consumer, approximate for the producer."""
+        return self._tail == self._head
+
+    # -----------------------------------------------------------
+    # 2️⃣ enqueue(value)  — PRODUCER only
+    # -----------------------------------------------------------
+    def enqueue(self, value):
+        """
+        Write value, then publish tail. Returns False if full (never blocks).
+        ⏱️ O(1) | 💾 O(1)
+        """
+        tail = self._tail
+        if tail - self._head >= self.maxSize:
+            return False
+        self.items[tail & self._mask] = value
+        self._tail = tail + 1
+        return True
+
+    # -----------------------------------------------------------
+    # 3️⃣ dequeue()  — CONSUMER only
+    # -----------------------------------------------------------
+    def dequeue(self, default=None):
+        """
+        Read front value, free the slot, then publish head.
+        Returns `default` if empty (never blocks).
+        ⏱️ O(1) | 💾 O(1)
+        """
+        head = self._head
+        if head == self._tail:
+            return default
+        index = head & self._mask
+        value = self.items[index]
+        if self.typecode is None:
+            self.items[index] = None    # drop reference for the GC
+        self._head = head + 1
+        return value
+
+    # -----------------------------------------------------------
+    # 4️⃣ peek()  — CONSUMER only
+    # -----------------------------------------------------------
+    def peek(self, default=None):
+        """Return front value without removing it. ⏱️ O(1)"""
+        head = self._head
+        if head == self._tail:
+            return default
+        return self.items[head & self._mask]
+
+    # -----------------------------------------------------------
+    # 5️⃣ enqueue_many(values)  — PRODUCER only
+    # -----------------------------------------------------------
+    def enqueue_many(self, values):
+        """
+        Copy as many values as fit (at most two slice assignments),
+        then publish tail ONCE. Returns number of values written.
+
+        values: list/tuple (object mode) or array/list (typed mode)
+        ⏱️ O(k) memcpy-style copy | 💾 O(1)
+        """
+        tail = self._tail
+        count = min(len(values), self.maxSize - (tail - self._head))
+        if count <= 0:
+            return 0
+        if self.typecode and not isinstance(values, array):
+            values = array(self.typecode, values[:count])
+        start = tail & self._mask
+        first = min(count, self._mask + 1 - start)
+        self.items[start:start + first] = values[:first]
+        if count > first:
+            self.items[0:count - first] = values[first:count]
+        self._tail = tail + count
+        return count
+
+    # -----------------------------------------------------------
+    # 6️⃣ dequeue_many(max_items)  — CONSUMER only
+    # -----------------------------------------------------------
+    def dequeue_many(self, max_items):
+        """
+        Remove up to max_items values (at most two slice copies),
+        then publish head ONCE.
+        Returns a list (object mode) or an array (typed mode).
+        ⏱️ O(k) | 💾 O(k)
+        """
+        head = self._head
+        count = min(max_items, self._tail - head)
+        if count <= 0:
+            return array(self.typecode) if self.typecode else []
+        start = head & self._mask
+        first = min(count, self._mask + 1 - start)
+        out = self.items[start:start + first]
+        if count > first:
+            out += self.items[0:count - first]
+        if self.typecode is None:
+            self.items[start:start + first] = [None] * first
+            if count > first:
+                self.items[0:count - first] = [None] * (count - first)
+        self._head = head + count
+        return out
+
+    # -----------------------------------------------------------
+    # 7️⃣ Zero-copy consumer API (typed mode)
+    # -----------------------------------------------------------
+    def readable_view(self, max_items=None):
+        """
+        Return a memoryview over the CONTIGUOUS readable slots at the front
+        (stops at the wrap point). Nothing is copied or removed; call
+        consume(len(view)) when done. Typed mode only.
+        ⏱️ O(1) | 💾 O(1)
+        """
+        if self.typecode is None:
+            raise TypeError("readable_view() needs typed storage (typecode)")
+        head = self._head
+        count = self._tail - head
+        if max_items is not None:
+            count = min(count, max_items)
+        start = head & self._mask
+        count = min(count, self._mask + 1 - start)
+        return memoryview(self.items)[start:start + count]
+
+    def consume(self, count):
+        """Release `count` front items after reading them via readable_view(). ⏱️ O(1)"""
+        if count < 0 or count > self._tail - self._head:
+            raise ValueError("cannot consume more items than are readable")
+        self._head += count
+
+
+# ---------------------------------------------------------------
+# ⏱️ THROUGHPUT BENCHMARK (1 producer thread → 1 consumer thread)
+# ---------------------------------------------------------------
+def _run_pair(produce, consume):
+    import threading
+    import time
+
+    consumer = threading.Thread(target=consume)
+    start = time.perf_counter()
+    consumer.start()
+    produce()
+    consumer.join()
+    return time.perf_counter() - start
+
+
+def bench_spsc(n, batch=None, typecode=None, capacity=4096):
+    import time
+
+    rb = SPSCRingBuffer(capacity, typecode)
+    data = array(typecode, range(n)) if typecode else list(range(n))
+
+    def produce():
+        i = 0
+        if batch:
+            while i < n:
+                written = rb.enqueue_many(data[i:i + batch])
+                if written:
+                    i += written
+                else:
+                    time.sleep(0)       # ring full → let the consumer run
+        else:
+            for value in data:
+                while not rb.enqueue(value):
+                    time.sleep(0)
+
+    def consume():
+        got = 0
+        empty = object()
+        if batch:
+            while got < n:
+                chunk = rb.dequeue_many(batch)
+                if chunk:
+                    got += len(chunk)
+                else:
+                    time.sleep(0)
+        else:
+            while got < n:
+                if rb.dequeue(empty) is empty:
+                    time.sleep(0)
+                else:
+                    got += 1
+
+    return _run_pair(produce, consume)
+
+
+def bench_queue_module(n, capacity=4096):
+    import queue
+
+    qu = queue.Queue(maxsize=capacity)
+
+    def produce():
+        for i in range(n):
+            qu.put(i)
+
+    def consume():
+        for _ in range(n):
+            qu.get()
+
+    return _run_pair(produce, consume)
+
+
+def bench_deque(n):
+    import time
+    from collections import deque
+
+    dq = deque()
+
+    def produce():
+        for i in range(n):
+            dq.append(i)
+
+    def consume():
+        got = 0
+        while got < n:
+            try:
+                dq.popleft()
+                got += 1
+            except IndexError:
+                time.sleep(0)
+
+    return _run_pair(produce, consume)
+
+
+# ---------------------------------------------------------------
+# ▶️ DEMONSTRATION
+# ---------------------------------------------------------------
+if __name__ == "__main__":
+    rb = SPSCRingBuffer(8)
+    for v in (10, 20, 30, 40, 50, 60):
+        rb.enqueue(v)
+    print("dequeue x3:", rb.dequeue(), rb.dequeue(), rb.dequeue())
+    print("enqueue_many wrote:", rb.enqueue_many([70, 80, 90, 100, 110, 120]))
+    print("Ring:", rb, "| isFull:", rb.isFull())
+    print("dequeue_many(5):", rb.dequeue_many(5))
+
+    typed = SPSCRingBuffer(8, typecode="d")
+    typed.enqueue_many([1.5, 2.5, 3.5])
+    view = typed.readable_view()
+    print("zero-copy view:", view.tolist(), "sum =", sum(view))
+    typed.consume(len(view))
+    view.release()
+    print("after consume, isEmpty:", typed.isEmpty())
+
+    N = 500_000
+    print(f"\nThroughput, {N:,} items producer thread → consumer thread:")
+    results = [
+        ("queue.Queue(4096)", bench_queue_module(N)),
+        ("collections.deque", bench_deque(N)),
+        ("SPSC single", bench_spsc(N)),
+        ("SPSC batch=512", bench_spsc(N, batch=512)),
+        ("SPSC batch=512 array('q')", bench_spsc(N, batch=512, typecode="q")),
+    ]
+    for name, secs in results:
+        print(f"  {name:<27} {N / secs:>12,.0f} items/s")
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITY
+# ---------------------------------------------------------------
+"""
+Operation            | Time     | Space | Notes
+----------------------------------------------------------------------
+Create               | O(n)     | O(n)  | n rounded up to a power of two
+enqueue / dequeue    | O(1)     | O(1)  | no locks, one writer per index
+peek / isEmpty       | O(1)     | O(1)  |
+enqueue_many(k)      | O(k)     | O(1)  | ≤ 2 slice copies, 1 publish
+dequeue_many(k)      | O(k)     | O(k)  | ≤ 2 slice copies, 1 publish
+readable_view        | O(1)     | O(1)  | zero-copy memoryview (typed mode)
+"""
@@ -0,0 +1,397 @@
+# note.py
+# ------------------------------------------------------
+# 📘 Shared-Memory Ring Queue for multiprocessing
+# ✅ Topic: Circular queue whose slots live in multiprocessing.shared_memory,
+#           fixed-width records, batch operations, benchmark vs multiprocessing.Queue
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+12_Python_Multiprocessing_Queue.py uses `multiprocessing.Queue`:
+
+    put(item) → pickle.dumps(item) → write to a pipe → feeder thread
+    get()     → read from the pipe → pickle.loads(...)
+
+Every single item is serialized and copied through the kernel. That caps
+throughput at a few hundred thousand messages per second.
+
+Shared-memory ring queue:
+    - ONE block of shared memory, mapped into every process
+    - Same circular-queue idea as 06_Implement_Circular_Queue_With_Capacity.py
+    - Each slot stores one FIXED-WIDTH record packed with `struct`
+      (e.g. "qd" = int64 + float64 = 16 bytes) → no pickling
+    - head / tail counters live in the same block
+    - a multiprocessing.Lock guards head/tail (multi-producer, multi-consumer);
+      batch operations take the lock ONCE for many records
+
+Memory layout:
+
+    offset 0          8          16
+           +----------+----------+-------+-------+-----+-------+
+           | head (Q) | tail (Q) | slot0 | slot1 | ... | slotN |
+           +----------+----------+-------+-------+-----+-------+
+             dequeued   enqueued   <---- maxSize × record_size ---->
+
+    size  = tail - head         slot = counter % maxSize
+"""
+
+# ---------------------------------------------------------------
+# 🧱 VISUAL OVERVIEW
+# ---------------------------------------------------------------
+"""
+maxSize = 4, record_format = "q"
+
+enqueue(5), enqueue(6), enqueue(7), dequeue() → 5
+
+    +----+----+----+----+
+    | __ | 6  | 7  | __ |        head=1  tail=3
+    +----+----+----+----+
+
+enqueue_many([8, 9]) → wraps (slot 3, then slot 0) in ONE locked section
+
+    +----+----+----+----+
+    | 9  | 6  | 7  | 8  |        head=1  tail=5   (isFull)
+    +----+----+----+----+
+"""
+
+import struct
+import time
+from multiprocessing import Lock, shared_memory
+
+_HEADER = struct.Struct("QQ")       # head, tail
+
+
+def _attach(name):
+    """Attach to an existing block without letting this process's resource
+    tracker unlink it at exit (only the creator owns the block)."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)   # Python 3.13+
+    except TypeError:
+        from multiprocessing import resource_tracker
+
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+# ---------------------------------------------------------------
+# 🧩 CLASS IMPLEMENTATION
+# ---------------------------------------------------------------
+class SharedRingQueue:
+    def __init__(self, maxSize, record_format="q"):
+        """
+        Create the shared block. Pass the queue object to Process(args=...)
+        to use it from child processes.
+
+        Args:
+            maxSize (int): number of record slots
+            record_format (str): struct format of ONE record, e.g. "q", "qd", "16s"
+
+        ⏱️ O(1) | 💾 O(n × record_size) shared bytes
+        """
+        if maxSize <= 0:
+            raise ValueError("maxSize must be positive")
+        self.maxSize = maxSize
+        self.record_format = record_format
+        self._record = struct.Struct(record_format)
+        self._lock = Lock()
+        size = _HEADER.size + maxSize * self._record.size
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._owner = True
+        self._setup()
+        _HEADER.pack_into(self._buf, 0, 0, 0)
+
+    def _setup(self):
+        self._buf = self._shm.buf
+        self._single = len(self._record.unpack(bytes(self._record.size))) == 1
+
+    # -----------------------------------------------------------
+    # Pickling: child processes re-attach by name
+    # -----------------------------------------------------------
+    def __getstate__(self):
+        return {
+            "maxSize": self.maxSize,
+            "record_format": self.record_format,
+            "lock": self._lock,
+            "name": self._shm.name,
+        }
+
+    def __setstate__(self, state):
+        self.maxSize = state["maxSize"]
+        self.record_format = state["record_format"]
+        self._record = struct.Struct(self.record_format)
+        self._lock = state["lock"]
+        self._shm = _attach(state["name"])
+        self._owner = False
+        self._setup()
+
+    # -----------------------------------------------------------
+    # Helpers
+    # -----------------------------------------------------------
+    def _offset(self, counter):
+        return _HEADER.size + (counter % self.maxSize) * self._record.size
+
+    def _pack(self, record):
+        return self._record.pack(record) if self._single else self._record.pack(*record)
+
+    def _unpack(self, raw):
+        values = self._record.unpack(raw)
+        return values[0] if self._single else values
+
+    def __len__(self):
+        head, tail = _HEADER.unpack_from(self._buf, 0)
+        return tail - head
+
+    def __str__(self):
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._buf, 0)
+            values = []
+            for counter in range(head, tail):
+                start = self._offset(counter)
+                values.append(str(self._unpack(self._buf[start:start + self._record.size])))
+        return " | ".join(values) if values else "Empty Shared Queue"
+
+    # -----------------------------------------------------------
+    # 1️⃣ isFull() / isEmpty()
+    # -----------------------------------------------------------
+    def isFull(self):
+        """⏱️ O(1) (a snapshot — other processes may change it right after)"""
+        return len(self) >= self.maxSize
+
+    def isEmpty(self):
+        """⏱️ O(1) (a snapshot)"""
+        return len(self) == 0
+
+    # -----------------------------------------------------------
+    # 2️⃣ enqueue(record)
+    # -----------------------------------------------------------
+    def enqueue(self, record, block=False, timeout=None):
+        """
+        Pack one record into the slot at tail, then tail += 1.
+        Non-blocking: returns False when full.
+        block=True: retry (with tiny sleeps) until space or timeout.
+        ⏱️ O(1) | 💾 O(1)
+        """
+        data = self._pack(record)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                head, tail = _HEADER.unpack_from(self._buf, 0)
+                if tail - head < self.maxSize:
+                    start = self._offset(tail)
+                    self._buf[start:start + len(data)] = data
+                    struct.pack_into("Q", self._buf, 8, tail + 1)
+                    return True
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                return False
+            time.sleep(0.0001)
+
+    # -----------------------------------------------------------
+    # 3️⃣ dequeue()
+    # -----------------------------------------------------------
+    def dequeue(self, block=False, timeout=None):
+        """
+        Unpack the record at head, then head += 1.
+        Non-blocking: returns None when empty.
+        ⏱️ O(1) | 💾 O(1)
+        """
+        size = self._record.size
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                head, tail = _HEADER.unpack_from(self._buf, 0)
+                if head != tail:
+                    start = self._offset(head)
+                    raw = bytes(self._buf[start:start + size])
+                    struct.pack_into("Q", self._buf, 0, head + 1)
+                    return self._unpack(raw)
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                return None
+            time.sleep(0.0001)
+
+    # -----------------------------------------------------------
+    # 4️⃣ peek()
+    # -----------------------------------------------------------
+    def peek(self):
+        """Return front record without removing it (None if empty). ⏱️ O(1)"""
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._buf, 0)
+            if head == tail:
+                return None
+            start = self._offset(head)
+            return self._unpack(bytes(self._buf[start:start + self._record.size]))
+
+    # -----------------------------------------------------------
+    # 5️⃣ enqueue_many(records)
+    # -----------------------------------------------------------
+    def enqueue_many(self, records):
+        """
+        Pack records OUTSIDE the lock, then copy as many as fit with at
+        most two slice writes (before/after the wrap point) in ONE locked
+        section. Returns the number of records written.
+        ⏱️ O(k) | 💾 O(k) temporary bytes
+        """
+        pack = self._record.pack
+        if self._single:
+            data = b"".join([pack(r) for r in records])
+        else:
+            data = b"".join([pack(*r) for r in records])
+        size = self._record.size
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._buf, 0)
+            count = min(len(records), self.maxSize - (tail - head))
+            if count <= 0:
+                return 0
+            slot = tail % self.maxSize
+            first = min(count, self.maxSize - slot)
+            start = self._offset(tail)
+            self._buf[start:start + first * size] = data[:first * size]
+            if count > first:
+                rest = (count - first) * size
+                self._buf[_HEADER.size:_HEADER.size + rest] = data[first * size:count * size]
+            struct.pack_into("Q", self._buf, 8, tail + count)
+            return count
+
+    # -----------------------------------------------------------
+    # 6️⃣ dequeue_many(max_items)
+    # -----------------------------------------------------------
+    def dequeue_many(self, max_items):
+        """
+        Copy up to max_items records out in ONE locked section
+        (≤ 2 slice reads), then unpack them outside the lock.
+        ⏱️ O(k) | 💾 O(k)
+        """
+        size = self._record.size
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._buf, 0)
+            count = min(max_items, tail - head)
+            if count <= 0:
+                return []
+            slot = head % self.maxSize
+            first = min(count, self.maxSize - slot)
+            start = self._offset(head)
+            raw = bytes(self._buf[start:start + first * size])
+            if count > first:
+                raw += bytes(self._buf[_HEADER.size:_HEADER.size + (count - first) * size])
+            struct.pack_into("Q", self._buf, 0, head + count)
+        records = self._record.iter_unpack(raw)
+        if self._single:
+            return [r[0] for r in records]
+        return list(records)
+
+    # -----------------------------------------------------------
+    # 7️⃣ delete() / close()
+    # -----------------------------------------------------------
+    def delete(self):
+        """Drop all records (head = tail). ⏱️ O(1)"""
+        with self._lock:
+            head, tail = _HEADER.unpack_from(self._buf, 0)
+            struct.pack_into("Q", self._buf, 0, tail)
+        return "All Elements are deleted"
+
+    def close(self):
+        """Detach this process; the creating process also frees the block."""
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+# ---------------------------------------------------------------
+# ⏱️ BENCHMARK: multiprocessing.Queue vs SharedRingQueue
+# ---------------------------------------------------------------
+def _mp_queue_worker(qu, count):
+    for i in range(count):
+        qu.put((i, i * 0.5))
+
+
+def _shm_queue_worker(qu, count, batch):
+    i = 0
+    while i < count:
+        chunk = [(j, j * 0.5) for j in range(i, min(count, i + batch))]
+        written = 0
+        while written < len(chunk):
+            done = qu.enqueue_many(chunk[written:])
+            written += done
+            if not done:
+                time.sleep(0.0001)
+        i += len(chunk)
+
+
+def benchmark(workers, total, batch=256):
+    """workers producer processes → main process consumer, `total` records."""
+    from multiprocessing import Process, Queue
+
+    per_worker = total // workers
+    expected = per_worker * workers
+    results = {}
+
+    qu = Queue(maxsize=4096)
+    procs = [Process(target=_mp_queue_worker, args=(qu, per_worker)) for _ in range(workers)]
+    start = time.perf_counter()
+    for p in procs:
+        p.start()
+    for _ in range(expected):
+        qu.get()
+    for p in procs:
+        p.join()
+    results["multiprocessing.Queue"] = time.perf_counter() - start
+
+    shq = SharedRingQueue(4096, "qd")
+    procs = [Process(target=_shm_queue_worker, args=(shq, per_worker, batch)) for _ in range(workers)]
+    start = time.perf_counter()
+    for p in procs:
+        p.start()
+    got = 0
+    while got < expected:
+        records = shq.dequeue_many(batch * 4)
+        if records:
+            got += len(records)
+        else:
+            time.sleep(0.0001)
+    for p in procs:
+        p.join()
+    results["SharedRingQueue"] = time.perf_counter() - start
+    shq.close()
+    return expected, results
+
+
+# ---------------------------------------------------------------
+# ▶️ DEMONSTRATION
+# ---------------------------------------------------------------
+if __name__ == "__main__":
+    q = SharedRingQueue(4, "q")
+    for v in (5, 6, 7):
+        q.enqueue(v)
+    print("dequeue ->", q.dequeue())
+    print("enqueue_many([8, 9]) wrote", q.enqueue_many([8, 9]), "| isFull:", q.isFull())
+    print("Queue:", q, "| peek ->", q.peek())
+    print("dequeue_many(10) ->", q.dequeue_many(10))
+    q.close()
+
+    TOTAL = 200_000
+    print(f"\n{TOTAL:,} records of (int64, float64), N producer processes → 1 consumer:")
+    print(f"{'workers':>8} {'multiprocessing.Queue':>24} {'SharedRingQueue':>18}")
+    for workers in (1, 2, 4, 8):
+        n, res = benchmark(workers, TOTAL)
+        mpq = n / res["multiprocessing.Queue"]
+        shm = n / res["SharedRingQueue"]
+        print(f"{workers:>8} {mpq:>17,.0f} msg/s {shm:>11,.0f} msg/s")
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITY
+# ---------------------------------------------------------------
+"""
+Operation          | Time  | Space | Notes
+----------------------------------------------------------------------
+Create             | O(1)  | O(n)  | n × record_size bytes of shared memory
+enqueue / dequeue  | O(1)  | O(1)  | struct pack/unpack, no pickling, no pipe
+peek / isEmpty     | O(1)  | O(1)  |
+enqueue_many(k)    | O(k)  | O(k)  | one lock acquire, ≤ 2 slice copies
+dequeue_many(k)    | O(k)  | O(k)  | one lock acquire, ≤ 2 slice copies
+
+⚠️ Records must be fixed width (struct format). Variable-size objects
+   still need multiprocessing.Queue (or length-prefixed bytes in "Ns" slots).
+"""
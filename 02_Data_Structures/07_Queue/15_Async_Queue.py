@@ -0,0 +1,389 @@
+# note.py
+# ------------------------------------------------------
+# 📘 asyncio Queues built on the Linked-List and Circular Queues
+# ✅ Topic: awaitable enqueue/dequeue, backpressure, batch dequeue,
+#           priority mode, latency benchmark with 10k producers
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+08_Implement_Queue_Using_Linked_List.py and
+06_Implement_Circular_Queue_With_Capacity.py are synchronous:
+    - enqueue on a full circular queue returns "Queue Is Full"
+    - dequeue on an empty queue returns "Empty Queue"
+
+In an asyncio service we instead want to WAIT without blocking the loop:
+
+    await q.enqueue(item)   → suspends while the queue is full   (backpressure)
+    await q.dequeue()       → suspends while the queue is empty
+
+    await q.dequeue_batch(max_items, timeout)
+        → one wakeup returns up to max_items items
+          (fewer task switches when producers are faster than consumers)
+
+Classes:
+    AsyncLinkedListQueue(maxsize=0, priority=False)   → unbounded by default
+    AsyncCircularQueue(maxSize, priority=False)       → fixed capacity ring
+
+priority=True → items leave in priority order (smallest first, FIFO among
+equal priorities). Storage becomes a binary heap (heapq) — O(log n) per op.
+"""
+
+# ---------------------------------------------------------------
+# 🧱 HOW WAITING WORKS (same idea as asyncio.Queue)
+# ---------------------------------------------------------------
+"""
+    _getters: deque of Futures of consumers waiting for an item
+    _putters: deque of Futures of producers waiting for a free slot
+
+    enqueue(x):                          dequeue():
+      while full:                          while empty:
+          fut → _putters; await fut            fut → _getters; await fut
+      store x                              x = take front
+      wake ONE getter                      wake ONE putter
+                                           return x
+
+Only one waiter is woken per item, so there is no thundering herd.
+"""
+
+import asyncio
+import heapq
+from collections import deque
+from itertools import count
+
+
+# ---------------------------------------------------------------
+# 🧩 STORAGE BACKENDS (plain, synchronous)
+# ---------------------------------------------------------------
+class Node:
+    def __init__(self, value=None):
+        self.value = value
+        self.next = None
+
+
+class LinkedListBackend:
+    """head → ... → tail singly linked list (08_Implement_Queue_Using_Linked_List.py)."""
+
+    def __init__(self):
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def push(self, value, priority=None):
+        new_node = Node(value)
+        if self.head is None:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+
+    def pop(self):
+        node = self.head
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        self.length -= 1
+        return node.value
+
+    def peek(self):
+        return self.head.value
+
+    def __len__(self):
+        return self.length
+
+
+class CircularBackend:
+    """Fixed-capacity ring (06_Implement_Circular_Queue_With_Capacity.py)."""
+
+    def __init__(self, maxSize):
+        self.maxSize = maxSize
+        self.items = maxSize * [None]
+        self.start = 0
+        self.length = 0
+
+    def push(self, value, priority=None):
+        self.items[(self.start + self.length) % self.maxSize] = value
+        self.length += 1
+
+    def pop(self):
+        value = self.items[self.start]
+        self.items[self.start] = None
+        self.start = (self.start + 1) % self.maxSize
+        self.length -= 1
+        return value
+
+    def peek(self):
+        return self.items[self.start]
+
+    def __len__(self):
+        return self.length
+
+
+class HeapBackend:
+    """Priority mode: binary min-heap of (priority, sequence, value)."""
+
+    def __init__(self):
+        self.heap = []
+        self._seq = count()     # FIFO order among equal priorities
+
+    def push(self, value, priority=0):
+        heapq.heappush(self.heap, (priority, next(self._seq), value))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
+
+    def peek(self):
+        return self.heap[0][2]
+
+    def __len__(self):
+        return len(self.heap)
+
+
+# ---------------------------------------------------------------
+# 🧩 ASYNC WRAPPER
+# ---------------------------------------------------------------
+class AsyncQueue:
+    def __init__(self, backend, maxsize=0):
+        """
+        backend: LinkedListBackend / CircularBackend / HeapBackend
+        maxsize: 0 → unbounded, else enqueue waits while len == maxsize
+        """
+        self._backend = backend
+        self.maxsize = maxsize
+        self._getters = deque()
+        self._putters = deque()
+
+    def __len__(self):
+        return len(self._backend)
+
+    def __str__(self):
+        return f"{type(self).__name__}(size={len(self)}, maxsize={self.maxsize})"
+
+    # -----------------------------------------------------------
+    # 1️⃣ isFull() / isEmpty()
+    # -----------------------------------------------------------
+    def isFull(self):
+        return 0 < self.maxsize <= len(self._backend)
+
+    def isEmpty(self):
+        return len(self._backend) == 0
+
+    # -----------------------------------------------------------
+    # Waiter helpers
+    # -----------------------------------------------------------
+    @staticmethod
+    def _wakeup_next(waiters):
+        while waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return
+
+    async def _wait(self, waiters, blocked):
+        """Suspend until blocked() is False (woken by the other side)."""
+        loop = asyncio.get_running_loop()
+        while blocked():
+            fut = loop.create_future()
+            waiters.append(fut)
+            try:
+                await fut
+            except BaseException:
+                fut.cancel()
+                try:
+                    waiters.remove(fut)
+                except ValueError:
+                    pass
+                # we were woken but cancelled → pass the wakeup on
+                if not blocked() and not fut.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    # -----------------------------------------------------------
+    # 2️⃣ enqueue(item)
+    # -----------------------------------------------------------
+    async def enqueue(self, item, priority=0):
+        """
+        Wait while full (backpressure), then store item and wake one consumer.
+        ⏱️ O(1) (O(log n) in priority mode)
+        """
+        if self.isFull():
+            await self._wait(self._putters, self.isFull)
+        self._backend.push(item, priority)
+        self._wakeup_next(self._getters)
+
+    def enqueue_nowait(self, item, priority=0):
+        """Store item without waiting. Returns False if full."""
+        if self.isFull():
+            return False
+        self._backend.push(item, priority)
+        self._wakeup_next(self._getters)
+        return True
+
+    # -----------------------------------------------------------
+    # 3️⃣ dequeue()
+    # -----------------------------------------------------------
+    async def dequeue(self):
+        """
+        Wait while empty, then remove the front item and wake one producer.
+        ⏱️ O(1) (O(log n) in priority mode)
+        """
+        if self.isEmpty():
+            await self._wait(self._getters, self.isEmpty)
+        item = self._backend.pop()
+        self._wakeup_next(self._putters)
+        return item
+
+    def peek(self):
+        """Front item without removing it (None if empty)."""
+        return None if self.isEmpty() else self._backend.peek()
+
+    # -----------------------------------------------------------
+    # 4️⃣ dequeue_batch(max_items, timeout)
+    # -----------------------------------------------------------
+    async def dequeue_batch(self, max_items, timeout=None):
+        """
+        Wait (up to `timeout` seconds, None = forever) until at least one
+        item is queued, then take up to max_items items in ONE wakeup.
+        Returns [] on timeout. Wakes one producer per freed slot.
+        ⏱️ O(k) for k items returned
+        """
+        if self.isEmpty():
+            try:
+                await asyncio.wait_for(self._wait(self._getters, self.isEmpty), timeout)
+            except asyncio.TimeoutError:
+                return []
+        backend = self._backend
+        batch = []
+        while backend and len(batch) < max_items:
+            batch.append(backend.pop())
+        for _ in range(len(batch)):
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        # more items left → let the next consumer run as well
+        if backend:
+            self._wakeup_next(self._getters)
+        return batch
+
+
+class AsyncLinkedListQueue(AsyncQueue):
+    """Linked-list queue; unbounded unless maxsize > 0."""
+
+    def __init__(self, maxsize=0, priority=False):
+        super().__init__(HeapBackend() if priority else LinkedListBackend(), maxsize)
+
+
+class AsyncCircularQueue(AsyncQueue):
+    """Fixed-capacity circular queue; enqueue waits while full."""
+
+    def __init__(self, maxSize, priority=False):
+        if maxSize <= 0:
+            raise ValueError("maxSize must be positive")
+        super().__init__(HeapBackend() if priority else CircularBackend(maxSize), maxSize)
+
+
+# ---------------------------------------------------------------
+# ⏱️ BENCHMARK: latency percentiles under 10k concurrent producers
+# ---------------------------------------------------------------
+async def _run_latency(make_queue, producers, per_producer, consumers, batch):
+    import time
+
+    q = make_queue()
+    latencies = []
+    total = producers * per_producer
+
+    async def producer():
+        for _ in range(per_producer):
+            if isinstance(q, asyncio.Queue):
+                await q.put(time.perf_counter())
+            else:
+                await q.enqueue(time.perf_counter())
+
+    async def consumer():
+        while len(latencies) < total:
+            if batch:
+                items = await q.dequeue_batch(batch, timeout=0.05)
+            elif isinstance(q, asyncio.Queue):
+                try:
+                    items = [await asyncio.wait_for(q.get(), 0.05)]
+                except asyncio.TimeoutError:
+                    items = []
+            else:
+                try:
+                    items = [await asyncio.wait_for(q.dequeue(), 0.05)]
+                except asyncio.TimeoutError:
+                    items = []
+            now = time.perf_counter()
+            latencies.extend(now - ts for ts in items)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[producer() for _ in range(producers)],
+                         *[consumer() for _ in range(consumers)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+    return total / elapsed, pct(0.50), pct(0.99), latencies[-1] * 1000
+
+
+def benchmark(producers=10_000, per_producer=10, consumers=4, capacity=1024):
+    variants = [
+        ("asyncio.Queue", lambda: asyncio.Queue(capacity), None),
+        ("AsyncLinkedListQueue", lambda: AsyncLinkedListQueue(capacity), None),
+        ("AsyncCircularQueue", lambda: AsyncCircularQueue(capacity), None),
+        ("AsyncCircularQueue batch=64", lambda: AsyncCircularQueue(capacity), 64),
+        ("AsyncCircularQueue priority", lambda: AsyncCircularQueue(capacity, priority=True), 64),
+    ]
+    print(f"{producers:,} producers x {per_producer} items, {consumers} consumers, capacity {capacity}")
+    print(f"  {'queue':<29} {'items/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name, make, batch in variants:
+        rate, p50, p99, worst = asyncio.run(
+            _run_latency(make, producers, per_producer, consumers, batch))
+        print(f"  {name:<29} {rate:>10,.0f} {p50:>8.1f} {p99:>8.1f} {worst:>8.1f}")
+
+
+# ---------------------------------------------------------------
+# ▶️ DEMONSTRATION
+# ---------------------------------------------------------------
+async def demo():
+    q = AsyncCircularQueue(2)
+    await q.enqueue(1)
+    await q.enqueue(2)
+    print("isFull:", q.isFull())
+
+    async def late_producer():
+        await q.enqueue(3)              # waits: queue is full (backpressure)
+        print("  producer: enqueued 3 after space was freed")
+
+    task = asyncio.create_task(late_producer())
+    await asyncio.sleep(0)
+    print("dequeue ->", await q.dequeue())
+    await task
+    print("dequeue_batch(10) ->", await q.dequeue_batch(10))
+    print("dequeue_batch on empty (timeout 0.01) ->", await q.dequeue_batch(10, timeout=0.01))
+
+    pq = AsyncLinkedListQueue(priority=True)
+    for item, prio in [("low", 5), ("high", 1), ("mid", 3), ("high-2", 1)]:
+        await pq.enqueue(item, priority=prio)
+    print("priority order ->", await pq.dequeue_batch(10))
+
+
+if __name__ == "__main__":
+    asyncio.run(demo())
+    print()
+    benchmark()
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITY
+# ---------------------------------------------------------------
+"""
+Operation              | FIFO mode | Priority mode | Notes
+----------------------------------------------------------------------
+enqueue / dequeue      | O(1)      | O(log n)      | + O(1) waiter wakeup
+enqueue_nowait         | O(1)      | O(log n)      | False when full
+dequeue_batch(k)       | O(k)      | O(k log n)    | one wakeup for k items
+peek / isEmpty/isFull  | O(1)      | O(1)          |
+Space                  | O(n)      | O(n)          | + O(waiting tasks)
+"""
@@ -0,0 +1,285 @@
+# note.py
+# ------------------------------------------------------
+# 📘 Growable Ring Deque (power-of-two circular buffer)
+# ✅ Topic: push/pop at both ends in O(1), doubling/halving with one
+#           contiguous copy, O(1) random indexing, benchmark vs deque
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+Queues so far:
+    03 Python list queue     → dequeue is list.pop(0) → O(n) shift
+    06 Circular queue        → O(1), but "Queue Is Full" at maxSize
+    10 collections.deque     → O(1) at both ends, but it is a linked list
+                               of 64-slot blocks → deque[i] walks blocks
+                               from the nearer end → O(n / 64)
+
+RingDeque = circular queue that GROWS instead of refusing items:
+
+    items    → Python list, length = capacity = power of two
+    head     → slot of the front element
+    size     → number of elements
+    mask     → capacity - 1   (slot = (head + i) & mask, no % needed)
+
+    front element  : items[head]
+    i-th element   : items[(head + i) & mask]     → O(1) random access
+    back element   : items[(head + size - 1) & mask]
+
+Resize (full → ×2, size ≤ capacity/4 → ÷2): copy the elements UNWRAPPED
+into a fresh list in ONE pass (two slices, front part + wrapped part),
+then head = 0. Each resize is paid for by the pushes/pops since the
+previous one → O(1) amortized per operation.
+"""
+
+# ---------------------------------------------------------------
+# 🧱 VISUAL OVERVIEW
+# ---------------------------------------------------------------
+"""
+capacity 8, push_back 1..5, push_front 0, push_front -1:
+
+    slot:    0    1    2    3    4    5    6    7
+          +----+----+----+----+----+----+----+----+
+          |  1 |  2 |  3 |  4 |  5 | __ | -1 |  0 |
+          +----+----+----+----+----+----+----+----+
+                                       ↑head=6
+    logical order: -1, 0, 1, 2, 3, 4, 5      dq[3] → slot (6 + 3) & 7 = 1 → 2
+
+grow (full): new = items[head:] + items[:head] + [None] * capacity
+    | -1 |  0 |  1 |  2 |  3 |  4 |  5 |  6 | __ | ... |     head = 0
+"""
+
+
+# ---------------------------------------------------------------
+# 🧩 CLASS IMPLEMENTATION
+# ---------------------------------------------------------------
+class RingDeque:
+    MIN_CAPACITY = 8
+
+    def __init__(self, iterable=None, capacity=MIN_CAPACITY):
+        """
+        ⏱️ O(capacity + len(iterable)) | 💾 O(capacity)
+        """
+        cap = self.MIN_CAPACITY
+        while cap < capacity:
+            cap *= 2
+        self.items = cap * [None]
+        self.mask = cap - 1
+        self.head = 0
+        self.size = 0
+        if iterable is not None:
+            for value in iterable:
+                self.push_back(value)
+
+    def __len__(self):
+        return self.size
+
+    def capacity(self):
+        return self.mask + 1
+
+    def isEmpty(self):
+        return self.size == 0
+
+    # -----------------------------------------------------------
+    # Resize with ONE contiguous copy
+    # -----------------------------------------------------------
+    def _resize(self, new_capacity):
+        """Unwrap the live elements into a new list, head → 0. ⏱️ O(n)"""
+        items, head, size = self.items, self.head, self.size
+        end = head + size
+        if end <= len(items):
+            live = items[head:end]
+        else:
+            live = items[head:] + items[:end - len(items)]
+        live.extend((new_capacity - size) * [None])
+        self.items = live
+        self.mask = new_capacity - 1
+        self.head = 0
+
+    def _maybe_shrink(self):
+        cap = self.mask + 1
+        if cap > self.MIN_CAPACITY and self.size <= cap // 4:
+            self._resize(cap // 2)
+
+    # -----------------------------------------------------------
+    # 1️⃣ push_back / push_front
+    # -----------------------------------------------------------
+    def push_back(self, value):
+        """⏱️ O(1) amortized"""
+        if self.size > self.mask:
+            self._resize(2 * (self.mask + 1))
+        self.items[(self.head + self.size) & self.mask] = value
+        self.size += 1
+
+    def push_front(self, value):
+        """⏱️ O(1) amortized"""
+        if self.size > self.mask:
+            self._resize(2 * (self.mask + 1))
+        self.head = (self.head - 1) & self.mask
+        self.items[self.head] = value
+        self.size += 1
+
+    # -----------------------------------------------------------
+    # 2️⃣ pop_front / pop_back
+    # -----------------------------------------------------------
+    def pop_front(self):
+        """⏱️ O(1) amortized"""
+        if self.size == 0:
+            raise IndexError("pop from empty RingDeque")
+        head = self.head
+        value = self.items[head]
+        self.items[head] = None             # drop reference for the GC
+        self.head = (head + 1) & self.mask
+        self.size -= 1
+        self._maybe_shrink()
+        return value
+
+    def pop_back(self):
+        """⏱️ O(1) amortized"""
+        if self.size == 0:
+            raise IndexError("pop from empty RingDeque")
+        self.size -= 1
+        slot = (self.head + self.size) & self.mask
+        value = self.items[slot]
+        self.items[slot] = None
+        self._maybe_shrink()
+        return value
+
+    # queue-style names used by the other files in this folder
+    enqueue = push_back
+    dequeue = pop_front
+
+    def peek_front(self):
+        if self.size == 0:
+            raise IndexError("peek from empty RingDeque")
+        return self.items[self.head]
+
+    def peek_back(self):
+        if self.size == 0:
+            raise IndexError("peek from empty RingDeque")
+        return self.items[(self.head + self.size - 1) & self.mask]
+
+    # -----------------------------------------------------------
+    # 3️⃣ O(1) random indexing
+    # -----------------------------------------------------------
+    def _slot(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("RingDeque index out of range")
+        return (self.head + index) & self.mask
+
+    def __getitem__(self, index):
+        """dq[i] — ⏱️ O(1) (collections.deque: O(n/64))"""
+        return self.items[self._slot(index)]
+
+    def __setitem__(self, index, value):
+        """⏱️ O(1)"""
+        self.items[self._slot(index)] = value
+
+    def __iter__(self):
+        items, mask, head = self.items, self.mask, self.head
+        for i in range(self.size):
+            yield items[(head + i) & mask]
+
+    def clear(self):
+        self.items = self.MIN_CAPACITY * [None]
+        self.mask = self.MIN_CAPACITY - 1
+        self.head = 0
+        self.size = 0
+
+    def __str__(self):
+        return " <-> ".join(str(v) for v in self) if self.size else "Empty RingDeque"
+
+
+# ---------------------------------------------------------------
+# ⏱️ BENCHMARK vs collections.deque
+# ---------------------------------------------------------------
+def _best(fn, repeat=3):
+    import time
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(sizes=(1_000, 100_000, 1_000_000), lookups=200_000):
+    import random
+    from collections import deque
+
+    print(f"{lookups:,} random reads from the middle half (dq[i]):")
+    print(f"  {'n':>10} {'deque':>10} {'RingDeque':>10}")
+    for n in sizes:
+        dq = deque(range(n))
+        rd = RingDeque(range(n))
+        rng = random.Random(n)
+        idx = [rng.randrange(n // 4, 3 * n // 4) for _ in range(lookups)]
+
+        def read_all(container):
+            def run():
+                for i in idx:
+                    container[i]
+            return run
+
+        t_dq = _best(read_all(dq))
+        t_rd = _best(read_all(rd))
+        print(f"  {n:>10,} {t_dq * 1e9 / lookups:>8.0f}ns {t_rd * 1e9 / lookups:>8.0f}ns")
+
+    ops = 1_000_000
+    print(f"\n{ops:,} push_back + {ops:,} pop_front (queue use):")
+
+    def deque_queue():
+        dq = deque()
+        for i in range(ops):
+            dq.append(i)
+        for _ in range(ops):
+            dq.popleft()
+
+    def ring_queue():
+        rd = RingDeque()
+        for i in range(ops):
+            rd.push_back(i)
+        for _ in range(ops):
+            rd.pop_front()
+
+    for name, fn in [("collections.deque", deque_queue), ("RingDeque", ring_queue)]:
+        secs = _best(fn, 1)
+        print(f"  {name:<18} {2 * ops / secs:>12,.0f} ops/s")
+
+
+# ---------------------------------------------------------------
+# ▶️ DEMONSTRATION
+# ---------------------------------------------------------------
+if __name__ == "__main__":
+    dq = RingDeque()
+    for v in range(1, 6):
+        dq.push_back(v)
+    dq.push_front(0)
+    dq.push_front(-1)
+    print("RingDeque:", dq)
+    print("dq[3] =", dq[3], "| dq[-1] =", dq[-1], "| head slot =", dq.head)
+    print("pop_front:", dq.pop_front(), "| pop_back:", dq.pop_back())
+    for v in range(6, 20):
+        dq.push_back(v)
+    print("after growing:", dq, "| capacity =", dq.capacity())
+    while len(dq) > 2:
+        dq.pop_front()
+    print("after shrinking:", dq, "| capacity =", dq.capacity())
+    print()
+    benchmark()
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITY
+# ---------------------------------------------------------------
+"""
+Operation                | RingDeque        | collections.deque
+----------------------------------------------------------------
+push/pop front & back    | O(1) amortized   | O(1)
+dq[i] / dq[i] = x        | O(1)             | O(min(i, n-i) / 64)
+resize (×2 or ÷2)        | O(n), one copy   | — (allocates 64-slot blocks)
+Space                    | ≤ 4n slots       | n slots + block links
+"""
@@ -0,0 +1,419 @@
+# note.py
+# ------------------------------------------------------
+# 📘 Hierarchical Timing Wheel (timer scheduler)
+# ✅ Topic: O(1) schedule / cancel, batch expiry with tick()/advance(),
+#           asyncio driver, benchmark vs a heapq scheduler at 10^6 timers
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+A heap scheduler (heapq) keeps timers ordered by deadline:
+    schedule → heappush  O(log n)
+    expire   → heappop   O(log n) per timer
+
+A TIMING WHEEL is the circular Queue (06_Implement_Circular_Queue_With_Capacity.py)
+turned into a clock face:
+
+    slots  → fixed-size circular array, one slot per tick
+    now    → the "start" pointer; every tick it moves one slot forward and
+             wraps around exactly like start = (start + 1) % maxSize
+    slot i → bucket of timers that expire when the pointer reaches i
+
+    schedule(delay) → append to slot (now + delay) % size        O(1)
+    tick()          → empty the slot under the pointer           O(1) + expired
+
+One wheel of 256 slots only covers 256 ticks. HIERARCHICAL wheels stack
+coarser wheels on top (like the hands of a clock):
+
+    level 0: 256 slots × 1 tick        covers          256 ticks
+    level 1:  64 slots × 256 ticks     covers       16,384 ticks
+    level 2:  64 slots × 16,384 ticks  covers    1,048,576 ticks
+    level 3:  64 slots × 2^20 ticks    covers   67,108,864 ticks
+    (timers further away wait in level 3 and are re-hashed each lap)
+
+When level 0 wraps around, the next slot of level 1 is CASCADED: its timers
+are re-inserted one level lower, closer to their exact tick. Each timer is
+moved at most once per level → O(1) amortized per timer.
+
+cancel(timer) only marks the timer; it is skipped when its slot is emptied
+→ O(1) and no search inside the slot.
+"""
+
+# ---------------------------------------------------------------
+# 🧱 VISUAL OVERVIEW (level 0 with 8 slots, level 1 with 4 slots)
+# ---------------------------------------------------------------
+"""
+level 0: 8 slots × 1 tick, level 1: 4 slots × 8 ticks        now = 5
+
+    level 0   slot:  0    1    2    3    4    5    6    7
+                   [  ] [  ] [  ] [  ] [  ] [  ] [T6] [  ]      T6: deadline 6
+                                             ↑now
+    level 1   slot:     0        1        2        3
+                   [      ] [ T12  ] [ T20  ] [      ]
+                    slot = (deadline >> 3) & 3 : T12 → 1, T20 → 2
+
+tick → 6 : level-0 slot 6 emptied → [T6.item] returned
+tick → 8 : level 0 wrapped → cascade level-1 slot 1:
+           T12 moves to level-0 slot 12 & 7 = 4 → fires at tick 12
+tick → 16: cascade level-1 slot 2: T20 → level-0 slot 4 → fires at tick 20
+"""
+
+import asyncio
+import math
+
+
+# ---------------------------------------------------------------
+# 🧩 TIMER HANDLE
+# ---------------------------------------------------------------
+class Timer:
+    __slots__ = ("deadline", "item", "state")
+
+    PENDING, FIRED, CANCELLED = 0, 1, 2
+
+    def __init__(self, deadline, item):
+        self.deadline = deadline
+        self.item = item
+        self.state = Timer.PENDING
+
+    def __repr__(self):
+        state = ("pending", "fired", "cancelled")[self.state]
+        return f"Timer(deadline={self.deadline}, item={self.item!r}, {state})"
+
+
+# ---------------------------------------------------------------
+# 🧩 CLASS IMPLEMENTATION
+# ---------------------------------------------------------------
+class TimingWheel:
+    def __init__(self, level_bits=(8, 6, 6, 6), now=0):
+        """
+        level_bits: log2(slots) of each level, finest first
+        now       : starting tick (integer)
+
+        ⏱️ O(total slots) | 💾 O(total slots + timers)
+        """
+        self.now = now
+        self.level_bits = level_bits
+        self.shifts = []
+        shift = 0
+        for bits in level_bits:
+            self.shifts.append(shift)
+            shift += bits
+        self.masks = [(1 << bits) - 1 for bits in level_bits]
+        # upper bound of `deadline - now` for each level
+        self.limits = [1 << (s + b) for s, b in zip(self.shifts, level_bits)]
+        self.slots = [[[] for _ in range(1 << bits)] for bits in level_bits]
+        self.count = 0              # pending (not cancelled, not fired) timers
+
+    def __len__(self):
+        return self.count
+
+    # -----------------------------------------------------------
+    # Insert a timer into the right level / slot
+    # -----------------------------------------------------------
+    def _insert(self, timer):
+        deadline = timer.deadline
+        delta = deadline - self.now
+        for level, limit in enumerate(self.limits):
+            if delta < limit:
+                break
+        # (falls through to the top level for very distant deadlines)
+        self.slots[level][(deadline >> self.shifts[level]) & self.masks[level]].append(timer)
+
+    # -----------------------------------------------------------
+    # 1️⃣ schedule(delay, item) / schedule_at(deadline, item)
+    # -----------------------------------------------------------
+    def schedule(self, delay, item):
+        """
+        Fire `item` after `delay` ticks (delay < 1 → next tick).
+        A float delay is rounded UP (2.3 → 3): a timer never fires early.
+        Returns a Timer handle for cancel(). ⏱️ O(1)
+        """
+        delay = math.ceil(delay)
+        return self.schedule_at(self.now + (delay if delay > 0 else 1), item)
+
+    def schedule_at(self, deadline, item):
+        """
+        Fire `item` at tick `deadline` (a float is rounded UP; past → next tick).
+        ⏱️ O(1) — _insert() inlined: this is the hot path
+        """
+        deadline = math.ceil(deadline)      # slots are picked with >> and &: ints only
+        now = self.now
+        if deadline <= now:
+            deadline = now + 1
+        timer = Timer(deadline, item)
+        delta = deadline - now
+        level = 0
+        for limit in self.limits:
+            if delta < limit:
+                break
+            level += 1
+        else:
+            level -= 1
+        self.slots[level][(deadline >> self.shifts[level]) & self.masks[level]].append(timer)
+        self.count += 1
+        return timer
+
+    # -----------------------------------------------------------
+    # 2️⃣ cancel(timer)
+    # -----------------------------------------------------------
+    def cancel(self, timer):
+        """
+        Mark the timer cancelled; it is dropped when its slot is processed.
+        Returns False if it already fired or was cancelled. ⏱️ O(1)
+        """
+        if timer.state != Timer.PENDING:
+            return False
+        timer.state = Timer.CANCELLED
+        timer.item = None
+        self.count -= 1
+        return True
+
+    # -----------------------------------------------------------
+    # 3️⃣ tick() / advance(now)
+    # -----------------------------------------------------------
+    def _cascade(self, level):
+        """Empty the current slot of `level` and re-insert its timers lower."""
+        index = (self.now >> self.shifts[level]) & self.masks[level]
+        bucket = self.slots[level][index]
+        if bucket:
+            self.slots[level][index] = []
+            insert = self._insert
+            for timer in bucket:
+                if timer.state == Timer.PENDING:
+                    insert(timer)
+
+    def _step(self, expired):
+        """Move to the next tick and collect what expires there."""
+        self.now += 1
+        now = self.now
+        mask0 = self.masks[0]
+        if now & mask0 == 0 and len(self.shifts) > 1:
+            # level 0 wrapped → cascade from the highest level that wrapped too
+            top = 1
+            while top < len(self.shifts) - 1 and now & ((1 << self.shifts[top + 1]) - 1) == 0:
+                top += 1
+            for level in range(top, 0, -1):
+                self._cascade(level)
+        slots0 = self.slots[0]
+        bucket = slots0[now & mask0]
+        if bucket:
+            slots0[now & mask0] = []
+            pending = Timer.PENDING
+            fired = Timer.FIRED
+            for timer in bucket:
+                if timer.state == pending:
+                    if timer.deadline > now:        # single-level wheel: a later lap
+                        self._insert(timer)
+                        continue
+                    timer.state = fired
+                    expired.append(timer.item)
+                    self.count -= 1
+
+    def tick(self):
+        """Advance one tick. Returns the list of expired items. ⏱️ O(1) + O(expired)"""
+        return self.advance(self.now + 1)
+
+    def advance(self, now):
+        """
+        Advance the clock to tick `now`; return every item that expired
+        on the way, in deadline order (batch).
+        A float `now` is rounded DOWN (tick 7.9 has not reached tick 8 yet).
+        ⏱️ O(ticks passed + expired); jumps straight to `now` when no timer is pending
+        """
+        now = math.floor(now)
+        expired = []
+        while self.now < now:
+            if self.count == 0:
+                self._jump(now)
+                break
+            self._step(expired)
+        return expired
+
+    def _jump(self, now):
+        """No pending timers: drop cancelled leftovers and move the clock."""
+        for level in self.slots:
+            for i, bucket in enumerate(level):
+                if bucket:
+                    level[i] = []
+        self.now = now
+
+
+# ---------------------------------------------------------------
+# 🧩 ASYNCIO DRIVER
+# ---------------------------------------------------------------
+class AsyncTimingWheel:
+    """
+    Drives a TimingWheel from an asyncio loop.
+        resolution : seconds per tick
+        call_later(delay_seconds, callback, *args) → Timer
+        await sleep(delay_seconds)
+    """
+
+    def __init__(self, resolution=0.01, level_bits=(8, 6, 6, 6)):
+        self.resolution = resolution
+        self.wheel = TimingWheel(level_bits)
+        self._origin = None
+        self._task = None
+
+    def _ticks(self, seconds):
+        return max(1, round(seconds / self.resolution))
+
+    def call_later(self, delay, callback, *args):
+        """⏱️ O(1)"""
+        return self.wheel.schedule(self._ticks(delay), (callback, args))
+
+    def cancel(self, timer):
+        return self.wheel.cancel(timer)
+
+    async def sleep(self, delay):
+        fut = asyncio.get_running_loop().create_future()
+
+        def wake():
+            if not fut.done():
+                fut.set_result(None)
+
+        timer = self.call_later(delay, wake)
+        try:
+            await fut
+        finally:
+            self.wheel.cancel(timer)
+
+    def start(self):
+        loop = asyncio.get_running_loop()
+        self._origin = loop.time() - self.wheel.now * self.resolution
+        self._task = loop.create_task(self._run(loop))
+
+    async def _run(self, loop):
+        while True:
+            await asyncio.sleep(self.resolution)
+            now = int((loop.time() - self._origin) / self.resolution)
+            for callback, args in self.wheel.advance(now):
+                callback(*args)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# ---------------------------------------------------------------
+# ⏱️ BENCHMARK vs heapq at 10^6 timers
+# ---------------------------------------------------------------
+class HeapScheduler:
+    """Reference scheduler: heapq of (deadline, seq, timer), lazy cancel."""
+
+    def __init__(self):
+        self.heap = []
+        self.now = 0
+        self.seq = 0
+
+    def schedule(self, delay, item):
+        import heapq
+
+        timer = Timer(self.now + max(1, int(delay)), item)
+        self.seq += 1
+        heapq.heappush(self.heap, (timer.deadline, self.seq, timer))
+        return timer
+
+    def cancel(self, timer):
+        if timer.state != Timer.PENDING:
+            return False
+        timer.state = Timer.CANCELLED
+        return True
+
+    def advance(self, now):
+        import heapq
+
+        heap, expired = self.heap, []
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if timer.state == Timer.PENDING:
+                timer.state = Timer.FIRED
+                expired.append(timer.item)
+        self.now = now
+        return expired
+
+
+def benchmark(n=1_000_000, horizon=100_000, cancel_every=10, step=1):
+    import random
+    import time
+
+    rng = random.Random(42)
+    delays = [rng.randrange(1, horizon) for _ in range(n)]
+    print(f"{n:,} timers, delays 1..{horizon:,} ticks, cancel 1 in {cancel_every}, advance by {step}:")
+    results = {}
+    for name, make in [("heapq scheduler", HeapScheduler), ("TimingWheel", TimingWheel)]:
+        sched = make()
+        start = time.perf_counter()
+        schedule = sched.schedule
+        timers = [schedule(d, i) for i, d in enumerate(delays)]
+        t_schedule = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cancel = sched.cancel
+        for timer in timers[::cancel_every]:
+            cancel(timer)
+        t_cancel = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fired = 0
+        advance = sched.advance
+        for now in range(step, horizon + step, step):
+            fired += len(advance(now))
+        t_expire = time.perf_counter() - start
+        results[name] = fired
+        print(f"  {name:<16} schedule {t_schedule:5.2f}s  cancel {t_cancel:5.2f}s  "
+              f"expire {t_expire:5.2f}s  total {t_schedule + t_cancel + t_expire:5.2f}s  "
+              f"({fired:,} fired)")
+    assert len(set(results.values())) == 1
+
+
+# ---------------------------------------------------------------
+# ▶️ DEMONSTRATION
+# ---------------------------------------------------------------
+async def async_demo():
+    wheel = AsyncTimingWheel(resolution=0.005)
+    wheel.start()
+    log = []
+    wheel.call_later(0.03, log.append, "30 ms")
+    wheel.call_later(0.01, log.append, "10 ms")
+    doomed = wheel.call_later(0.02, log.append, "cancelled")
+    wheel.cancel(doomed)
+    await wheel.sleep(0.05)
+    await wheel.stop()
+    print("asyncio driver fired:", log)
+
+
+if __name__ == "__main__":
+    tw = TimingWheel(level_bits=(3, 2, 2))          # tiny wheel: 8 × 4 × 4 slots
+    a = tw.schedule(3, "A")
+    tw.schedule(20, "B")
+    c = tw.schedule(5, "C")
+    tw.schedule(200, "far")                          # beyond 128 ticks → re-hashed
+    print("cancel C:", tw.cancel(c), "| pending:", len(tw))
+    print("tick x3:", [tw.tick() for _ in range(3)], "| A:", a)
+    print("advance(25):", tw.advance(25))
+    print("advance(300):", tw.advance(300), "| pending:", len(tw))
+
+    asyncio.run(async_demo())
+    print()
+    benchmark()
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITY
+# ---------------------------------------------------------------
+"""
+Operation            | TimingWheel                 | heapq scheduler
+--------------------------------------------------------------------------
+schedule             | O(1)                        | O(log n)
+cancel               | O(1) (lazy mark)            | O(1) lazy / O(log n) real
+tick / advance       | O(ticks + expired),         | O(expired · log n)
+                     | + O(levels) cascades/timer  |
+Space                | O(slots + timers)           | O(timers)
+"""
@@ -0,0 +1,345 @@
+# note.py
+# ------------------------------------------------------
+# 📘 Work-Stealing Deque & Executor
+# ✅ Topic: per-worker deques (owner LIFO, thieves FIFO), submit/map/join,
+#           helping while waiting, contention benchmark vs concurrent.futures
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+ThreadPoolExecutor (and a hand-made pool on queue.Queue, 11_Python_Queue_Module.py)
+has ONE shared queue:
+
+    submit ──► [ shared queue.Queue ] ──► worker 1, worker 2, worker 3 ...
+                  ↑ one lock + condition, taken by EVERY put and get
+
+With many tiny tasks, that lock is the bottleneck.
+
+WORK STEALING gives every worker its OWN deque:
+
+    worker 1: [t1 t2 t3 t4]   owner pushes / pops at the RIGHT  (LIFO)
+    worker 2: [t9]            ─► hot in cache, depth-first recursion
+    worker 3: []              idle → STEAL from the LEFT of a victim (FIFO)
+                              ─► takes the OLDEST task = usually the biggest
+                                 chunk of a divide-and-conquer job
+
+    • owner and thief work at opposite ends → they rarely collide
+    • a task submitted FROM a worker goes to that worker's own deque
+    • tasks submitted from outside go to an injection deque
+
+Each per-worker deque is a collections.deque: append / pop / popleft are
+single atomic operations under CPython's GIL, so no lock is taken on the
+hot path (a C / Java work-stealing deque needs the Chase-Lev CAS protocol).
+
+Waiting inside a task (divide and conquer):
+    executor.wait_for(future)  → while the child is not done, the waiting
+    worker RUNS other tasks instead of blocking. Recursive jobs therefore
+    never dead-lock, even with 1 worker (ThreadPoolExecutor would).
+"""
+
+# ---------------------------------------------------------------
+# 🧱 VISUAL: one steal
+# ---------------------------------------------------------------
+"""
+    worker 1 deque:   left → [ sort(0..512) | sort(512..768) | sort(768..896) ] ← right
+                                   ↑                                   ↑
+                        thief: popleft()                    owner: pop()
+                        (biggest, oldest)                   (smallest, newest)
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+
+# ---------------------------------------------------------------
+# 🧩 WORK-STEALING DEQUE
+# ---------------------------------------------------------------
+class WorkStealingDeque:
+    """One worker's task deque. Owner: push / pop (LIFO). Thieves: steal (FIFO)."""
+
+    def __init__(self):
+        self.tasks = deque()
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def push(self, task):
+        """Owner only. ⏱️ O(1)"""
+        self.tasks.append(task)
+
+    def pop(self):
+        """Owner only: newest task or None. ⏱️ O(1)"""
+        try:
+            return self.tasks.pop()
+        except IndexError:
+            return None
+
+    def steal(self):
+        """Any thread: oldest task or None. ⏱️ O(1)"""
+        try:
+            return self.tasks.popleft()
+        except IndexError:
+            return None
+
+
+class _Worker:
+    def __init__(self, index):
+        self.index = index
+        self.deque = WorkStealingDeque()
+        self.submitted = 0          # tasks this worker pushed (written by owner only)
+        self.completed = 0          # tasks this worker ran   (written by owner only)
+        self.steals = 0
+        self.thread = None
+
+
+# ---------------------------------------------------------------
+# 🧩 EXECUTOR
+# ---------------------------------------------------------------
+class WorkStealingExecutor:
+    def __init__(self, max_workers=4):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self.workers = [_Worker(i) for i in range(max_workers)]
+        self.injection = deque()            # tasks submitted from outside
+        self._external = 0                  # guarded by _submit_lock
+        self._submit_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._sleepers = 0
+        self._shutdown = False
+        self._local = threading.local()
+        for worker in self.workers:
+            worker.thread = threading.Thread(target=self._worker_loop, args=(worker,), daemon=True)
+            worker.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    # -----------------------------------------------------------
+    # 1️⃣ submit(fn, *args, **kwargs) → Future
+    # -----------------------------------------------------------
+    def submit(self, fn, *args, **kwargs):
+        """
+        From a worker thread → that worker's own deque (no lock).
+        From any other thread → the injection deque (short lock for the counter).
+        ⏱️ O(1)
+        """
+        if self._shutdown:
+            raise RuntimeError("cannot submit after shutdown")
+        future = Future()
+        task = (fn, args, kwargs, future)
+        worker = getattr(self._local, "worker", None)
+        if worker is not None:
+            worker.submitted += 1           # count BEFORE the task becomes visible
+            worker.deque.push(task)
+        else:
+            with self._submit_lock:
+                self._external += 1
+            self.injection.append(task)
+        if self._sleepers:
+            with self._cond:
+                self._cond.notify()
+        return future
+
+    # -----------------------------------------------------------
+    # 2️⃣ map(fn, *iterables) → results in input order
+    # -----------------------------------------------------------
+    def map(self, fn, *iterables):
+        """Submits everything NOW (like Executor.map); results are yielded lazily."""
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+
+        def results():
+            for future in futures:
+                yield self.wait_for(future)
+
+        return results()
+
+    # -----------------------------------------------------------
+    # 3️⃣ wait_for(future) — help instead of blocking
+    # -----------------------------------------------------------
+    def wait_for(self, future):
+        """
+        Return future.result(). Inside a worker, run other tasks meanwhile,
+        so recursive jobs cannot dead-lock the pool.
+        """
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            return future.result()
+        while not future.done():
+            task = self._find_task(worker)
+            if task is None:
+                time.sleep(0)               # let the thread holding the child run
+            else:
+                self._run(worker, task)
+        return future.result()
+
+    # -----------------------------------------------------------
+    # 4️⃣ join() — wait until every submitted task has finished
+    # -----------------------------------------------------------
+    def _quiescent(self):
+        # completed is read FIRST: completed ⊆ submitted-at-that-moment,
+        # so completed == submitted(read later) ⇒ nothing was pending
+        completed = sum(w.completed for w in self.workers)
+        submitted = self._external + sum(w.submitted for w in self.workers)
+        return completed == submitted
+
+    def join(self):
+        delay = 0.0001
+        while not self._quiescent():
+            time.sleep(delay)
+            delay = min(delay * 2, 0.005)
+
+    def shutdown(self, wait=True):
+        if wait:
+            self.join()
+        self._shutdown = True
+        with self._cond:
+            self._cond.notify_all()
+        if wait:
+            for worker in self.workers:
+                worker.thread.join()
+
+    def stats(self):
+        return {"completed": [w.completed for w in self.workers],
+                "steals": [w.steals for w in self.workers]}
+
+    # -----------------------------------------------------------
+    # Worker internals
+    # -----------------------------------------------------------
+    def _find_task(self, worker):
+        task = worker.deque.pop()                   # 1. own deque, newest first
+        if task is not None:
+            return task
+        try:
+            return self.injection.popleft()         # 2. work from outside
+        except IndexError:
+            pass
+        workers = self.workers
+        n = len(workers)
+        start = random.randrange(n)
+        for k in range(n):                          # 3. steal the oldest task
+            victim = workers[(start + k) % n]
+            if victim is not worker:
+                task = victim.deque.steal()
+                if task is not None:
+                    worker.steals += 1
+                    return task
+        return None
+
+    def _run(self, worker, task):
+        fn, args, kwargs, future = task
+        if future.set_running_or_notify_cancel():
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+        worker.completed += 1
+
+    def _worker_loop(self, worker):
+        self._local.worker = worker
+        idle_spins = 0
+        while True:
+            task = self._find_task(worker)
+            if task is not None:
+                idle_spins = 0
+                self._run(worker, task)
+                continue
+            if self._shutdown:
+                return
+            idle_spins += 1
+            if idle_spins < 3:
+                time.sleep(0)
+                continue
+            with self._cond:
+                self._sleepers += 1
+                self._cond.wait(0.005)              # timeout: no lost-wakeup risk
+                self._sleepers -= 1
+
+
+# ---------------------------------------------------------------
+# ⏱️ CONTENTION BENCHMARK vs concurrent.futures
+# ---------------------------------------------------------------
+def _tiny(x):
+    return x + 1
+
+
+def parallel_sum(executor, lo, hi, cutoff=2_000):
+    """Divide and conquer: split the range, sum halves on the pool."""
+    if hi - lo <= cutoff:
+        return sum(range(lo, hi))
+    mid = (lo + hi) // 2
+    right = executor.submit(parallel_sum, executor, mid, hi, cutoff)
+    left = parallel_sum(executor, lo, mid, cutoff)
+    return left + executor.wait_for(right)
+
+
+def benchmark(tasks=100_000, worker_counts=(1, 2, 4, 8)):
+    from concurrent.futures import ThreadPoolExecutor
+
+    print(f"{tasks:,} fine-grained tasks (x + 1) via map():")
+    print(f"  {'workers':>7} {'ThreadPoolExecutor':>20} {'WorkStealingExecutor':>22}")
+    for workers in worker_counts:
+        with ThreadPoolExecutor(workers) as tpe:
+            start = time.perf_counter()
+            assert sum(tpe.map(_tiny, range(tasks))) == tasks * (tasks + 1) // 2
+            t_tpe = time.perf_counter() - start
+        with WorkStealingExecutor(workers) as wse:
+            start = time.perf_counter()
+            assert sum(wse.map(_tiny, range(tasks))) == tasks * (tasks + 1) // 2
+            t_wse = time.perf_counter() - start
+        print(f"  {workers:>7} {tasks / t_tpe:>14,.0f} /s   {tasks / t_wse:>16,.0f} /s")
+
+    n = 20_000_000
+    print(f"\nRecursive parallel_sum(0..{n:,}), cutoff 2,000 "
+          f"(ThreadPoolExecutor would dead-lock on nested waits):")
+    start = time.perf_counter()
+    expected = sum(range(n))
+    print(f"  {'sequential':<12} {time.perf_counter() - start:>6.2f}s")
+    for workers in worker_counts:
+        with WorkStealingExecutor(workers) as wse:
+            start = time.perf_counter()
+            assert wse.submit(parallel_sum, wse, 0, n).result() == expected
+            secs = time.perf_counter() - start
+            steals = sum(wse.stats()["steals"])
+        print(f"  {workers:>2} workers   {secs:>6.2f}s  steals {steals:,}")
+
+
+# ---------------------------------------------------------------
+# ▶️ DEMONSTRATION
+# ---------------------------------------------------------------
+if __name__ == "__main__":
+    with WorkStealingExecutor(max_workers=3) as ex:
+        f = ex.submit(pow, 2, 10)
+        print("submit(pow, 2, 10) ->", f.result())
+        print("map(square) ->", list(ex.map(lambda x: x * x, range(8))))
+        print("parallel_sum(0..1e6) ->", ex.submit(parallel_sum, ex, 0, 1_000_000).result())
+        for i in range(1000):
+            ex.submit(_tiny, i)
+        ex.join()
+        print("after join, per-worker completed:", ex.stats()["completed"])
+    print()
+    benchmark()
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITY
+# ---------------------------------------------------------------
+"""
+Operation                 | Time   | Contention
+-----------------------------------------------------------------------
+submit (inside a worker)  | O(1)   | none: owner's own deque
+submit (outside)          | O(1)   | short counter lock + injection deque
+pop (owner, LIFO)         | O(1)   | none unless the deque holds 1 task
+steal (thief, FIFO)       | O(1)   | only with thieves on the same victim
+wait_for(future)          | —      | runs other tasks instead of blocking
+join                      | O(workers) per check
+Space                     | O(tasks + workers)
+"""
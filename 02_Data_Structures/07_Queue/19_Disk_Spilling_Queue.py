@@ -0,0 +1,529 @@
+# note.py
+# ------------------------------------------------------
+# 📘 Disk-Spilling Persistent Queue (mmap segment files)
+# ✅ Topic: bounded in-memory head/tail, append-only length-prefixed records,
+#           batch enqueue/dequeue, crash-safe read offsets, segment recycling
+# ------------------------------------------------------
+
+"""
+📌 INTRODUCTION
+
+08_Implement_Queue_Using_Linked_List.py keeps EVERY element as a Node in RAM.
+If producers are faster than consumers, the linked list grows until the
+process runs out of memory.
+
+DiskQueue keeps only a BOUNDED number of items in memory:
+
+    ┌──────────────┐   ┌───────────────────────────────┐   ┌──────────────┐
+    │ head (deque) │ ← │ segment files on disk (mmap)  │ ← │ tail (list)  │
+    │ ≤ memory_items│   │ 001.seg  002.seg  003.seg ... │   │ ≤ memory_items│
+    └──────────────┘   └───────────────────────────────┘   └──────────────┘
+       dequeue side         overflow, append-only             enqueue side
+
+    • consumer keeps up → items never touch the disk (head only)
+    • consumer falls behind → the tail is written to disk in ONE batch
+      whenever it holds memory_items items → RAM stays bounded
+    • head runs empty → read up to memory_items records back from disk
+
+Segment file = fixed-size file, memory-mapped, written append-only:
+
+    +----------------+------------------------+------------------------+----------+
+    | "DSKQSEG1" | id | len+1 | crc | payload  | len+1 | crc | payload  | 0 0 0 0  |
+    +----------------+------------------------+------------------------+----------+
+      file header       record                  record                   end mark
+
+    • len+1 = 0 marks "no more records in this segment"
+    • crc = crc32(payload) seeded with the segment id → a torn write or a
+      stale record from a recycled file fails the check and ends the scan
+
+Crash-safe read offset:
+    The file `offset` stores (segment id, byte offset) just past the last
+    CONSUMED record. It is rewritten via a temp file + os.replace (atomic),
+    every `checkpoint_every` dequeues and on close(). After a crash the
+    queue re-delivers the records consumed since the last checkpoint
+    (at-least-once), never loses a spilled record. Items that were only
+    in memory (never spilled) are lost on a crash; close() spills them.
+
+Segment recycling:
+    Once the committed offset moves past a segment, its file is renamed
+    into a small free pool and reused for the next segment instead of
+    allocating a new file (no unlink/create churn, page cache stays warm).
+"""
+
+# ---------------------------------------------------------------
+# 🧱 VISUAL OVERVIEW
+# ---------------------------------------------------------------
+"""
+memory_items = 3, consumer stopped:
+
+    enqueue 1 2 3          head [1 2 3]                  disk []        tail []
+    enqueue 4 5 6          head [1 2 3]                  disk []        tail [4 5 6] → spill!
+                           head [1 2 3]                  disk [4 5 6]   tail []
+    dequeue ×3 → 1 2 3     head []                       disk [4 5 6]
+    dequeue    → refill    head [4 5 6] (positions kept) disk []        → 4
+    commit()               offset file = (seg 1, just past record 4)
+"""
+
+import os
+import pickle
+import struct
+import zlib
+from collections import deque
+from mmap import mmap
+
+_MAGIC = b"DSKQSEG1"
+_FILE_HEADER = struct.Struct("<8sQ")        # magic, segment id
+_RECORD = struct.Struct("<II")              # payload length + 1, crc32
+_OFFSET = struct.Struct("<QQI")             # segment id, offset, crc32 of both
+_END_MARK = bytes(_RECORD.size)
+_FREE_POOL = 2                              # recycled files kept for reuse
+
+
+# ---------------------------------------------------------------
+# 🧩 CLASS IMPLEMENTATION
+# ---------------------------------------------------------------
+class DiskQueue:
+    def __init__(self, directory, memory_items=10_000, segment_size=64 * 2**20,
+                 checkpoint_every=1024, fsync=False,
+                 dumps=pickle.dumps, loads=pickle.loads):
+        """
+        Args:
+            directory (str): folder for segment files and the offset file
+            memory_items (int): max items in the head AND in the tail
+            segment_size (int): bytes per segment file
+            checkpoint_every (int): dequeues of spilled items between offset commits
+            fsync (bool): flush mmap pages / offset file to the device (slower)
+            dumps / loads: item → bytes → item (pickle by default)
+        ⏱️ O(spilled records) to re-scan the backlog on open
+        """
+        if memory_items <= 0:
+            raise ValueError("memory_items must be positive")
+        self.directory = directory
+        self.memory_items = memory_items
+        self.segment_size = segment_size
+        self.checkpoint_every = checkpoint_every
+        self.fsync = fsync
+        self.dumps = dumps
+        self.loads = loads
+        self.head = deque()             # (item, position after it on disk or None)
+        self.tail = []                  # items not yet spilled
+        self.disk_count = 0             # spilled records not yet read into head
+        self.segments = deque()         # live segment ids, oldest first
+        self._rmap = self._wmap = None
+        self._uncommitted = 0
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    # -----------------------------------------------------------
+    # Files
+    # -----------------------------------------------------------
+    def _path(self, seg):
+        return os.path.join(self.directory, f"{seg:016d}.seg")
+
+    def _free_files(self):
+        return sorted(n for n in os.listdir(self.directory) if n.endswith(".free"))
+
+    def _map(self, seg):
+        with open(self._path(seg), "r+b") as f:
+            return mmap(f.fileno(), 0)
+
+    def _new_segment(self, need):
+        """Create (or recycle) the next segment; it becomes the write segment."""
+        seg = self._next_id
+        self._next_id += 1
+        size = max(self.segment_size, _FILE_HEADER.size + need + _RECORD.size)
+        path = self._path(seg)
+        free = self._free_files()
+        if free and size == self.segment_size:
+            os.replace(os.path.join(self.directory, free[0]), path)
+        else:
+            with open(path, "wb") as f:
+                f.truncate(size)                    # sparse file, reads as zeros
+        if self._wmap is not None:
+            self._wmap.close()
+        self._wmap = self._map(seg)
+        _FILE_HEADER.pack_into(self._wmap, 0, _MAGIC, seg)
+        self._wmap[_FILE_HEADER.size:_FILE_HEADER.size + _RECORD.size] = _END_MARK
+        self._wseg, self._woff = seg, _FILE_HEADER.size
+        self.segments.append(seg)
+        if self._rseg is None:                      # first segment ever
+            self._rseg, self._roff = seg, _FILE_HEADER.size
+            self._cseg, self._coff = seg, _FILE_HEADER.size
+
+    @staticmethod
+    def _read_at(mm, seg, off):
+        """Decode the record at `off` → (payload, next offset), or None at the end."""
+        if off + _RECORD.size > len(mm):
+            return None
+        n1, crc = _RECORD.unpack_from(mm, off)
+        start = off + _RECORD.size
+        end = start + n1 - 1
+        if n1 == 0 or end > len(mm):
+            return None
+        payload = mm[start:end]
+        if zlib.crc32(payload, seg & 0xFFFFFFFF) != crc:
+            return None                             # torn or stale record
+        return payload, end
+
+    # -----------------------------------------------------------
+    # Recovery: committed offset → re-scan the backlog
+    # -----------------------------------------------------------
+    def _read_offset(self):
+        try:
+            with open(os.path.join(self.directory, "offset"), "rb") as f:
+                seg, off, crc = _OFFSET.unpack(f.read(_OFFSET.size))
+        except (OSError, struct.error):
+            return None
+        if zlib.crc32(struct.pack("<QQ", seg, off)) != crc:
+            return None
+        return seg, off
+
+    def _recover(self):
+        ids = sorted(int(n[:-4]) for n in os.listdir(self.directory) if n.endswith(".seg"))
+        committed = self._read_offset()
+        if committed is not None and committed[0] in ids:
+            self._cseg, self._coff = committed
+        elif ids:
+            self._cseg, self._coff = ids[0], _FILE_HEADER.size
+        else:
+            self._cseg = self._coff = None
+        self._next_id = max(ids + [committed[0] if committed else 0]) + 1
+        self._rseg, self._roff = self._cseg, self._coff
+        self._wseg = self._woff = None
+        for seg in ids:
+            if seg < self._cseg:
+                self._recycle(seg)                  # consumed before the crash
+            else:
+                self.segments.append(seg)
+        # count the backlog and find where writing resumes
+        for seg in self.segments:
+            mm = self._map(seg)
+            off = self._coff if seg == self._cseg else _FILE_HEADER.size
+            while True:
+                record = self._read_at(mm, seg, off)
+                if record is None:
+                    break
+                off = record[1]
+                self.disk_count += 1
+            if seg == self.segments[-1]:
+                self._wmap, self._wseg, self._woff = mm, seg, off
+            else:
+                mm.close()
+
+    # -----------------------------------------------------------
+    # 1️⃣ enqueue / enqueue_many
+    # -----------------------------------------------------------
+    def enqueue(self, item):
+        """⏱️ O(1) amortized (a spill writes memory_items records in one pass)"""
+        if not self.disk_count and not self.tail and len(self.head) < self.memory_items:
+            self.head.append((item, None))          # consumer keeps up → RAM only
+            return
+        self.tail.append(item)
+        if len(self.tail) >= self.memory_items:
+            self._spill()
+
+    def enqueue_many(self, items):
+        """⏱️ O(k)"""
+        items = list(items)
+        start = 0
+        if not self.disk_count and not self.tail:
+            start = max(0, self.memory_items - len(self.head))
+            self.head.extend((item, None) for item in items[:start])
+        if start < len(items):
+            self.tail.extend(items[start:])
+            if len(self.tail) >= self.memory_items:
+                self._spill()
+
+    # -----------------------------------------------------------
+    # 2️⃣ spill: tail → segment files, one memcpy per segment
+    # -----------------------------------------------------------
+    def _write(self, items):
+        """Append items as records; return the position after each one."""
+        dumps, crc32, pack = self.dumps, zlib.crc32, _RECORD.pack
+        positions = []
+        buf = bytearray()
+        seg, off = self._wseg, self._woff
+        limit = len(self._wmap) - _RECORD.size if self._wmap is not None else 0
+        for item in items:
+            payload = dumps(item)
+            need = _RECORD.size + len(payload)
+            if seg is None or off + len(buf) + need > limit:
+                if buf:
+                    self._wmap[off:off + len(buf)] = buf
+                    off += len(buf)
+                    buf = bytearray()
+                    self._flush_segment(off)
+                self._new_segment(need)
+                seg, off = self._wseg, self._woff
+                limit = len(self._wmap) - _RECORD.size
+            buf += pack(len(payload) + 1, crc32(payload, seg & 0xFFFFFFFF))
+            buf += payload
+            positions.append((seg, off + len(buf)))
+        if buf:
+            self._wmap[off:off + len(buf)] = buf
+            off += len(buf)
+        self._flush_segment(off)
+        return positions
+
+    def _flush_segment(self, off):
+        self._wmap[off:off + _RECORD.size] = _END_MARK   # limit keeps room for it
+        self._woff = off
+        if self.fsync:
+            self._wmap.flush()
+
+    def _spill(self):
+        """
+        Write the tail to disk. If the disk was empty, the RAM-only items at
+        the end of the head are written FIRST, so that disk order stays
+        head → disk → tail and close() never has to insert in the middle.
+        """
+        if not self.disk_count:
+            ram_only = []
+            while self.head and self.head[-1][1] is None:
+                ram_only.append(self.head.pop()[0])
+            ram_only.reverse()
+            if ram_only:
+                positions = self._write(ram_only)
+                self.head.extend(zip(ram_only, positions))
+                if self._rmap is not None:
+                    self._rmap.close()
+                    self._rmap = None
+                self._rseg, self._roff = positions[-1]      # already in head
+        if self.tail:
+            self._write(self.tail)
+            self.disk_count += len(self.tail)
+            self.tail = []
+
+    # -----------------------------------------------------------
+    # 3️⃣ dequeue / dequeue_many / peek
+    # -----------------------------------------------------------
+    def _refill(self):
+        """Head is empty: read up to memory_items records from disk, else take the tail."""
+        if self.disk_count:
+            loads, read_at, head = self.loads, self._read_at, self.head
+            seg, off = self._rseg, self._roff
+            mm = self._rmap
+            if mm is None:
+                mm = self._map(seg)
+            for _ in range(min(self.disk_count, self.memory_items)):
+                record = read_at(mm, seg, off)
+                while record is None:                   # end of segment → next one
+                    mm.close()
+                    seg, off = seg + 1, _FILE_HEADER.size
+                    mm = self._map(seg)
+                    record = read_at(mm, seg, off)
+                payload, off = record
+                head.append((loads(payload), (seg, off)))
+            self.disk_count -= len(head)
+            self._rmap, self._rseg, self._roff = mm, seg, off
+        elif self.tail:
+            self.head.extend((item, None) for item in self.tail)
+            self.tail = []
+
+    def _consumed(self, position, count):
+        self._cseg, self._coff = position
+        self._uncommitted += count
+        if self._uncommitted >= self.checkpoint_every:
+            self.commit()
+
+    def dequeue(self):
+        """⏱️ O(1) amortized. Raises IndexError when empty."""
+        if not self.head:
+            self._refill()
+            if not self.head:
+                raise IndexError("dequeue from empty DiskQueue")
+        item, position = self.head.popleft()
+        if position is not None:
+            self._consumed(position, 1)
+        return item
+
+    def dequeue_many(self, max_items):
+        """Up to max_items items (fewer if the queue runs out). ⏱️ O(k)"""
+        out = []
+        last = None
+        while len(out) < max_items:
+            if not self.head:
+                self._refill()
+                if not self.head:
+                    break
+            head = self.head
+            for _ in range(min(max_items - len(out), len(head))):
+                item, position = head.popleft()
+                out.append(item)
+                if position is not None:
+                    last = position
+        if last is not None:
+            self._consumed(last, len(out))
+        return out
+
+    def peek(self):
+        if not self.head:
+            self._refill()
+            if not self.head:
+                raise IndexError("peek from empty DiskQueue")
+        return self.head[0][0]
+
+    def __len__(self):
+        return len(self.head) + self.disk_count + len(self.tail)
+
+    def isEmpty(self):
+        return len(self) == 0
+
+    # -----------------------------------------------------------
+    # 4️⃣ commit — crash-safe read offset + segment recycling
+    # -----------------------------------------------------------
+    def commit(self):
+        """⏱️ O(1) + one small file write (plus fsync if enabled)"""
+        self._uncommitted = 0
+        if self._cseg is None:
+            return
+        body = struct.pack("<QQ", self._cseg, self._coff)
+        tmp = os.path.join(self.directory, "offset.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_OFFSET.pack(self._cseg, self._coff, zlib.crc32(body)))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.directory, "offset"))   # atomic
+        while self.segments and self.segments[0] < self._cseg:
+            self._recycle(self.segments.popleft())
+
+    def _recycle(self, seg):
+        path = self._path(seg)
+        if len(self._free_files()) < _FREE_POOL and os.path.getsize(path) == self.segment_size:
+            os.replace(path, os.path.join(self.directory, f"{seg:016d}.free"))
+        else:
+            os.remove(path)
+
+    # -----------------------------------------------------------
+    # 5️⃣ close — spill RAM-only items, commit, unmap
+    # -----------------------------------------------------------
+    def close(self):
+        if self._wmap is None and not self.tail and not self.head:
+            return
+        self._spill()
+        self.commit()
+        for mm in (self._rmap, self._wmap):
+            if mm is not None and not mm.closed:
+                mm.close()
+        self._rmap = self._wmap = None
+        self.head.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        return (f"DiskQueue(head={len(self.head)}, disk={self.disk_count}, "
+                f"tail={len(self.tail)}, segments={list(self.segments)})")
+
+
+# ---------------------------------------------------------------
+# ⏱️ BENCHMARK: throughput and memory vs the linked-list Queue
+# ---------------------------------------------------------------
+def load_linked_list_queue():
+    """Load Queue from 08_Implement_Queue_Using_Linked_List.py (name starts with a digit)."""
+    import importlib.util
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "linked_list_queue", os.path.join(here, "08_Implement_Queue_Using_Linked_List.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod.Queue
+
+
+def benchmark(n=1_000_000, record=100, batch=1_000):
+    import tempfile
+    import time
+    import tracemalloc
+
+    payload = os.urandom(record)
+    mb = n * record / 2**20
+    print(f"{n:,} records of {record} bytes ({mb:.0f} MiB), consumer stopped "
+          f"until the producer is done:")
+    with tempfile.TemporaryDirectory() as d:
+        q = DiskQueue(d, memory_items=batch, segment_size=16 * 2**20,
+                      dumps=bytes, loads=bytes)
+        start = time.perf_counter()
+        for _ in range(n // batch):
+            q.enqueue_many([payload] * batch)
+        t_in = time.perf_counter() - start
+        start = time.perf_counter()
+        while q.dequeue_many(batch):
+            pass
+        t_out = time.perf_counter() - start
+        q.close()
+        print(f"  enqueue_many: {mb / t_in:>7.0f} MiB/s   dequeue_many: {mb / t_out:>7.0f} MiB/s"
+              f"   ({2 * n / (t_in + t_out):,.0f} items/s)")
+
+    n_mem = 200_000
+    Queue = load_linked_list_queue()
+    print(f"\nPeak Python heap with {n_mem:,} queued records (tracemalloc; "
+          f"mmap pages are page cache, not heap):")
+    for name, make in [("linked-list Queue", lambda d: Queue()),
+                       ("DiskQueue", lambda d: DiskQueue(d, memory_items=batch,
+                                                         dumps=bytes, loads=bytes))]:
+        with tempfile.TemporaryDirectory() as d:
+            tracemalloc.start()
+            q = make(d)
+            for _ in range(n_mem):
+                q.enqueue(bytes(payload))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if isinstance(q, DiskQueue):
+                q.close()
+        print(f"  {name:<18} {peak / 2**20:>8.1f} MiB")
+
+
+# ---------------------------------------------------------------
+# ▶️ DEMONSTRATION
+# ---------------------------------------------------------------
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as d:
+        q = DiskQueue(d, memory_items=3, segment_size=256, checkpoint_every=2)
+        for i in range(1, 11):
+            q.enqueue(i)
+        print("after 10 enqueues:", q)
+        print("dequeue ×3:", q.dequeue(), q.dequeue(), q.dequeue())
+        print("dequeue_many(2):", q.dequeue_many(2), "| committed:", (q._cseg, q._coff))
+
+        # simulate a crash: drop the object without close()
+        q._rmap = q._wmap = None
+        del q
+        q = DiskQueue(d, memory_items=3, segment_size=256)
+        print("after crash + reopen:", q)
+        print("  recovered:", q.dequeue_many(100), "(10 was only in RAM → lost)")
+        q.enqueue_many(["a", "b", "c", "d"])
+        q.close()
+        with DiskQueue(d, memory_items=3, segment_size=256) as q:
+            print("after clean close + reopen:", q.dequeue_many(100))
+    print()
+    benchmark()
+
+
+# ---------------------------------------------------------------
+# 📊 SUMMARY OF TIME & SPACE COMPLEXITY
+# ---------------------------------------------------------------
+"""
+Operation            | Time                 | Notes
+-----------------------------------------------------------------------------
+enqueue              | O(1) amortized       | spill = one buffered write per segment
+enqueue_many(k)      | O(k)                 |
+dequeue              | O(1) amortized       | refill reads ≤ memory_items records
+dequeue_many(k)      | O(k)                 | one offset update per batch
+commit               | O(1)                 | temp file + os.replace (atomic)
+open (recovery)      | O(spilled backlog)   | re-scan from the committed offset
+RAM                  | O(memory_items)      | + ≤ 2 mapped segments (page cache)
+Disk                 | O(backlog)           | + ≤ 2 recycled segment files
+
+Guarantees:
+✅ spilled records survive a crash (at-least-once after the last commit)
+✅ torn / stale records are detected by crc32 seeded with the segment id
+❌ items that never left RAM are lost on a crash (close() spills them)
+❌ one process only — no file locking between producers/consumers
+"""
@@ -0,0 +1,107 @@
+import os
+import importlib.util
+import tempfile
+import unittest
+import zlib
+
+
+def load_disk_queue_module():
+    here = os.path.dirname(__file__)
+    path = os.path.join(here, "19_Disk_Spilling_Queue.py")
+    spec = importlib.util.spec_from_file_location("disk_spilling_queue_mod", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+mod = load_disk_queue_module()
+DiskQueue = mod.DiskQueue
+
+
+def crash(q):
+    """Drop the queue like a killed process: unmap, but no spill and no commit."""
+    for mm in (q._rmap, q._wmap):
+        if mm is not None and not mm.closed:
+            mm.close()
+    q._rmap = q._wmap = None
+
+
+class TestDiskQueue(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def open(self, **kwargs):
+        options = dict(memory_items=3, segment_size=256, checkpoint_every=5)
+        options.update(kwargs)
+        return DiskQueue(self.dir, **options)
+
+    def test_fifo_across_segment_boundaries(self):
+        q = self.open()
+        q.enqueue_many(range(100))
+        for i in range(100, 200):
+            q.enqueue(i)
+        self.assertGreater(len(q.segments), 1)      # 256-byte segments → many files
+        self.assertEqual(len(q), 200)
+        out = [q.dequeue() for _ in range(50)] + q.dequeue_many(1000)
+        self.assertEqual(out, list(range(200)))
+        self.assertTrue(q.isEmpty())
+        with self.assertRaises(IndexError):
+            q.dequeue()
+        q.close()
+
+    def test_reopen_after_close(self):
+        q = self.open()
+        q.enqueue_many(range(50))
+        self.assertEqual(q.dequeue_many(10), list(range(10)))
+        q.close()                                   # spills RAM-only items too
+        q = self.open()
+        self.assertEqual(len(q), 40)
+        self.assertEqual(q.peek(), 10)
+        self.assertEqual(q.dequeue_many(1000), list(range(10, 50)))
+        q.close()
+        with self.open() as q:
+            self.assertTrue(q.isEmpty())
+
+    def test_at_least_once_redelivery_after_crash(self):
+        q = self.open()
+        for i in range(40):
+            q.enqueue(i)                            # 0..38 spilled, 39 only in RAM
+        self.assertEqual([q.dequeue() for _ in range(12)], list(range(12)))
+        # offset committed after 10 dequeues; 10 and 11 were not committed
+        crash(q)
+        q = self.open()
+        recovered = q.dequeue_many(1000)
+        self.assertEqual(recovered, list(range(10, 39)))   # 10, 11 redelivered
+        q.close()
+
+    def test_recycled_segment_stale_record_reads_as_end(self):
+        q = self.open(checkpoint_every=1)
+        q.enqueue_many(range(100))
+        q.dequeue_many(100)                         # commit → old segments recycled
+        free = [n for n in os.listdir(self.dir) if n.endswith(".free")]
+        self.assertTrue(free)
+        old_id = int(free[0][:-5])
+
+        q.enqueue_many(["new"] * 6)                 # next write segment reuses a .free file
+        seg, off = q._wseg, q._woff
+        self.assertLess(len([n for n in os.listdir(self.dir) if n.endswith(".free")]),
+                        len(free))
+        # a record that is valid for the file's OLD segment id, right where the
+        # new data ends (what a torn end mark over stale bytes would expose)
+        payload = q.dumps("stale")
+        stale = mod._RECORD.pack(len(payload) + 1, zlib.crc32(payload, old_id)) + payload
+        q._wmap[off:off + len(stale)] = stale
+        self.assertIsNone(DiskQueue._read_at(q._wmap, seg, off))
+        crash(q)
+
+        q = self.open()
+        self.assertEqual(q.dequeue_many(1000), ["new"] * 6)
+        q.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,325 @@
+# k_stacks_note.py
+# ------------------------------------------------------
+# 📘 KStacks — k Dynamically Sized Stacks Sharing One Array
+# ✅ Free-list of slots: any stack can use any free slot in O(1)
+# ------------------------------------------------------
+
+"""
+OVERVIEW
+
+MultiStack (01_Three_in_One.py) splits the array into 3 FIXED blocks:
+
+    [S0 S0 S0 | S1 S1 S1 | S2 S2 S2]
+
+  ❌ push to S0 says "The Stack is Full" even if S1 and S2 are empty
+  ❌ the number of stacks is hard-coded to 3
+
+KStacks instead treats the array as a POOL of slots linked together:
+
+  • values[i] → the item stored in slot i
+  • next[i]   → slot below i in the same stack   (if slot i is used)
+                next free slot                    (if slot i is free)
+  • top[s]    → slot holding the top of stack s   (-1 = empty)
+  • free      → first slot of the free list        (-1 = no free slot)
+
+  Every stack is a singly linked list threaded through the SAME arrays,
+  and so is the free list. A push takes the first free slot, a pop gives
+  the slot back — both O(1), no matter which stack is used.
+
+  When the free list runs out the buffer can grow in bulk (auto_grow or
+  reserve(extra)): the new slots are chained onto the free list at once.
+
+  With a typecode the values live in an array.array (plain C numbers), so
+  thousands of small per-tenant stacks cost ~16 bytes per element and no
+  per-stack list object at all.
+"""
+
+# -----------------------------------------------------------------------------
+# VISUAL TRACE (k = 3, capacity = 6)
+# -----------------------------------------------------------------------------
+"""
+Start:                          top  = [-1, -1, -1]     free = 0
+    slot:   0   1   2   3   4   5
+    next:   1   2   3   4   5  -1     (all slots chained as the free list)
+
+push(10, 0) → slot 0            top  = [ 0, -1, -1]     free = 1
+push(20, 2) → slot 1            top  = [ 0, -1,  1]     free = 2
+push(30, 0) → slot 2            top  = [ 2, -1,  1]     free = 3
+    slot:   0    1    2    3   4   5
+    value: 10   20   30    _   _   _
+    next:  -1   -1    0    4   5  -1
+           └ S0 bottom   ↑ S0 top (next → 0)
+
+pop(0) → slot 2 returns 30, slot 2 goes to the FRONT of the free list:
+                                top  = [ 0, -1,  1]     free = 2
+    next:  -1   -1    3    4   5  -1
+"""
+
+from array import array
+
+
+# -----------------------------------------------------------------------------
+# CLASS: KStacks
+# -----------------------------------------------------------------------------
+class KStacks:
+    """k stacks of any size sharing one buffer through a free list."""
+
+    def __init__(self, k, capacity=16, typecode=None, auto_grow=True):
+        """
+        k         : number of stacks (stack numbers 0..k-1)
+        capacity  : initial number of slots shared by ALL stacks
+        typecode  : None → any Python object, 'q' / 'd' / ... → array.array
+        auto_grow : double the buffer when every slot is used
+                    (False → push returns False when full, like a fixed pool)
+        """
+        if k <= 0 or capacity <= 0:
+            raise ValueError("k and capacity must be positive")
+        self.k = k
+        self.typecode = typecode
+        self.auto_grow = auto_grow
+        self.values = self._new_values(capacity)
+        self.next = array("q", range(1, capacity + 1))
+        self.next[capacity - 1] = -1
+        self.top = array("q", [-1]) * k
+        self.sizes = array("q", [0]) * k
+        self.free = 0
+        self.count = 0
+
+    def _new_values(self, n):
+        if self.typecode:
+            return array(self.typecode, bytes(array(self.typecode).itemsize * n))
+        return [None] * n
+
+    def capacity(self):
+        return len(self.next)
+
+    def _check(self, stacknum):
+        """Stack numbers are 0..k-1 (negative ones would index from the end)."""
+        if not 0 <= stacknum < self.k:
+            raise IndexError(f"stack number {stacknum} out of range 0..{self.k - 1}")
+
+    def __len__(self):
+        """Total number of items over all stacks."""
+        return self.count
+
+    # ----------------------------
+    # Bulk grow of the shared buffer
+    # ----------------------------
+    def reserve(self, extra):
+        """
+        Add `extra` free slots at once and chain them onto the free list.
+
+            old slots 0..n-1 | new slots n .. n+extra-1
+            next[n] = n+1, ..., next[n+extra-1] = old free ; free = n
+
+        Time: O(extra)
+        """
+        if extra <= 0:
+            return
+        n = len(self.next)
+        self.values += self._new_values(extra)
+        self.next.extend(range(n + 1, n + extra + 1))
+        self.next[n + extra - 1] = self.free
+        self.free = n
+
+    # ----------------------------
+    # isFull / isEmpty / size
+    # ----------------------------
+    def isFull(self):
+        """True when no free slot is left (a push would need to grow)."""
+        return self.free == -1
+
+    def isEmpty(self, stacknum):
+        self._check(stacknum)
+        return self.top[stacknum] == -1
+
+    def size(self, stacknum):
+        self._check(stacknum)
+        return self.sizes[stacknum]
+
+    # -----------------------------------------------------------
+    # PUSH → take the first free slot
+    # -----------------------------------------------------------
+    def push(self, item, stacknum):
+        """
+        1. slot = free (grow first if the pool is empty)
+        2. values[slot] = item          (first: a typed array may reject
+                                         the item → slot still free)
+        3. free = next[slot]            (unlink slot from the free list)
+        4. next[slot] = top[stacknum]   (slot now sits above the old top)
+        5. top[stacknum] = slot
+
+        Returns True, or False when full and auto_grow is off.
+        Raises IndexError for a stack number outside 0..k-1.
+        Time: O(1) amortized  Space: O(1)
+        """
+        self._check(stacknum)
+        slot = self.free
+        if slot == -1:
+            if not self.auto_grow:
+                return False
+            self.reserve(len(self.next))
+            slot = self.free
+        self.values[slot] = item
+        nxt = self.next
+        self.free = nxt[slot]
+        nxt[slot] = self.top[stacknum]
+        self.top[stacknum] = slot
+        self.sizes[stacknum] += 1
+        self.count += 1
+        return True
+
+    # -----------------------------------------------------------
+    # POP → give the slot back to the free list
+    # -----------------------------------------------------------
+    def pop(self, stacknum):
+        """
+        1. slot = top[stacknum]
+        2. top[stacknum] = next[slot]   (stack now starts one slot lower)
+        3. next[slot] = free ; free = slot
+
+        Raises IndexError if the stack is empty.
+        Time: O(1)  Space: O(1)
+        """
+        self._check(stacknum)
+        slot = self.top[stacknum]
+        if slot == -1:
+            raise IndexError(f"pop from empty stack {stacknum}")
+        nxt = self.next
+        value = self.values[slot]
+        if self.typecode is None:
+            self.values[slot] = None
+        self.top[stacknum] = nxt[slot]
+        nxt[slot] = self.free
+        self.free = slot
+        self.sizes[stacknum] -= 1
+        self.count -= 1
+        return value
+
+    def peek(self, stacknum):
+        """Top item of the stack (IndexError if empty). Time: O(1)"""
+        self._check(stacknum)
+        slot = self.top[stacknum]
+        if slot == -1:
+            raise IndexError(f"peek from empty stack {stacknum}")
+        return self.values[slot]
+
+    # ----------------------------
+    # Traversal / debug
+    # ----------------------------
+    def iter_stack(self, stacknum):
+        """Yield items of one stack from top to bottom. Time: O(size)"""
+        self._check(stacknum)
+        slot = self.top[stacknum]
+        while slot != -1:
+            yield self.values[slot]
+            slot = self.next[slot]
+
+    def __repr__(self):
+        stacks = [f"S{s}: {list(self.iter_stack(s))}" for s in range(self.k) if self.sizes[s]]
+        return (" | ".join(stacks) or "all empty") + \
+            f"  (used {self.count}/{len(self.next)} slots)"
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARK: many small per-tenant stacks vs k separate Python lists
+# -----------------------------------------------------------------------------
+def _workload(k, ops, seed=7):
+    import random
+
+    rng = random.Random(seed)
+    # 60% push / 40% pop → stacks slowly fill up
+    return [(rng.random() < 0.6, rng.randrange(k)) for _ in range(ops)]
+
+
+def benchmark(k=10_000, ops=1_000_000):
+    import time
+    import tracemalloc
+
+    work = _workload(k, ops)
+
+    def run_lists():
+        stacks = [[] for _ in range(k)]
+        for is_push, s in work:
+            st = stacks[s]
+            if is_push:
+                st.append(s + 1000)
+            elif st:
+                st.pop()
+        return stacks
+
+    def run_kstacks(typecode):
+        ks = KStacks(k, typecode=typecode)
+        push, pop, top = ks.push, ks.pop, ks.top
+        for is_push, s in work:
+            if is_push:
+                push(s + 1000, s)
+            elif top[s] != -1:
+                pop(s)
+        return ks
+
+    print(f"{k:,} stacks, {ops:,} random push/pop operations:")
+    for name, run in [("k separate lists", run_lists),
+                      ("KStacks (objects)", lambda: run_kstacks(None)),
+                      ("KStacks typecode='q'", lambda: run_kstacks("q"))]:
+        start = time.perf_counter()
+        run()
+        secs = time.perf_counter() - start
+
+        tracemalloc.start()
+        result = run()
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        items = sum(map(len, result)) if isinstance(result, list) else len(result)
+        print(f"  {name:<22} {ops / secs:>11,.0f} ops/s   "
+              f"{current / 1024 / 1024:>6.1f} MiB  ({current / items:.1f} bytes/item, {items:,} items)")
+
+
+# -----------------------------------------------------------------------------
+# DEMONSTRATION
+# -----------------------------------------------------------------------------
+if __name__ == '__main__':
+    print("=== KStacks Trace ===")
+    ks = KStacks(3, capacity=6, auto_grow=False)
+    ks.push(10, 0)
+    ks.push(20, 2)
+    ks.push(30, 0)
+    print(ks, "| top =", ks.top.tolist(), "free =", ks.free)
+    print("pop(0) ->", ks.pop(0), "| free =", ks.free)
+
+    # one stack may use EVERY free slot (MultiStack would say "Full" at 2)
+    for v in range(4):
+        ks.push(v, 1)
+    print(ks)
+    print("push when full (auto_grow off) ->", ks.push(99, 2))
+    ks.reserve(4)
+    print("after reserve(4) ->", ks.push(99, 2), ks)
+
+    typed = KStacks(2, capacity=4, typecode="q", auto_grow=False)
+    try:
+        typed.push("x", 0)
+    except TypeError as exc:
+        print("typed push('x') rejected:", exc)
+    print("slots still usable:", sum(typed.push(v, v % 2) for v in range(4)), "of 4")
+    try:
+        typed.push(1, -1)
+    except IndexError as exc:
+        print("push to stack -1 ->", exc)
+
+    print()
+    benchmark()
+
+# -----------------------------------------------------------------------------
+# COMPLEXITY SUMMARY
+# -----------------------------------------------------------------------------
+"""
+Operation        | Time            | Space
+-------------------------------------------------
+push             | O(1) amortized  | O(1)
+pop / peek       | O(1)            | O(1)
+isEmpty / size   | O(1)            | O(1)
+reserve(extra)   | O(extra)        | O(extra)
+iter_stack       | O(size)         | O(1)
+
+Space: O(capacity + k) — values + next per slot, top + size per stack.
+"""
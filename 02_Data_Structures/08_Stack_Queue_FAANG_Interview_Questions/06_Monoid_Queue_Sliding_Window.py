@@ -0,0 +1,325 @@
+# monoid_queue_note.py
+# ------------------------------------------------------
+# 📘 MonoidQueue — Sliding-Window Aggregates with Two Stacks
+# ✅ min / max / sum / gcd / any associative function over a window
+#    in O(1) amortized per step
+# ------------------------------------------------------
+
+"""
+OVERVIEW
+
+Two ideas from this folder put together:
+
+  1) Min Stack (02_Find_Stack_Min.py)
+       every stack level also stores the min of everything BELOW it
+       → min() of the whole stack is read from the top in O(1)
+
+  2) Queue via two stacks
+       IN  stack receives new items (enqueue)
+       OUT stack serves the oldest item (dequeue)
+       when OUT is empty, move everything from IN to OUT (reverses order)
+
+MonoidQueue = queue via two stacks where BOTH stacks are "min stacks",
+but with any ASSOCIATIVE combine function instead of min:
+
+    combine(combine(a, b), c) == combine(a, combine(b, c))
+
+    min, max, +, *, gcd, lcm, bitwise and/or, "first non-zero", ...
+    (combine does NOT need to be commutative — queue order is respected)
+
+  • IN stack only ever grows on the right, so it needs ONE running
+    aggregate:   in_agg = a_i ⊕ a_i+1 ⊕ ... ⊕ newest
+  • OUT stack stores, at each level, the aggregate from that item to the
+    back of the OUT stack — exactly like minNode in the Min Stack.
+
+    window aggregate = out_aggs[-1] ⊕ in_agg                        O(1)
+
+  Each item is pushed to IN once, moved to OUT once, popped once
+  → O(1) amortized per enqueue/dequeue, for ANY associative function.
+  (A monotonic deque only works for min/max; a running sum with
+   subtraction only works for invertible + and drifts with floats.)
+"""
+
+# ---------------------------------------------------------------
+# VISUAL TRACE (combine = min)
+# ---------------------------------------------------------------
+"""
+enqueue 4, 2, 5               IN:  [4, 2, 5]   in_agg = 2
+                              OUT: []
+
+dequeue → OUT is empty → transfer IN (newest first):
+    push 5  → out_aggs: [5]
+    push 2  → out_aggs: [5, 2]          min(2, 5)
+    push 4  → out_aggs: [5, 2, 2]       min(4, 2)
+    OUT top = 4 (oldest) → popped
+                              OUT vals: [5, 2]   out_aggs: [5, 2]
+enqueue 1                     IN:  [1]         in_agg = 1
+aggregate() = min(out_aggs[-1], in_agg) = min(2, 1) = 1   (window 2, 5, 1)
+"""
+
+import math
+import operator
+
+_NO_IDENTITY = object()
+
+
+# ---------------------------------------------------------------
+# CLASS: MonoidQueue
+# ---------------------------------------------------------------
+class MonoidQueue:
+    """FIFO queue that also returns combine(all items) in O(1)."""
+
+    def __init__(self, combine, identity=_NO_IDENTITY):
+        """
+        combine  : associative function f(older, newer)
+        identity : value returned by aggregate() on an empty queue
+                   (without it, aggregate() on an empty queue raises IndexError)
+        """
+        self.combine = combine
+        self.identity = identity
+        self._in = []            # newest items (append on the right)
+        self._in_agg = None      # combine of everything in _in
+        self._out = []           # oldest items, oldest on TOP (end of list)
+        self._out_aggs = []      # _out_aggs[i] = _out[i] ⊕ _out[i-1] ⊕ ... ⊕ _out[0]
+
+    # ---------- ready-made monoids ----------
+    @classmethod
+    def min_queue(cls):
+        return cls(min)
+
+    @classmethod
+    def max_queue(cls):
+        return cls(max)
+
+    @classmethod
+    def sum_queue(cls):
+        return cls(operator.add, 0)
+
+    @classmethod
+    def gcd_queue(cls):
+        return cls(math.gcd, 0)
+
+    def __len__(self):
+        return len(self._in) + len(self._out)
+
+    def isEmpty(self):
+        return not self._in and not self._out
+
+    # -----------------------------------------------------------
+    # 1️⃣ enqueue(value) — push on IN, extend running aggregate
+    # -----------------------------------------------------------
+    def enqueue(self, value):
+        """Time: O(1)"""
+        if self._in:
+            self._in_agg = self.combine(self._in_agg, value)
+        else:
+            self._in_agg = value
+        self._in.append(value)
+
+    def extend(self, values):
+        for value in values:
+            self.enqueue(value)
+
+    # -----------------------------------------------------------
+    # 2️⃣ dequeue() — pop oldest from OUT (refill from IN if empty)
+    # -----------------------------------------------------------
+    def _transfer(self):
+        """
+        Move IN → OUT. IN is popped newest-first, so each item moved is
+        OLDER than everything already on OUT:
+            out_agg(new) = value ⊕ out_agg(previous top)
+        Time: O(len(IN)), paid once per item → O(1) amortized
+        """
+        combine = self.combine
+        out, aggs = self._out, self._out_aggs     # OUT is empty here
+        items = self._in
+        agg = items[-1]
+        out.append(agg)
+        aggs.append(agg)
+        for i in range(len(items) - 2, -1, -1):
+            value = items[i]
+            agg = combine(value, agg)
+            out.append(value)
+            aggs.append(agg)
+        items.clear()
+        self._in_agg = None
+
+    def dequeue(self):
+        """Remove and return the oldest item. Time: O(1) amortized"""
+        if not self._out:
+            if not self._in:
+                raise IndexError("dequeue from empty MonoidQueue")
+            self._transfer()
+        self._out_aggs.pop()
+        return self._out.pop()
+
+    def peek(self):
+        """Oldest item without removing it. Time: O(1)"""
+        if self._out:
+            return self._out[-1]
+        if self._in:
+            return self._in[0]
+        raise IndexError("peek from empty MonoidQueue")
+
+    # -----------------------------------------------------------
+    # 3️⃣ aggregate() — combine of the whole window
+    # -----------------------------------------------------------
+    def aggregate(self):
+        """out_aggs[-1] ⊕ in_agg (whichever exist). Time: O(1)"""
+        if self._out:
+            if self._in:
+                return self.combine(self._out_aggs[-1], self._in_agg)
+            return self._out_aggs[-1]
+        if self._in:
+            return self._in_agg
+        if self.identity is _NO_IDENTITY:
+            raise IndexError("aggregate of empty MonoidQueue")
+        return self.identity
+
+    def __repr__(self):
+        items = self._out[::-1] + self._in
+        return f"MonoidQueue({items})"
+
+
+# ---------------------------------------------------------------
+# sliding_window(values, k, combine) — fast streaming helper
+# ---------------------------------------------------------------
+def sliding_window(values, k, combine):
+    """
+    Yield combine(window) for every full window of size k over `values`
+    (any iterable, consumed lazily — suitable for streams).
+
+    Same two-stack algorithm as MonoidQueue, written with local variables
+    only (no method calls per item) for throughput.
+    Time: O(n) total  Space: O(k)
+    """
+    if k <= 0:
+        raise ValueError("k must be positive")
+    in_items = []
+    in_agg = None
+    out_aggs = []            # the OUT stack only needs its aggregates
+    for value in values:
+        # enqueue
+        in_agg = value if not in_items else combine(in_agg, value)
+        in_items.append(value)
+        if len(in_items) + len(out_aggs) < k:
+            continue
+        # window is full → report, then drop the oldest
+        if out_aggs:
+            yield combine(out_aggs[-1], in_agg)
+            out_aggs.pop()
+        else:
+            # transfer IN → OUT; the oldest item sits on OUT's top
+            agg = in_items[-1]
+            out_aggs.append(agg)
+            for i in range(len(in_items) - 2, -1, -1):
+                agg = combine(in_items[i], agg)
+                out_aggs.append(agg)
+            in_items.clear()
+            yield out_aggs.pop()     # whole window was on IN
+            in_agg = None
+
+
+# ---------------------------------------------------------------
+# BENCHMARK: window aggregates at 10^6 points
+# ---------------------------------------------------------------
+def benchmark(n=1_000_000, k=1_000):
+    import random
+    import time
+    from collections import deque
+
+    rng = random.Random(3)
+    data = [rng.randrange(1, 1 << 30) for _ in range(n)]
+
+    def brute(values, k, fn):
+        # O(n·k): recompute every window from scratch (on a prefix only)
+        return [fn(values[i:i + k]) for i in range(len(values) - k + 1)]
+
+    def monotonic_max(values, k):
+        dq, out = deque(), []
+        for i, v in enumerate(values):
+            while dq and values[dq[-1]] <= v:
+                dq.pop()
+            dq.append(i)
+            if dq[0] <= i - k:
+                dq.popleft()
+            if i >= k - 1:
+                out.append(values[dq[0]])
+        return out
+
+    def gcd_all(window):
+        g = 0
+        for v in window:
+            g = math.gcd(g, v)
+        return g
+
+    print(f"n = {n:,} points, window k = {k:,}:")
+    rows = []
+    m = n // 50
+    start = time.perf_counter()
+    brute(data[:m], k, max)
+    rows.append(("max  brute force O(n·k)", (time.perf_counter() - start) * n / m, True))
+    for name, run in [
+        ("max  monotonic deque", lambda: monotonic_max(data, k)),
+        ("max  sliding_window", lambda: list(sliding_window(data, k, max))),
+        ("sum  sliding_window", lambda: list(sliding_window(data, k, operator.add))),
+        ("gcd  sliding_window", lambda: list(sliding_window(data, k, math.gcd))),
+        ("max  MonoidQueue class", lambda: _run_class(data, k)),
+    ]:
+        start = time.perf_counter()
+        run()
+        rows.append((name, time.perf_counter() - start, False))
+    for name, secs, extrapolated in rows:
+        note = "  (extrapolated from n/50)" if extrapolated else ""
+        print(f"  {name:<26} {secs:>8.2f}s  {n / secs:>12,.0f} points/s{note}")
+
+    assert list(sliding_window(data[:5000], 50, max)) == monotonic_max(data[:5000], 50)
+    assert list(sliding_window(data[:5000], 50, math.gcd)) == brute(data[:5000], 50, gcd_all)
+
+
+def _run_class(values, k):
+    q = MonoidQueue.max_queue()
+    out = []
+    for v in values:
+        q.enqueue(v)
+        if len(q) > k:
+            q.dequeue()
+        if len(q) == k:
+            out.append(q.aggregate())
+    return out
+
+
+# ---------------------------------------------------------------
+# DEMONSTRATION
+# ---------------------------------------------------------------
+if __name__ == '__main__':
+    q = MonoidQueue.min_queue()
+    for v in (4, 2, 5):
+        q.enqueue(v)
+    print(q, "min =", q.aggregate())          # 2
+    print("dequeue ->", q.dequeue())           # 4
+    q.enqueue(1)
+    print(q, "min =", q.aggregate())          # 1
+
+    # non-commutative monoid: string concatenation keeps window order
+    print("concat windows:", list(sliding_window("abcdef", 3, operator.add)))
+    print("gcd windows:", list(sliding_window([12, 18, 24, 9, 27, 81], 3, math.gcd)))
+
+    print()
+    benchmark()
+
+# ---------------------------------------------------------------
+# COMPLEXITY SUMMARY
+# ---------------------------------------------------------------
+"""
+Operation        | Time            | Space
+-------------------------------------------------
+enqueue          | O(1)            | O(1)
+dequeue          | O(1) amortized  | O(1)
+aggregate / peek | O(1)            | O(1)
+sliding_window   | O(n) total      | O(k)
+
+Each item is combined at most twice (once into in_agg, once on transfer)
+→ about 2 calls of `combine` per item, versus k calls per window for
+brute force.
+"""
@@ -0,0 +1,428 @@
+# stack_of_plates_lazy_note.py
+# ------------------------------------------------------
+# 📘 LazyStackOfPlates — pop_at() without rollover
+# ✅ Holes + Fenwick tree of fill counts, lazy compaction,
+#    spill of cold lower sub-stacks to disk
+# ------------------------------------------------------
+
+"""
+OVERVIEW
+
+StackOfPlates (03_Stack_of_Plates.py) keeps every sub-stack full after
+pop_at(i) by ROLLING the bottom plate of every later sub-stack one step
+left:
+
+    pop_at(0):  [[1,2],[3,4],[5,6]] → [[1,3],[4,5],[6]]
+                one popleft + append for EVERY later sub-stack → O(stacks)
+
+LazyStackOfPlates leaves a HOLE instead:
+
+    pop_at(0):  [[1,2],[3,4],[5,6]] → [[1],[3,4],[5,6]]          O(log n)
+
+  • fill counts of the sub-stacks live in a Fenwick (Binary Indexed) tree
+      → "which sub-stack holds the i-th plate from the bottom?"  O(log n)
+      → get(i) / remove(i) by GLOBAL position without scanning
+  • holes are only squeezed out when they become too many:
+        fragmentation = empty slots / total slots  >  compact_threshold
+      → compact() rebuilds full sub-stacks in O(n). Every compaction is
+        paid for by the ≥ threshold · slots holes created before it
+        → O(1) amortized per pop_at.
+  • memory_limit: once more plates than this are in RAM, the LOWEST
+    (coldest) sub-stacks are pickled to disk and only their counts stay
+    in memory. A spilled sub-stack is loaded back on first access.
+
+⚠️ Sub-stack numbers used by pop_at(index) are stable between compactions
+   (an emptied sub-stack stays as a hole); compaction renumbers them.
+"""
+
+# ---------------------------------------------------------------
+# VISUAL (capacity = 3)
+# ---------------------------------------------------------------
+"""
+stacks:    [1,2,3]  [4,5,6]  [7,8,9]  [10]
+counts:       3        3        3       1      Fenwick prefix sums: 3 6 9 10
+
+pop_at(1) → 6          [1,2,3]  [4,5]  [7,8,9]  [10]
+counts:                   3       2       3       1     prefix: 3 5 8 9
+
+get(5) → 6th plate from the bottom:
+    find_kth(6) → sub-stack 2 (prefix 5 < 6 ≤ 8), offset 6 - 5 - 1 = 0 → 7
+
+fragmentation = holes / slots = 1 / 9 ≈ 0.11   (the last sub-stack is not counted)
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+
+
+# ---------------------------------------------------------------
+# Fenwick tree over sub-stack fill counts (can grow and shrink at the end)
+# ---------------------------------------------------------------
+class FenwickTree:
+    """Binary Indexed Tree, positions 1..n."""
+
+    def __init__(self, counts=()):
+        self.tree = [0]
+        for c in counts:
+            self.append(c)
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def append(self, value):
+        """Add position n+1 holding `value`. O(log n)"""
+        i = len(self.tree)
+        # tree[i] covers (i - lowbit(i), i] = value + sum of (i - lowbit(i), i-1]
+        self.tree.append(value + self.prefix_sum(i - 1) - self.prefix_sum(i - (i & -i)))
+
+    def pop(self):
+        """Drop the last position (no other node depends on it). O(1)"""
+        self.tree.pop()
+
+    def add(self, i, delta):
+        """O(log n)"""
+        n = len(self.tree) - 1
+        while i <= n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, i):
+        """Sum of positions 1..i. O(log n)"""
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def find_kth(self, kth):
+        """Smallest position whose prefix sum reaches kth (kth ≥ 1). O(log n)"""
+        tree = self.tree
+        n = len(tree) - 1
+        pos = 0
+        bit = 1 << n.bit_length()
+        while bit:
+            nxt = pos + bit
+            if nxt <= n and tree[nxt] < kth:
+                pos = nxt
+                kth -= tree[nxt]
+            bit >>= 1
+        return pos + 1
+
+
+class SpilledStack:
+    """Placeholder for a sub-stack that lives in a pickle file."""
+
+    def __init__(self, path, count):
+        self.path = path
+        self.count = count
+
+    def __repr__(self):
+        return f"<on disk: {self.count} plates>"
+
+
+# ---------------------------------------------------------------
+# CLASS: LazyStackOfPlates
+# ---------------------------------------------------------------
+class LazyStackOfPlates:
+    """Set of stacks with O(log n) pop_at, lazy compaction and disk spill."""
+
+    def __init__(self, capacity, compact_threshold=0.5, memory_limit=None, spill_dir=None):
+        """
+        capacity          : max plates per sub-stack
+        compact_threshold : compact when empty slots / total slots exceeds this
+        memory_limit      : max plates kept in RAM (None → never spill)
+        spill_dir         : directory for spill files (default: a temp dir)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if not 0 < compact_threshold < 1:
+            raise ValueError("compact_threshold must be between 0 and 1")
+        self.capacity = capacity
+        self.compact_threshold = compact_threshold
+        self.memory_limit = memory_limit
+        self.stacks = []            # list (in memory) or SpilledStack
+        self.counts = FenwickTree()
+        self.size = 0               # all plates
+        self.in_memory = 0          # plates not spilled
+        self.compactions = 0
+        self._spill_dir = spill_dir
+        self._own_dir = False
+        self._spill_seq = 0
+        self._spill_cursor = 0      # sub-stacks below this index are all spilled
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return "[" + ", ".join(repr(s) if isinstance(s, SpilledStack) else str(s)
+                               for s in self.stacks) + "]"
+
+    # ----------------------------
+    # Helpers
+    # ----------------------------
+    def _count(self, i):
+        s = self.stacks[i]
+        return s.count if isinstance(s, SpilledStack) else len(s)
+
+    def _stack(self, i):
+        """Return sub-stack i as a list, loading it from disk if spilled."""
+        s = self.stacks[i]
+        if isinstance(s, SpilledStack):
+            if i < 0:
+                i += len(self.stacks)
+            s = self._load(s)
+            self.stacks[i] = s
+            self._spill_cursor = min(self._spill_cursor, i)
+            self._maybe_spill(keep=i)
+        return s
+
+    def _load(self, spilled):
+        with open(spilled.path, "rb") as f:
+            plates = pickle.load(f)
+        os.remove(spilled.path)
+        self.in_memory += len(plates)
+        return plates
+
+    def _take(self, i, offset=None):
+        """Remove a plate from sub-stack i (top if offset is None)."""
+        stack = self._stack(i)
+        value = stack.pop() if offset is None else stack.pop(offset)
+        self.counts.add(i + 1, -1)
+        self.size -= 1
+        self.in_memory -= 1
+        if i == len(self.stacks) - 1:
+            # drop trailing empty sub-stacks so the last one is never empty
+            while self.stacks and self._count(-1) == 0:
+                self.stacks.pop()
+                self.counts.pop()
+            self._spill_cursor = min(self._spill_cursor, len(self.stacks))
+        elif self.fragmentation() > self.compact_threshold:
+            self.compact()
+        return value
+
+    def holes(self):
+        """Empty slots in all sub-stacks except the last. O(1)"""
+        if not self.stacks:
+            return 0
+        return self.capacity * (len(self.stacks) - 1) - (self.size - self._count(-1))
+
+    def fragmentation(self):
+        """holes / slots of all sub-stacks except the last. O(1)"""
+        slots = self.capacity * (len(self.stacks) - 1)
+        return self.holes() / slots if slots else 0.0
+
+    # ----------------------------
+    # push / pop
+    # ----------------------------
+    def push(self, item):
+        """Push onto the last sub-stack (holes below are not refilled). O(1) amortized"""
+        if self.stacks and self._count(-1) < self.capacity:
+            self._stack(-1).append(item)
+            self.counts.add(len(self.stacks), 1)
+        else:
+            self.stacks.append([item])
+            self.counts.append(1)
+        self.size += 1
+        self.in_memory += 1
+        self._maybe_spill()
+
+    def pop(self):
+        """Pop from the last sub-stack. O(1) amortized"""
+        if not self.stacks:
+            raise IndexError("pop from empty StackOfPlates")
+        return self._take(len(self.stacks) - 1)
+
+    # ----------------------------
+    # pop_at(index) — leave a hole, no rollover
+    # ----------------------------
+    def pop_at(self, index):
+        """
+        Pop the top plate of sub-stack `index`.
+        O(log n) + amortized O(1) for lazy compaction.
+        """
+        if index < 0 or index >= len(self.stacks) or self._count(index) == 0:
+            raise IndexError(f"sub-stack {index} is empty or does not exist")
+        return self._take(index)
+
+    # ----------------------------
+    # Global indexing through the Fenwick tree
+    # ----------------------------
+    def _locate(self, position):
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError("plate position out of range")
+        i = self.counts.find_kth(position + 1) - 1
+        return i, position - self.counts.prefix_sum(i)
+
+    def get(self, position):
+        """Plate at global position (0 = very bottom plate). O(log n)"""
+        i, offset = self._locate(position)
+        return self._stack(i)[offset]
+
+    def remove(self, position):
+        """Remove the plate at a global position, leaving a hole. O(log n + capacity)"""
+        i, offset = self._locate(position)
+        return self._take(i, offset)
+
+    # ----------------------------
+    # Lazy compaction
+    # ----------------------------
+    def compact(self):
+        """
+        Rebuild full sub-stacks (all but the last) in plate order.
+        Streams sub-stack by sub-stack: spilled ones are loaded one at a time
+        and finished low sub-stacks may be spilled again, so RAM use stays
+        near memory_limit. O(n)
+        """
+        old = self.stacks
+        self.stacks = []
+        self._spill_cursor = 0
+        cap = self.capacity
+        chunk = []
+        for s in old:
+            plates = self._load(s) if isinstance(s, SpilledStack) else s
+            i = 0
+            while i < len(plates):
+                take = min(cap - len(chunk), len(plates) - i)
+                chunk.extend(plates[i:i + take])
+                i += take
+                if len(chunk) == cap:
+                    self.stacks.append(chunk)
+                    chunk = []
+                    self._maybe_spill()
+        if chunk:
+            self.stacks.append(chunk)
+        self.counts = FenwickTree(self._count(i) for i in range(len(self.stacks)))
+        self.compactions += 1
+
+    # ----------------------------
+    # Spill to disk
+    # ----------------------------
+    def _maybe_spill(self, keep=None):
+        """Pickle the lowest in-memory sub-stacks (never the last) while over memory_limit."""
+        if self.memory_limit is None or self.in_memory <= self.memory_limit:
+            return
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="plates_")
+            self._own_dir = True
+        last = len(self.stacks) - 1
+        i = self._spill_cursor
+        while self.in_memory > self.memory_limit and i < last:
+            s = self.stacks[i]
+            if i != keep and not isinstance(s, SpilledStack) and s:
+                self._spill_seq += 1
+                path = os.path.join(self._spill_dir, f"stack_{self._spill_seq}.pkl")
+                with open(path, "wb") as f:
+                    pickle.dump(s, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self.stacks[i] = SpilledStack(path, len(s))
+                self.in_memory -= len(s)
+            if i == self._spill_cursor and (isinstance(self.stacks[i], SpilledStack)
+                                            or not self.stacks[i]):
+                self._spill_cursor = i + 1
+            i += 1
+
+    def spilled(self):
+        """Number of sub-stacks currently on disk."""
+        return sum(isinstance(s, SpilledStack) for s in self.stacks)
+
+    def close(self):
+        """Delete spill files (and the temp directory if we created it)."""
+        for s in self.stacks:
+            if isinstance(s, SpilledStack) and os.path.exists(s.path):
+                os.remove(s.path)
+        if self._own_dir and self._spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+        self.stacks, self.counts = [], FenwickTree()
+        self.size = self.in_memory = 0
+        self._spill_cursor = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------------------------------------------------------------
+# BENCHMARK: rollover pop_at vs lazy pop_at
+# ---------------------------------------------------------------
+def load_stack_of_plates():
+    """Load StackOfPlates from 03_Stack_of_Plates.py (name starts with a digit)."""
+    import importlib.util
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "stack_of_plates", os.path.join(here, "03_Stack_of_Plates.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod.StackOfPlates
+
+
+def benchmark(plates=200_000, capacity=100, calls=5_000):
+    import random
+    import time
+
+    StackOfPlates = load_stack_of_plates()
+    rng = random.Random(11)
+    picks = [rng.random() for _ in range(calls)]
+    print(f"{plates:,} plates, capacity {capacity}, {calls:,} pop_at(random sub-stack):")
+    for name, make in [("StackOfPlates (rollover)", lambda: StackOfPlates(capacity)),
+                       ("LazyStackOfPlates", lambda: LazyStackOfPlates(capacity))]:
+        s = make()
+        for p in range(plates):
+            s.push(p)
+        start = time.perf_counter()
+        for r in picks:
+            count = len(s.stacks)
+            index = int(r * (count - 1))
+            while len(s.stacks[index]) == 0:        # lazy version may hold holes
+                index += 1
+            s.pop_at(index)
+        secs = time.perf_counter() - start
+        extra = f", {s.compactions} compactions" if hasattr(s, "compactions") else ""
+        print(f"  {name:<26} {secs:>7.3f}s  {calls / secs:>11,.0f} pop_at/s{extra}")
+
+
+# ---------------------------------------------------------------
+# DEMONSTRATION
+# ---------------------------------------------------------------
+if __name__ == '__main__':
+    print("=== LazyStackOfPlates Demo (capacity=3) ===")
+    s = LazyStackOfPlates(3)
+    for p in range(1, 11):
+        s.push(p)
+    print("Stacks:", s)                                  # [[1,2,3],[4,5,6],[7,8,9],[10]]
+    print("pop_at(1) ->", s.pop_at(1), "| Stacks:", s)   # hole in sub-stack 1
+    print("get(5) ->", s.get(5))                         # 7
+    print("fragmentation:", round(s.fragmentation(), 2))
+    print("pop_at(0) x2 ->", s.pop_at(0), s.pop_at(0), "| Stacks:", s)
+    print("pop_at(2) ->", s.pop_at(2), "| fragmentation:", round(s.fragmentation(), 2))
+    print("pop_at(1) ->", s.pop_at(1), "| compactions:", s.compactions, "| Stacks:", s)
+
+    print("\n-- spill to disk (memory_limit = 6 plates)")
+    with LazyStackOfPlates(3, memory_limit=6) as big:
+        for p in range(1, 16):
+            big.push(p)
+        print("Stacks:", big, "| in memory:", big.in_memory, "| spilled:", big.spilled())
+        print("get(0) loads the bottom sub-stack ->", big.get(0), "| Stacks:", big)
+        print("pop all ->", [big.pop() for _ in range(len(big))])
+
+    print()
+    benchmark()
+
+# ---------------------------------------------------------------
+# COMPLEXITY SUMMARY
+# ---------------------------------------------------------------
+"""
+Operation      | StackOfPlates | LazyStackOfPlates
+--------------------------------------------------------------
+push / pop     | O(1)          | O(1) amortized (+ O(log n) count update)
+pop_at(i)      | O(stacks)     | O(log n) + O(1) amortized compaction
+get(position)  | O(stacks)     | O(log n)
+remove(pos)    | -             | O(log n + capacity)
+compact()      | -             | O(in-memory plates), triggered lazily
+Space in RAM   | O(n)          | O(memory_limit + number of sub-stacks)
+"""
@@ -0,0 +1,451 @@
+r"""
+📘 Topic: Iterative (Generator) & Morris Traversals of a Binary Tree
+=======================================================================
+
+🎯 Purpose:
+------------
+preOrderTraversal / inOrderTraversal / postOrderTraversal (notes 02-04)
+are RECURSIVE and PRINT. Two problems:
+
+1️⃣ Every level of the tree is one Python frame. CPython stops at
+   sys.getrecursionlimit() (≈ 1000) → a degenerate ("linked list shaped")
+   tree deeper than that crashes with RecursionError.
+2️⃣ Printing means the result can't be used: no "first 10 nodes",
+   no "stop when found", no sum(...) over the values.
+
+This note adds:
+   ✅ iter_preorder / iter_inorder / iter_postorder  → explicit stack
+   ✅ iter_levelorder                                → deque (BFS)
+   ✅ morris_preorder / morris_inorder / morris_postorder
+                                                     → O(1) extra memory
+All are GENERATORS: values come out one at a time, lazily.
+Pass nodes=True to get the TreeNode objects instead of node.data.
+
+=======================================================================
+🌳 Tree Example:
+=======================================================================
+
+                 1
+               /   \
+             2       3
+            / \     / \
+           4   5   6   7
+
+PreOrder   : 1 2 4 5 3 6 7        (Root ➜ Left ➜ Right)
+InOrder    : 4 2 5 1 6 3 7        (Left ➜ Root ➜ Right)
+PostOrder  : 4 5 2 6 7 3 1        (Left ➜ Right ➜ Root)
+LevelOrder : 1 2 3 4 5 6 7        (level by level)
+
+=======================================================================
+📊 Explicit stack instead of the call stack
+=======================================================================
+Recursion keeps "where to come back to" in Python frames.
+A list used as a stack keeps the same thing as plain node references:
+
+    iter_inorder on the tree above:
+
+    step  action                     stack (top on the right)   yield
+    ----  -------------------------  -------------------------  -----
+     1    go left from 1, 2, 4       [1, 2, 4]
+     2    4 has no left → pop 4      [1, 2]                     4
+     3    4 has no right → pop 2     [1]                        2
+     4    go right to 5 → push 5     [1, 5]
+     5    pop 5                      [1]                        5
+     6    pop 1, go right to 3 ...   [3, 6]                     1
+     ...
+
+Stack size = tree height (h). Deep trees only make the LIST longer —
+no recursion limit.
+
+=======================================================================
+📊 Morris traversal — O(1) extra memory
+=======================================================================
+Idea: before going left from `current`, find its inorder PREDECESSOR
+(rightmost node of the left subtree) and set a temporary "thread":
+
+        predecessor.rightchild = current
+
+When the walk later arrives at the predecessor and follows that right
+pointer, it is back at `current` — no stack needed. The second visit
+finds the thread, removes it, and moves right.
+
+              1                        1
+            /   \                    /   \
+          2       3      thread    2       3
+         / \             ─────▶   / \
+        4   5                    4   5
+                                      ↘ (5.rightchild = 1, temporary)
+
+⚠️ The tree is MODIFIED during the walk (and restored at the end):
+   - don't change the tree while a Morris generator is running
+   - don't run two Morris walks over the same tree at the same time
+   - if the generator is closed early (break), it finishes the walk
+     silently so every thread is removed.
+
+=======================================================================
+💻 Python Implementation
+=======================================================================
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+from collections import deque
+
+
+# -----------------------------
+# CLASS DEFINITION (same as notes 03-10)
+# -----------------------------
+class TreeNode:
+    def __init__(self, data):
+        self.data = data
+        self.leftchild = None
+        self.rightchild = None
+
+
+# =============================================================
+# 🧩 METHOD 1 — Explicit-stack generators
+# =============================================================
+def iter_preorder(rootnode, nodes=False):
+    """
+    Root ➜ Left ➜ Right. Push RIGHT first so LEFT is popped first.
+    ✅ Time O(n)  ✅ Extra space O(h)
+    """
+    if not rootnode:
+        return
+    stack = [rootnode]
+    while stack:
+        node = stack.pop()
+        yield node if nodes else node.data
+        if node.rightchild is not None:
+            stack.append(node.rightchild)
+        if node.leftchild is not None:
+            stack.append(node.leftchild)
+
+
+def iter_inorder(rootnode, nodes=False):
+    """
+    Left ➜ Root ➜ Right. Slide down the left spine, pop, then go right once.
+    ✅ Time O(n)  ✅ Extra space O(h)
+    """
+    stack = []
+    node = rootnode
+    while stack or node is not None:
+        while node is not None:             # slide down the left spine
+            stack.append(node)
+            node = node.leftchild
+        node = stack.pop()
+        yield node if nodes else node.data
+        node = node.rightchild
+
+
+def iter_postorder(rootnode, nodes=False):
+    """
+    Left ➜ Right ➜ Root. A node is yielded when its right subtree is done,
+    i.e. it has no right child or the right child was the LAST node yielded.
+    ✅ Time O(n)  ✅ Extra space O(h)
+    """
+    stack = []
+    node = rootnode
+    last = None
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.leftchild
+        top = stack[-1]
+        if top.rightchild is not None and top.rightchild is not last:
+            node = top.rightchild           # right subtree not visited yet
+        else:
+            last = stack.pop()
+            yield last if nodes else last.data
+
+
+def iter_levelorder(rootnode, nodes=False):
+    """
+    Level by level (BFS) with collections.deque, like levelOrderTraversal_Deque.
+    ✅ Time O(n)  ✅ Extra space O(width)
+    """
+    if not rootnode:
+        return
+    queue = deque([rootnode])
+    while queue:
+        node = queue.popleft()
+        yield node if nodes else node.data
+        if node.leftchild is not None:
+            queue.append(node.leftchild)
+        if node.rightchild is not None:
+            queue.append(node.rightchild)
+
+
+# =============================================================
+# 🧩 METHOD 2 — Morris traversals, O(1) extra memory
+# =============================================================
+def _restore_on_close(walk):
+    """
+    Forward a Morris walk; if the consumer stops early, run the walk to the
+    end without yielding so every temporary thread is removed again.
+    """
+    try:
+        for value in walk:
+            yield value
+    finally:
+        for _ in walk:
+            pass
+
+
+def _morris_in_pre(rootnode, nodes, preorder):
+    current = rootnode
+    while current is not None:
+        left = current.leftchild
+        if left is None:
+            yield current if nodes else current.data
+            current = current.rightchild
+            continue
+        predecessor = left                  # rightmost node of the left subtree
+        while predecessor.rightchild is not None and predecessor.rightchild is not current:
+            predecessor = predecessor.rightchild
+        if predecessor.rightchild is None:  # first visit: set the thread, go left
+            if preorder:
+                yield current if nodes else current.data
+            predecessor.rightchild = current
+            current = left
+        else:                               # second visit: remove the thread, go right
+            predecessor.rightchild = None
+            if not preorder:
+                yield current if nodes else current.data
+            current = current.rightchild
+
+
+def morris_inorder(rootnode, nodes=False):
+    """
+    Left ➜ Root ➜ Right with temporary threads. Every edge is walked at most
+    3 times → ✅ Time O(n)  ✅ Extra space O(1)
+    """
+    return _restore_on_close(_morris_in_pre(rootnode, nodes, preorder=False))
+
+
+def morris_preorder(rootnode, nodes=False):
+    """Root ➜ Left ➜ Right: yield on the FIRST visit. ✅ Time O(n)  ✅ Space O(1)"""
+    return _restore_on_close(_morris_in_pre(rootnode, nodes, preorder=True))
+
+
+def _reverse_right_chain(start, end):
+    """Reverse the rightchild pointers on the path start → end (in place)."""
+    previous, node = None, start
+    while previous is not end:
+        following = node.rightchild
+        node.rightchild = previous
+        previous, node = node, following
+
+
+def _morris_post(rootnode, nodes):
+    dummy = TreeNode(None)                  # so the root's chain is handled too
+    dummy.leftchild = rootnode
+    current = dummy
+    while current is not None:
+        left = current.leftchild
+        if left is None:
+            current = current.rightchild
+            continue
+        predecessor = left
+        while predecessor.rightchild is not None and predecessor.rightchild is not current:
+            predecessor = predecessor.rightchild
+        if predecessor.rightchild is None:
+            predecessor.rightchild = current
+            current = left
+            continue
+        # second visit: output the right chain left → predecessor BACKWARDS.
+        # Reverse it in place, walk it, reverse it back (still O(1) space).
+        predecessor.rightchild = None
+        _reverse_right_chain(left, predecessor)
+        node = predecessor
+        while node is not None:
+            yield node if nodes else node.data
+            node = node.rightchild
+        _reverse_right_chain(predecessor, left)
+        current = current.rightchild
+
+
+def morris_postorder(rootnode, nodes=False):
+    """
+    Left ➜ Right ➜ Root. On the second visit of a node, its left child's
+    right chain is emitted in reverse (reverse pointers, walk, reverse back).
+    ✅ Time O(n)  ✅ Extra space O(1)
+    """
+    return _restore_on_close(_morris_post(rootnode, nodes))
+
+
+# =============================================================
+# 🧪 Tree builders for the demo / benchmark (no recursion)
+# =============================================================
+def build_complete_tree(n):
+    """Complete tree with values 1..n in level order (like a heap)."""
+    if n <= 0:
+        return None
+    allnodes = [TreeNode(value) for value in range(1, n + 1)]
+    for index, node in enumerate(allnodes):
+        left = 2 * index + 1
+        if left < n:
+            node.leftchild = allnodes[left]
+        if left + 1 < n:
+            node.rightchild = allnodes[left + 1]
+    return allnodes[0]
+
+
+def build_degenerate_tree(depth):
+    """Every node has only a LEFT child → height = depth (worst case)."""
+    root = None
+    for value in range(depth, 0, -1):
+        node = TreeNode(str(value))
+        node.leftchild = root
+        root = node
+    return root
+
+
+# -----------------------------
+# Recursive versions (same recursion as notes 02-04, collecting instead of printing)
+# -----------------------------
+def recursive_preorder(rootnode, out):
+    if not rootnode:
+        return out
+    out.append(rootnode.data)
+    recursive_preorder(rootnode.leftchild, out)
+    recursive_preorder(rootnode.rightchild, out)
+    return out
+
+
+def recursive_inorder(rootnode, out):
+    if not rootnode:
+        return out
+    recursive_inorder(rootnode.leftchild, out)
+    out.append(rootnode.data)
+    recursive_inorder(rootnode.rightchild, out)
+    return out
+
+
+def recursive_postorder(rootnode, out):
+    if not rootnode:
+        return out
+    recursive_postorder(rootnode.leftchild, out)
+    recursive_postorder(rootnode.rightchild, out)
+    out.append(rootnode.data)
+    return out
+
+
+def load_inorder_note():
+    """03_InOrder_Traversal_Binary_Tree.py (prints its demo at import → silenced)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "inorder_traversal_note", os.path.join(here, "03_InOrder_Traversal_Binary_Tree.py"))
+    mod = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(mod)
+    return mod
+
+
+# =============================================================
+# ⏱️ BENCHMARK
+# =============================================================
+def benchmark(n=1_000_000, depth=100_000, repeat=3):
+    def best(fn):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    root = build_complete_tree(n)
+    print(f"Full traversal of a complete tree, {n:,} nodes (best of {repeat}):")
+    groups = [
+        ("preorder", recursive_preorder, iter_preorder, morris_preorder),
+        ("inorder", recursive_inorder, iter_inorder, morris_inorder),
+        ("postorder", recursive_postorder, iter_postorder, morris_postorder),
+    ]
+    for name, recursive, iterative, morris in groups:
+        expected = recursive(root, [])
+        assert list(iterative(root)) == expected and list(morris(root)) == expected, name
+        print(f"  {name:<10} recursive {best(lambda: recursive(root, [])):>6.2f}s   "
+              f"iter_ {best(lambda: list(iterative(root))):>6.2f}s   "
+              f"morris_ {best(lambda: list(morris(root))):>6.2f}s")
+    print(f"  levelorder iter_levelorder {best(lambda: list(iter_levelorder(root))):>6.2f}s")
+
+    start = time.perf_counter()
+    first_ten = [value for _, value in zip(range(10), iter_inorder(root))]
+    print(f"\nLazy: first 10 inorder values {first_ten} after "
+          f"{(time.perf_counter() - start) * 1e6:.0f} µs (no full traversal)")
+
+    deep = build_degenerate_tree(depth)
+    print(f"\nDegenerate tree, depth {depth:,} (recursion limit {sys.getrecursionlimit():,}):")
+    inOrderTraversal = load_inorder_note().inOrderTraversal
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            inOrderTraversal(deep)
+        print("  inOrderTraversal (note 03)   finished")
+    except RecursionError as exc:
+        print(f"  inOrderTraversal (note 03)   RecursionError: {exc}")
+    for name, fn in [("iter_inorder", iter_inorder), ("iter_postorder", iter_postorder),
+                     ("morris_inorder", morris_inorder), ("morris_postorder", morris_postorder)]:
+        start = time.perf_counter()
+        count = sum(1 for _ in fn(deep))
+        print(f"  {name:<28} {count:,} nodes in {time.perf_counter() - start:.3f}s")
+
+
+# -----------------------------
+# FUNCTION CALLS
+# -----------------------------
+if __name__ == "__main__":
+    newBT = build_complete_tree(7)
+    print("🧭 iter_preorder   :", list(iter_preorder(newBT)))
+    print("🧭 iter_inorder    :", list(iter_inorder(newBT)))
+    print("🧭 iter_postorder  :", list(iter_postorder(newBT)))
+    print("🧭 iter_levelorder :", list(iter_levelorder(newBT)))
+    print("🧭 morris_preorder :", list(morris_preorder(newBT)))
+    print("🧭 morris_inorder  :", list(morris_inorder(newBT)))
+    print("🧭 morris_postorder:", list(morris_postorder(newBT)))
+    print("🧭 nodes=True      :", [node.data for node in iter_inorder(newBT, nodes=True)])
+    for value in morris_inorder(newBT):
+        if value == 1:
+            break                           # stops early → threads are removed
+    print("🧭 after break     :", list(iter_levelorder(newBT)), "(tree unchanged)")
+    print()
+    benchmark()
+
+
+"""
+Expected Output (values; timings vary):
+----------------
+🧭 iter_preorder   : [1, 2, 4, 5, 3, 6, 7]
+🧭 iter_inorder    : [4, 2, 5, 1, 6, 3, 7]
+🧭 iter_postorder  : [4, 5, 2, 6, 7, 3, 1]
+🧭 iter_levelorder : [1, 2, 3, 4, 5, 6, 7]
+🧭 morris_...      : same sequences as the iter_ versions
+
+=======================================================================
+🧩 Complexity Analysis
+=======================================================================
+Traversal                 Time    Extra space     Deep tree (h > 1000)
+-----------------------------------------------------------------------
+recursive (notes 02-04)   O(n)    O(h) frames     ❌ RecursionError
+iter_pre/in/postorder     O(n)    O(h) list       ✅
+iter_levelorder           O(n)    O(width)        ✅
+morris_pre/inorder        O(n)    O(1)            ✅ (tree threaded temporarily)
+morris_postorder          O(n)    O(1)            ✅ (chains reversed temporarily)
+
+=======================================================================
+✅ Summary
+=======================================================================
+✔ Generators yield one value at a time → lazy, can stop early
+✔ Explicit stacks remove the recursion limit; the stack holds h node refs
+✔ Speed on a full traversal is close: iter_preorder / iter_inorder beat the
+  recursion (one generator resume per node vs 2 calls per node, half of them
+  on None children); iter_postorder is slower (each node is looked at
+  twice on the stack). The iterative ones always win on deep trees (no crash)
+  and on partial traversals (stop after k values)
+✔ Morris walks each edge up to 3 times (slower), but needs no stack —
+  use it when memory, not speed, is the limit
+=======================================================================
+"""
@@ -0,0 +1,379 @@
+r"""
+===============================================================================
+📘 Indexed_Binary_Heap_Notes.py — Growable heap with Floyd heapify,
+   push_pop / replace and a position map for decrease_key / remove(item)
+===============================================================================
+
+Purpose
+-------
+The Heap in 03_Insert_Node_Binary_Heap.py / 04_Extract_Node_Binary_Heap.py:
+
+  - is fixed-capacity:  Heap(size) → "The Binary Tree is Full"
+  - only supports insertNode and extractNode (root only)
+  - builds a heap of n items with n × insertNode → O(n log n)
+  - compares the heapType STRING ("Min" / "Max") on every sift step
+
+IndexedHeap fixes all four:
+
+  - the list GROWS (append / pop), no capacity
+  - heapify(items) uses Floyd's bottom-up construction → O(n)
+  - push_pop / replace do "push + pop" with ONE sift instead of two
+  - a position map  item → index  lets us find ANY item in O(1), so
+    decrease_key(item, p) and remove(item) cost O(log n)
+  - Min / Max is chosen by a KEY FUNCTION, evaluated ONCE per item:
+        IndexedHeap(key=None)            → Min-Heap on the items
+        IndexedHeap(key=operator.neg)    → Max-Heap on numbers
+        IndexedHeap(key=len)             → shortest item first
+    The priority is cached next to the item, so a sift step compares two
+    plain keys (no string test, no key call).
+
+Style (same as the rest of this folder)
+-----
+- 1-based indexing, index 0 unused:
+      left = 2 * i     right = 2 * i + 1     parent = i // 2
+- Sifts are iterative and move a "hole" instead of swapping:
+      one write per level instead of three.
+
+===============================================================================
+Floyd heapify — why O(n)
+===============================================================================
+Sift DOWN every internal node, from the last parent (n // 2) back to the root:
+
+    items: 9 8 7 6 5 4 3          (n = 7, parents = 3, 2, 1)
+
+              9                         9                        3
+            /   \                     /   \                    /   \
+           8     7    sift 3 →       8     3    sift 2, 1 →   5     4
+          / \   / \                 / \   / \                / \   / \
+         6   5 4   3               6   5 4   7              6   8 9   7
+
+Half the nodes are leaves (0 work), a quarter move ≤ 1 level, an eighth ≤ 2 ...
+    total ≤ n/4·1 + n/8·2 + n/16·3 + ...  =  n  →  O(n)
+n × insertNode instead moves every item up to log n levels → O(n log n).
+
+===============================================================================
+Position map — decrease_key / remove
+===============================================================================
+    keys : [_, 1, 4, 2, 9, 5]          pos = {"a": 1, "d": 2, "b": 3,
+    items: [_, a, d, b, e, c]                 "e": 4, "c": 5}
+
+decrease_key("e", 0):  i = pos["e"] = 4 → keys[4] = 0 → sift UP from 4
+remove("d"):           i = pos["d"] = 2 → move last item into slot 2
+                       → sift up OR down (whichever the new key needs)
+Every move writes  pos[item] = new index  → map stays exact.
+"""
+
+from typing import Callable, Iterable, Optional
+
+
+class IndexedHeap:
+    """
+    Growable binary heap of UNIQUE, hashable items.
+    - keys  : cached priorities, 1-based (index 0 unused)
+    - items : the items, parallel to keys
+    - pos   : item → index in keys/items
+    """
+
+    def __init__(self, iterable: Iterable = (), key: Optional[Callable] = None):
+        """
+        Build from `iterable` with Floyd heapify. ⏱️ O(n)
+        key(item) → priority (smallest priority = root). None → the item itself.
+        """
+        self.key = key
+        self.keys = [None]
+        self.items = [None]
+        self.pos = {}
+        self.heapify(iterable)
+
+    def __len__(self):
+        return len(self.items) - 1
+
+    def __contains__(self, item):
+        return item in self.pos
+
+    def __bool__(self):
+        return len(self.items) > 1
+
+    def _priority(self, item, priority):
+        if priority is not None:
+            return priority
+        return item if self.key is None else self.key(item)
+
+    # -------------------------------------------------------------------
+    # Sift helpers (iterative, hole-based, keep `pos` exact)
+    # -------------------------------------------------------------------
+    def _sift_up(self, index: int, k, item):
+        """Place (k, item) at or above `index`. ⏱️ O(log n)"""
+        keys, items, pos = self.keys, self.items, self.pos
+        while index > 1:
+            parent = index >> 1
+            if not k < keys[parent]:
+                break
+            keys[index] = keys[parent]
+            moved = items[index] = items[parent]
+            pos[moved] = index
+            index = parent
+        keys[index] = k
+        items[index] = item
+        pos[item] = index
+
+    def _sift_down(self, index: int, k, item):
+        """Place (k, item) at or below `index`. ⏱️ O(log n)"""
+        keys, items, pos = self.keys, self.items, self.pos
+        n = len(keys) - 1
+        child = 2 * index
+        while child <= n:
+            if child < n and keys[child + 1] < keys[child]:
+                child += 1
+            if not keys[child] < k:
+                break
+            keys[index] = keys[child]
+            moved = items[index] = items[child]
+            pos[moved] = index
+            index = child
+            child = 2 * index
+        keys[index] = k
+        items[index] = item
+        pos[item] = index
+
+    def _place(self, index: int, k, item):
+        """Put (k, item) into slot `index` and move it whichever way it needs."""
+        if index > 1 and k < self.keys[index >> 1]:
+            self._sift_up(index, k, item)
+        else:
+            self._sift_down(index, k, item)
+
+    # -------------------------------------------------------------------
+    # 1️⃣ heapify (Floyd, bottom-up) — O(n)
+    # -------------------------------------------------------------------
+    def heapify(self, iterable: Iterable):
+        """Add all items, then sift down every parent from n // 2 to 1. ⏱️ O(n + m)"""
+        for item in iterable:
+            if item in self.pos:
+                raise ValueError(f"duplicate item {item!r}")
+            self.pos[item] = len(self.items)
+            self.items.append(item)
+            self.keys.append(self._priority(item, None))
+        keys, items = self.keys, self.items
+        for index in range(len(items) // 2, 0, -1):
+            self._sift_down(index, keys[index], items[index])
+
+    # -------------------------------------------------------------------
+    # 2️⃣ push / peek / pop
+    # -------------------------------------------------------------------
+    def push(self, item, priority=None):
+        """⏱️ O(log n)"""
+        if item in self.pos:
+            raise ValueError(f"item {item!r} already in heap; use update()")
+        self.keys.append(None)
+        self.items.append(None)
+        self._sift_up(len(self.items) - 1, self._priority(item, priority), item)
+
+    def peek(self):
+        """Root item. ⏱️ O(1)"""
+        if len(self.items) == 1:
+            raise IndexError("peek from empty heap")
+        return self.items[1]
+
+    def peek_priority(self):
+        if len(self.items) == 1:
+            raise IndexError("peek from empty heap")
+        return self.keys[1]
+
+    def pop(self):
+        """Remove and return the root item. ⏱️ O(log n)"""
+        if len(self.items) == 1:
+            raise IndexError("pop from empty heap")
+        root = self.items[1]
+        del self.pos[root]
+        k = self.keys.pop()
+        item = self.items.pop()
+        if len(self.items) > 1:
+            self._sift_down(1, k, item)
+        return root
+
+    # -------------------------------------------------------------------
+    # 3️⃣ push_pop / replace — one sift instead of two
+    # -------------------------------------------------------------------
+    def push_pop(self, item, priority=None):
+        """
+        Push `item`, then pop the root. If `item` itself would be the new
+        root it is returned immediately (heap untouched). ⏱️ O(log n)
+        """
+        if item in self.pos:
+            raise ValueError(f"item {item!r} already in heap; use update()")
+        k = self._priority(item, priority)
+        if len(self.items) == 1 or not self.keys[1] < k:
+            return item
+        root = self.items[1]
+        del self.pos[root]
+        self._sift_down(1, k, item)
+        return root
+
+    def replace(self, item, priority=None):
+        """
+        Pop the root, then push `item` (the root is returned even if `item`
+        is smaller). ⏱️ O(log n)
+        """
+        if len(self.items) == 1:
+            raise IndexError("replace on empty heap")
+        root = self.items[1]
+        del self.pos[root]
+        if item in self.pos:
+            self.pos[root] = 1
+            raise ValueError(f"item {item!r} already in heap; use update()")
+        self._sift_down(1, self._priority(item, priority), item)
+        return root
+
+    # -------------------------------------------------------------------
+    # 4️⃣ decrease_key / update / remove — need the position map
+    # -------------------------------------------------------------------
+    def priority(self, item):
+        return self.keys[self.pos[item]]
+
+    def decrease_key(self, item, priority):
+        """Lower the priority of `item` (move it toward the root). ⏱️ O(log n)"""
+        index = self.pos[item]
+        if self.keys[index] < priority:
+            raise ValueError("decrease_key: new priority is larger than the current one")
+        self._sift_up(index, priority, item)
+
+    def update(self, item, priority=None):
+        """Set a new priority (up or down); None → recompute key(item). ⏱️ O(log n)"""
+        self._place(self.pos[item], self._priority(item, priority), item)
+
+    def remove(self, item):
+        """Delete an arbitrary item. ⏱️ O(log n)"""
+        index = self.pos.pop(item)
+        k = self.keys.pop()
+        last = self.items.pop()
+        if index < len(self.items):             # removed slot was not the last one
+            self._place(index, k, last)
+
+    def __iter__(self):
+        """Items in heap (array) order, NOT sorted."""
+        return iter(self.items[1:])
+
+    def _debug(self) -> str:
+        return " ".join(f"{item}:{k}" for k, item in zip(self.keys[1:], self.items[1:]))
+
+
+# -----------------------------------------------------------------------
+# BENCHMARK — n × insertNode vs Floyd heapify (and heapq for reference)
+# -----------------------------------------------------------------------
+def load_insert_node_module():
+    """Load 03_Insert_Node_Binary_Heap.py (its name starts with a digit)."""
+    import importlib.util
+    import os
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "insert_node_binary_heap", os.path.join(here, "03_Insert_Node_Binary_Heap.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def benchmark(sizes=(10_000, 100_000, 1_000_000)):
+    import heapq
+    import random
+    import time
+
+    mod = load_insert_node_module()
+    print("Build a Min-Heap from n random ints:")
+    print(f"  {'n':>10} {'n × insertNode':>15} {'IndexedHeap':>12} {'heapq.heapify':>14}")
+    for n in sizes:
+        values = random.Random(n).sample(range(10 * n), n)
+        if n <= 100_000:
+            start = time.perf_counter()
+            old = mod.Heap(n)
+            for v in values:
+                mod.insertNode(old, v, "Min")
+            t_old = f"{time.perf_counter() - start:>14.3f}s"
+        else:
+            t_old = f"{'(skipped)':>15}"
+        start = time.perf_counter()
+        IndexedHeap(values)
+        t_new = time.perf_counter() - start
+        start = time.perf_counter()
+        heapq.heapify(list(values))
+        t_hq = time.perf_counter() - start
+        print(f"  {n:>10,} {t_old} {t_new:>11.3f}s {t_hq:>13.4f}s")
+
+    n, updates = 100_000, 100_000
+    rng = random.Random(1)
+    print(f"\nDijkstra-style: {n:,} items, {updates:,} decrease_key, then drain:")
+    heap = IndexedHeap(range(n), key=lambda item: n + item)
+    start = time.perf_counter()
+    for _ in range(updates):
+        item = rng.randrange(n)
+        p = heap.priority(item) - rng.randrange(1, n)
+        heap.decrease_key(item, p)
+    while heap:
+        heap.pop()
+    t_idx = time.perf_counter() - start
+
+    lazy = [(n + i, i) for i in range(n)]
+    best = {i: n + i for i in range(n)}
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(updates):
+        item = rng.randrange(n)
+        p = best[item] - rng.randrange(1, n)
+        best[item] = p
+        heapq.heappush(lazy, (p, item))
+    while lazy:
+        p, item = heapq.heappop(lazy)
+        if p != best[item]:
+            continue                            # stale entry
+    t_lazy = time.perf_counter() - start
+    print(f"  IndexedHeap.decrease_key        {t_idx:.3f}s  (heap holds n items)")
+    print(f"  heapq + lazy deletion           {t_lazy:.3f}s  (heap grows to n + updates)")
+
+
+# -----------------------------------------------------------------------
+# DEMO
+# -----------------------------------------------------------------------
+if __name__ == "__main__":
+    import operator
+
+    h = IndexedHeap([9, 8, 7, 6, 5, 4, 3])
+    print("Floyd heapify(9..3):", h.items[1:])
+    print("push_pop(1) →", h.push_pop(1), "| push_pop(10) →", h.push_pop(10), "|", h.items[1:])
+    print("replace(1)  →", h.replace(1), "|", h.items[1:])
+
+    mx = IndexedHeap([4, 5, 6, 3, 2, 1, 7], key=operator.neg)
+    print("\nMax-Heap via key=operator.neg:", mx.items[1:], "| pop →", mx.pop())
+
+    tasks = IndexedHeap(key=len)
+    for name in ["backup", "db", "email", "cron", "a"]:
+        tasks.push(name)
+    print("\nkey=len:", tasks._debug())
+    tasks.decrease_key("backup", 0)
+    print("decrease_key('backup', 0):", tasks._debug())
+    tasks.remove("cron")
+    tasks.update("a", 99)
+    print("remove('cron'), update('a', 99):", tasks._debug())
+    print("drain:", [tasks.pop() for _ in range(len(tasks))])
+    print()
+    benchmark()
+
+
+"""
+===============================================================================
+📘 SUMMARY TABLE
+===============================================================================
+Operation                 IndexedHeap          Heap + insertNode/extractNode
+-------------------------------------------------------------------------------
+Build from n items        O(n)   (Floyd)       O(n log n)  (n × insertNode)
+push / pop                O(log n)             O(log n)    (fixed capacity)
+push_pop / replace        O(log n), one sift   —           (two operations)
+peek                      O(1)                 O(1)
+decrease_key / update     O(log n)             —  (item cannot be located)
+remove(item)              O(log n)             —
+contains                  O(1)   (pos map)     O(n)
+Min / Max                 key function,        heapType string compared on
+                          evaluated once       every sift step
+Space                     O(n) + pos map       O(capacity)
+===============================================================================
+"""
@@ -0,0 +1,231 @@
+r"""
+===============================================================================
+📘 DAry_Typed_Array_Heap_Notes.py — d-ary heap (2 / 4 / 8 children) with
+   optional array('q') / array('d') key storage and a parallel payload list
+===============================================================================
+
+Purpose
+-------
+The Heap in 02_Creation_Peek_SizeOfHeap.py stores boxed Python values in a
+1-indexed list and every node has exactly 2 children. For integer-keyed
+scheduling (timers, deadlines, event times) two knobs help:
+
+  1) ARITY d — each node has d children instead of 2
+        height = log_d(n)   →   d = 4 halves the levels, d = 8 thirds them
+        push  (sift UP)   : one compare per level  → fewer levels = faster
+        pop   (sift DOWN) : d - 1 compares per level to find the min child,
+                            but those children sit NEXT to each other in
+                            the array (one cache line), and one slice +
+                            min() finds the smallest in C
+  2) TYPED KEYS — keys in array('q') (int64) or array('d') (float64):
+        8 bytes per key instead of an 8-byte pointer + a 28-32 byte int
+        object, contiguous in memory; the payload (task, callback ...)
+        lives in a parallel Python list at the same index
+
+Style
+-----
+- 0-based indexing here: for a d-ary heap the 0-based formulas stay simple
+  for every d (the 1-based trick of the binary files only works for d = 2):
+        children of i : d*i + 1  ...  d*i + d
+        parent of i   : (i - 1) // d
+- Min-heap on keys. For a max-heap push -key (the keys are numbers).
+- Hole-based iterative sifts, keys and payloads moved together.
+
+===============================================================================
+4-ary heap (keys only)
+===============================================================================
+    index:  0 | 1  2  3  4 | 5  6  7  8   9 10 11 12 ...
+    keys :  1 | 3  2  6  4 | 7  5  9  8 ...
+            ↑   children     children of 1 (indices 5..8)
+           root  of 0
+
+              1
+      ┌────┬──┴──┬────┐
+      3    2     6    4         height for 1,000,000 keys:
+    ┌┬┴┬┐                          binary 20 levels, 4-ary 10, 8-ary 7
+    7 5 9 8
+"""
+
+from array import array
+from typing import Optional
+
+
+class DAryHeap:
+    """
+    Min-heap keyed by numbers, with a payload per key.
+    - keys     : list, or array(typecode) when typecode is given
+    - payloads : list parallel to keys (None entries if you only need keys)
+    - d        : arity (children per node)
+    """
+
+    def __init__(self, d: int = 4, typecode: Optional[str] = None):
+        if d < 2:
+            raise ValueError("arity must be >= 2")
+        if typecode is not None and typecode not in "bBhHiIlLqQfd":
+            raise ValueError(f"unsupported typecode {typecode!r}")
+        self.d = d
+        self.typecode = typecode
+        self.keys = array(typecode) if typecode else []
+        self.payloads = []
+
+    def __len__(self):
+        return len(self.payloads)
+
+    def __bool__(self):
+        return bool(self.payloads)
+
+    # -------------------------------------------------------------------
+    # Sift helpers
+    # -------------------------------------------------------------------
+    def _sift_up(self, index: int, key, payload):
+        keys, payloads, d = self.keys, self.payloads, self.d
+        while index:
+            parent = (index - 1) // d
+            if not key < keys[parent]:
+                break
+            keys[index] = keys[parent]
+            payloads[index] = payloads[parent]
+            index = parent
+        keys[index] = key
+        payloads[index] = payload
+
+    def _sift_down(self, index: int, key, payload):
+        keys, payloads, d = self.keys, self.payloads, self.d
+        n = len(payloads)
+        child = d * index + 1
+        while child < n:
+            if d == 2:
+                if child + 1 < n and keys[child + 1] < keys[child]:
+                    child += 1
+                smallest = keys[child]
+            else:
+                siblings = keys[child:child + d]        # one C-level slice
+                smallest = min(siblings)
+                child += siblings.index(smallest)
+            if not smallest < key:
+                break
+            keys[index] = smallest
+            payloads[index] = payloads[child]
+            index = child
+            child = d * index + 1
+        keys[index] = key
+        payloads[index] = payload
+
+    # -------------------------------------------------------------------
+    # 1️⃣ heapify — Floyd, O(n)
+    # -------------------------------------------------------------------
+    @classmethod
+    def heapify(cls, keys, payloads=None, d: int = 4, typecode: Optional[str] = None):
+        """Build from parallel key / payload sequences. ⏱️ O(n)"""
+        heap = cls(d, typecode)
+        heap.keys.extend(keys)
+        heap.payloads = list(payloads) if payloads is not None else [None] * len(heap.keys)
+        if len(heap.payloads) != len(heap.keys):
+            raise ValueError("keys and payloads differ in length")
+        for index in range((len(heap.keys) - 2) // d, -1, -1):
+            heap._sift_down(index, heap.keys[index], heap.payloads[index])
+        return heap
+
+    # -------------------------------------------------------------------
+    # 2️⃣ push / peek / pop / push_pop
+    # -------------------------------------------------------------------
+    def push(self, key, payload=None):
+        """⏱️ O(log_d n)"""
+        self.keys.append(key)
+        self.payloads.append(payload)
+        self._sift_up(len(self.payloads) - 1, key, payload)
+
+    def push_many(self, keys, payloads=None):
+        """
+        Push a batch. A batch larger than the heap is appended and the whole
+        array re-heapified (Floyd), which is cheaper than k sift-ups.
+        ⏱️ O(min(k log_d n, n + k))
+        """
+        keys = list(keys)
+        payloads = list(payloads) if payloads is not None else [None] * len(keys)
+        if len(payloads) != len(keys):
+            raise ValueError("keys and payloads differ in length")
+        if len(keys) <= len(self.payloads):
+            for key, payload in zip(keys, payloads):
+                self.push(key, payload)
+            return
+        self.keys.extend(keys)
+        self.payloads.extend(payloads)
+        for index in range((len(self.payloads) - 2) // self.d, -1, -1):
+            self._sift_down(index, self.keys[index], self.payloads[index])
+
+    def peek(self):
+        """(key, payload) of the root. ⏱️ O(1)"""
+        if not self.payloads:
+            raise IndexError("peek from empty heap")
+        return self.keys[0], self.payloads[0]
+
+    def pop(self):
+        """Remove and return (key, payload) with the smallest key. ⏱️ O(d log_d n)"""
+        if not self.payloads:
+            raise IndexError("pop from empty heap")
+        key = self.keys.pop()
+        payload = self.payloads.pop()
+        if not self.payloads:
+            return key, payload
+        top = self.keys[0], self.payloads[0]
+        self._sift_down(0, key, payload)
+        return top
+
+    def push_pop(self, key, payload=None):
+        """Push then pop in ONE sift; returns (key, payload). ⏱️ O(d log_d n)"""
+        if not self.payloads or not self.keys[0] < key:
+            return key, payload
+        top = self.keys[0], self.payloads[0]
+        self._sift_down(0, key, payload)
+        return top
+
+    def nbytes(self):
+        """Approximate bytes held by the key storage (not counting payloads)."""
+        import sys
+
+        if self.typecode:
+            return self.keys.buffer_info()[1] * self.keys.itemsize
+        return sys.getsizeof(self.keys) + sum(sys.getsizeof(k) for k in self.keys)
+
+
+# -----------------------------------------------------------------------
+# DEMO (the benchmark suite is 09_Heap_Benchmark_Suite.py)
+# -----------------------------------------------------------------------
+if __name__ == "__main__":
+    import random
+
+    rng = random.Random(7)
+    keys = [rng.randrange(100) for _ in range(12)]
+    for d in (2, 4, 8):
+        h = DAryHeap.heapify(keys, [f"task{k}" for k in keys], d=d, typecode="q")
+        print(f"{d}-ary heapify:", list(h.keys))
+        print("   pops:", [h.pop()[0] for _ in range(len(h))])
+
+    h = DAryHeap(d=4, typecode="d")
+    for t, name in [(3.5, "flush"), (0.25, "tick"), (9.0, "gc"), (1.0, "poll")]:
+        h.push(t, name)
+    print("\ntimer heap peek:", h.peek(), "| push_pop(0.1) →", h.push_pop(0.1, "now"))
+
+    n = 1_000_000
+    values = [rng.randrange(2**40) for _ in range(n)]
+    for typecode in (None, "q"):
+        h = DAryHeap.heapify(values, d=4, typecode=typecode)
+        label = "list of int" if typecode is None else "array('q')"
+        print(f"{n:,} keys as {label:<12}: {h.nbytes() / 2**20:6.1f} MiB")
+
+
+"""
+===============================================================================
+📘 SUMMARY TABLE
+===============================================================================
+Operation        binary Heap (02/03/04)   DAryHeap(d)
+-------------------------------------------------------------------------------
+levels           log2 n                   log_d n
+push             O(log2 n)                O(log_d n)          ← fewer levels
+pop              O(log2 n), 2 cmp/level   O(d · log_d n), children contiguous
+heapify          n × insert, O(n log n)   Floyd, O(n)
+key storage      boxed objects            list, or array('q'/'d') 8 B per key
+capacity         fixed Heap(size)         grows
+===============================================================================
+"""
@@ -0,0 +1,157 @@
+r"""
+===============================================================================
+📘 Heap_Benchmark_Suite.py — insertNode / extractNode vs DAryHeap (2/4/8-ary,
+   list or array keys) vs heapq on push-heavy, pop-heavy and mixed workloads
+===============================================================================
+
+Contenders
+----------
+  insertNode/extractNode   04_Extract_Node_Binary_Heap.py (fixed Heap(size),
+                           recursive sifts, heapType string compared per step)
+  DAryHeap d=2/4/8         08_DAry_Typed_Array_Heap.py, keys in a list
+  DAryHeap d=4 'q'         same, keys in array('q')
+  heapq                    C implementation (the lower bound in CPython)
+
+Workloads (integer keys, like a timer / deadline scheduler)
+---------
+  push-heavy : push n keys, pop n / 10            (queue keeps growing)
+  pop-heavy  : start from n keys, pop all n       (draining a backlog)
+  mixed      : hold m = n / 10 keys; n times pop the earliest deadline and
+               push a new one at  popped + random delay   (steady state)
+
+Every contender is driven through the same two callables push(key) and
+pop() so the per-call overhead is identical; the numbers compare the heaps,
+not the harness.
+"""
+
+import heapq
+import importlib.util
+import os
+import random
+import time
+
+
+def _load(filename, name):
+    """Load a sibling note file (names start with a digit)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(name, os.path.join(here, filename))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# -----------------------------------------------------------------------
+# Contenders: make(capacity, initial_keys) → (push, pop)
+# -----------------------------------------------------------------------
+def _old_heap(capacity, initial):
+    mod = _load("04_Extract_Node_Binary_Heap.py", "extract_node_binary_heap")
+    h = mod.Heap(capacity)
+    insert, extract = mod.insertNode, mod.extractNode
+    for k in initial:
+        insert(h, k, "Min")
+    return (lambda k: insert(h, k, "Min")), (lambda: extract(h, "Min"))
+
+
+def _dary(d, typecode=None):
+    mod = _load("08_DAry_Typed_Array_Heap.py", "dary_heap")
+
+    def make(capacity, initial):
+        h = mod.DAryHeap.heapify(initial, d=d, typecode=typecode)
+        return h.push, (lambda: h.pop()[0])
+    return make
+
+
+def _heapq(capacity, initial):
+    h = list(initial)
+    heapq.heapify(h)
+    return (lambda k: heapq.heappush(h, k)), (lambda: heapq.heappop(h))
+
+
+CONTENDERS = [
+    ("insertNode/extractNode", _old_heap),
+    ("DAryHeap d=2", _dary(2)),
+    ("DAryHeap d=4", _dary(4)),
+    ("DAryHeap d=8", _dary(8)),
+    ("DAryHeap d=4 array('q')", _dary(4, "q")),
+    ("heapq", _heapq),
+]
+
+
+# -----------------------------------------------------------------------
+# Workloads: (initial_keys, ops, run(push, pop)) — timing covers run() only
+# -----------------------------------------------------------------------
+def push_heavy(n, rng):
+    keys = [rng.randrange(2**40) for _ in range(n)]
+
+    def run(push, pop):
+        for k in keys:
+            push(k)
+        for _ in range(n // 10):
+            pop()
+    return [], n + n // 10, run
+
+
+def pop_heavy(n, rng):
+    initial = [rng.randrange(2**40) for _ in range(n)]
+
+    def run(push, pop):
+        for _ in range(n):
+            pop()
+    return initial, n, run
+
+
+def mixed(n, rng):
+    m = max(1, n // 10)
+    initial = [rng.randrange(10_000) for _ in range(m)]
+    delays = [rng.randrange(1, 10_000) for _ in range(n)]
+
+    def run(push, pop):
+        for delay in delays:
+            push(pop() + delay)
+    return initial, 2 * n, run
+
+
+WORKLOADS = [("push-heavy", push_heavy), ("pop-heavy", pop_heavy), ("mixed", mixed)]
+
+
+def run_suite(n=200_000, repeat=3):
+    """Print ops/s (push + pop calls per second) for every contender × workload."""
+    print(f"n = {n:,}, best of {repeat}, integer keys")
+    header = f"  {'contender':<24}" + "".join(f"{name:>14}" for name, _ in WORKLOADS)
+    print(header)
+    print("  " + "-" * (len(header) - 2))
+    for label, make in CONTENDERS:
+        row = f"  {label:<24}"
+        for _, workload in WORKLOADS:
+            best = float("inf")
+            for r in range(repeat):
+                initial, ops, run = workload(n, random.Random(r))
+                push, pop = make(n + 1, initial)
+                start = time.perf_counter()
+                run(push, pop)
+                best = min(best, time.perf_counter() - start)
+            row += f"{ops / best / 1e6:>10.2f} M/s"
+        print(row)
+
+
+if __name__ == "__main__":
+    run_suite()
+
+
+"""
+===============================================================================
+📘 READING THE RESULTS
+===============================================================================
+- insertNode/extractNode pay for recursion (one Python frame per level) and
+  for the heapType string test on every step → slowest everywhere.
+- push-heavy favours larger d: sift-up does ONE compare per level and a
+  4/8-ary heap has half/a third of the levels.
+- pop-heavy and mixed favour d = 2: sift-down must find the smallest of d
+  children per level (slice + min + index). In pure Python those extra calls
+  cost more than the levels saved; in C, where cache misses dominate, d = 4
+  usually wins instead.
+- array('q') keys cost a little speed (every read boxes a new int) but hold
+  keys in 8 bytes instead of ~36 → use it when memory, not speed, is the limit.
+- heapq is written in C; it is the ceiling for any pure-Python heap.
+===============================================================================
+"""
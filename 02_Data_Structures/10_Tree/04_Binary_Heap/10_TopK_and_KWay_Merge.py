@@ -0,0 +1,235 @@
+r"""
+===============================================================================
+📘 TopK_and_KWay_Merge_Notes.py — streaming top_k and k-way merge_sorted
+   built on Heap / insertNode / extractNode (04_Extract_Node_Binary_Heap.py)
+===============================================================================
+
+Purpose
+-------
+Two everyday jobs that never need the WHOLE input in memory:
+
+  1) top_k(iterable, k, key)  — "top 100 of a 10⁹-row stream"
+        sorted(stream)[:k] holds all n rows → O(n) memory, O(n log n) time.
+        A heap of size k holds only the best k seen so far:
+            O(k) memory, O(n log k) time (and most rows cost ONE compare).
+
+  2) merge_sorted(*iterables, key)  — "merge 500 sorted run files"
+        A heap holds ONE head element per run → O(k) memory for k runs,
+        O(N log k) time for N total elements, output streams lazily.
+
+Both use the folder's own fixed-capacity Heap(size) with insertNode /
+extractNode — a bounded heap is exactly what Heap(k) already is.
+
+Both are generators and plain callables f(iterable, k) / f(*runs), so any
+timing loop (like the examples in 01_Big-O) can call them directly.
+
+===============================================================================
+top_k with a MIN-heap of size k
+===============================================================================
+The root is the WEAKEST of the current top k:
+
+    k = 3, stream: 5 1 9 3 7 8
+
+    5 1 9  → heap full        root 1  (weakest of {1, 5, 9})
+    3      → 3 > root 1  → replace root, sift down  → {3, 5, 9}  root 3
+    7      → 7 > root 3  → replace root              → {5, 7, 9}  root 5
+    8      → 8 > root 5  → replace root              → {7, 8, 9}  root 7
+    result (largest first): 9 8 7
+
+"replace root + heapifyTreeExtract(root)" = push and pop in ONE sift.
+Entries are (key, -position, item): ties keep the EARLIER item, exactly like
+sorted(..., reverse=True)[:k], and items themselves are never compared.
+
+===============================================================================
+k-way merge
+===============================================================================
+    run 0: 1 4 7        heap = {(1,0), (2,1), (3,2)}      (key, run index)
+    run 1: 2 5 8        pop (1,0) → yield 1 → next of run 0 is 4
+    run 2: 3 6 9            → replace root with (4,0), sift down
+                        ... a finished run → extractNode (heap shrinks)
+"""
+
+import importlib.util
+import os
+from itertools import count
+
+
+def load_extract_node_module():
+    """Load 04_Extract_Node_Binary_Heap.py (its name starts with a digit)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "extract_node_binary_heap", os.path.join(here, "04_Extract_Node_Binary_Heap.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+_heap = load_extract_node_module()
+Heap, insertNode, extractNode = _heap.Heap, _heap.insertNode, _heap.extractNode
+heapifyTreeExtract = _heap.heapifyTreeExtract
+
+
+def _replace_root(heap, entry, heapType):
+    """Overwrite the root and sift it down: push + pop in one pass. ⏱️ O(log k)"""
+    heap.customList[1] = entry
+    heapifyTreeExtract(heap, 1, heapType)
+
+
+# -----------------------------------------------------------------------
+# 1️⃣ top_k — bounded heap, O(k) memory
+# -----------------------------------------------------------------------
+def top_k(iterable, k, key=None, largest=True):
+    """
+    Yield the k largest items (largest first), or the k smallest with
+    largest=False (smallest first). Same result as
+    sorted(iterable, key=key, reverse=largest)[:k].
+    ⏱️ O(n log k) | 💾 O(k)
+    """
+    if k <= 0:
+        return
+    # keep the k best in a heap whose ROOT is the weakest of them
+    heapType = "Min" if largest else "Max"
+    sign = -1 if largest else 1                 # ties: earlier position wins
+    heap = Heap(k)
+    it = iter(iterable)
+    position = count()
+    for item in it:                              # fill phase
+        insertNode(heap, (item if key is None else key(item), sign * next(position), item),
+                   heapType)
+        if heap.heapSize == k:
+            break
+    customList = heap.customList
+    for item in it:                              # steady state: 1 compare per item
+        entry = (item if key is None else key(item), sign * next(position), item)
+        if (entry > customList[1]) if largest else (entry < customList[1]):
+            _replace_root(heap, entry, heapType)
+    best = []
+    while heap.heapSize:
+        best.append(extractNode(heap, heapType)[2])
+    yield from reversed(best)
+
+
+# -----------------------------------------------------------------------
+# 2️⃣ merge_sorted — k-way merge, O(k) memory
+# -----------------------------------------------------------------------
+def merge_sorted(*iterables, key=None):
+    """
+    Lazily merge already-sorted iterables into one sorted stream.
+    Stable: equal keys come out in argument order (like heapq.merge).
+    ⏱️ O(N log k) | 💾 O(k)
+    """
+    runs = [iter(run) for run in iterables]
+    heap = Heap(max(1, len(runs)))
+    for index, run in enumerate(runs):
+        for value in run:
+            insertNode(heap, (value if key is None else key(value), index, value), "Min")
+            break
+    customList = heap.customList
+    while heap.heapSize > 1:
+        _, index, value = customList[1]
+        yield value
+        for nxt in runs[index]:
+            _replace_root(heap, (nxt if key is None else key(nxt), index, nxt), "Min")
+            break
+        else:
+            extractNode(heap, "Min")             # run exhausted
+    if heap.heapSize:                            # one run left: no heap needed
+        _, index, value = customList[1]
+        yield value
+        yield from runs[index]
+
+
+# -----------------------------------------------------------------------
+# BENCHMARK — vs sorted()[:k] and heapq
+# -----------------------------------------------------------------------
+def _timed(fn):
+    import time
+
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def _peak_memory(fn):
+    import tracemalloc
+
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def benchmark(n=1_000_000, k=100, runs=500):
+    import heapq
+    import random
+
+    rng = random.Random(22)
+
+    def stream():                                # rows arrive one by one
+        for _ in range(n):
+            yield rng.random()
+
+    print(f"top {k} of a {n:,}-row stream:")
+    for name, fn in [("sorted()[:k]", lambda: sorted(stream(), reverse=True)[:k]),
+                     ("heapq.nlargest", lambda: heapq.nlargest(k, stream())),
+                     ("top_k", lambda: list(top_k(stream(), k)))]:
+        secs, _ = _timed(fn)
+        peak = _peak_memory(fn)
+        print(f"  {name:<16} {secs:>6.2f}s   peak heap {peak / 2**20:>7.2f} MiB")
+
+    print("\ntop_k time as n doubles (O(n log k) with k fixed → ≈ ×2):")
+    previous = None
+    for size in (n // 4, n // 2, n):
+        data = [rng.random() for _ in range(size)]
+        secs, _ = _timed(lambda: list(top_k(data, k)))
+        ratio = f"×{secs / previous:.2f}" if previous else ""
+        print(f"  n = {size:>9,}  {secs:>6.3f}s {ratio}")
+        previous = secs
+
+    per_run = n // runs
+    sorted_runs = [sorted(rng.random() for _ in range(per_run)) for _ in range(runs)]
+    print(f"\nmerge {runs} sorted runs of {per_run:,} values:")
+    for name, fn in [("sorted(chain)", lambda: sorted(v for run in sorted_runs for v in run)),
+                     ("heapq.merge", lambda: list(heapq.merge(*sorted_runs))),
+                     ("merge_sorted", lambda: list(merge_sorted(*sorted_runs)))]:
+        secs, result = _timed(fn)
+        print(f"  {name:<16} {secs:>6.2f}s")
+    first = next(merge_sorted(*sorted_runs))
+    print(f"  first merged value available after reading {runs} values: {first:.6f}")
+
+
+# -----------------------------------------------------------------------
+# DEMO
+# -----------------------------------------------------------------------
+if __name__ == "__main__":
+    print("top_k([5, 1, 9, 3, 7, 8], 3)          →", list(top_k([5, 1, 9, 3, 7, 8], 3)))
+    print("top_k(..., 3, largest=False)          →",
+          list(top_k([5, 1, 9, 3, 7, 8], 3, largest=False)))
+    words = ["pear", "fig", "banana", "kiwi", "apple", "plum"]
+    print("top_k(words, 3, key=len)              →", list(top_k(words, 3, key=len)))
+    print("merge_sorted([1,4,7], [2,5,8], [3,6,9]) →",
+          list(merge_sorted([1, 4, 7], [2, 5, 8], [3, 6, 9])))
+    print("merge_sorted by key=len               →",
+          list(merge_sorted(["a", "bbb"], ["cc", "dddd"], key=len)))
+    print()
+    benchmark()
+
+
+"""
+===============================================================================
+📘 SUMMARY TABLE
+===============================================================================
+Operation                     Time            Memory    Streams output?
+-------------------------------------------------------------------------------
+sorted(stream)[:k]            O(n log n)      O(n)      no (needs all input)
+top_k(stream, k)              O(n log k)      O(k)      after the input ends
+heapq.nlargest(k, stream)     O(n log k)      O(k)      after the input ends
+sorted(chain(runs))           O(N log N)      O(N)      no
+merge_sorted(*runs)           O(N log k)      O(k)      yes, lazily
+heapq.merge(*runs)            O(N log k)      O(k)      yes, lazily
+
+(heapq is written in C; top_k / merge_sorted show the same algorithm on the
+ folder's own Heap, with the same O(k) memory bound.)
+===============================================================================
+"""
@@ -0,0 +1,355 @@
+r"""
+===============================================================================
+📘 Pairing_and_Radix_Heap_Notes.py — two heaps for Dijkstra-style workloads,
+   usable through the same insertNode / extractNode / peekOfHeap / sizeOfHeap
+   functions as the binary Heap in this folder
+===============================================================================
+
+Purpose
+-------
+Shortest-path searches do three things over and over:
+
+    insert (vertex, tentative distance)      ← once per relaxed edge
+    extract-min                              ← once per settled vertex
+    decrease-key (vertex found a shorter way)
+
+Binary heap (03/04 files, 07_Indexed_Binary_Heap.py): every one is O(log n).
+
+1) PAIRING HEAP — a heap-ordered multi-way TREE of nodes
+        insert / meld   : O(1)      (link two roots: larger root becomes a child)
+        decrease-key    : O(1)-ish  (cut the subtree, link it to the root;
+                                     amortized o(log n), very fast in practice)
+        extract-min     : O(log n) amortized (two-pass pairing of the children)
+
+2) RADIX HEAP (monotone) — for NON-NEGATIVE INTEGER keys where every new key
+   is ≥ the last extracted key (true for Dijkstra with integer weights):
+        bucket i holds keys whose highest bit differing from `last` is bit i
+        insert        : O(1)   (one bit_length())
+        extract-min   : O(log C) amortized, C = largest key
+        (no decrease-key: push the vertex again, skip the stale copy)
+
+Same interface as the binary Heap
+---------------------------------
+    heap = PairingHeap()   /   RadixHeap()        (no capacity needed)
+    insertNode(heap, value, "Min")   peekOfHeap(heap)   sizeOfHeap(heap)
+    extractNode(heap, "Min")         levelOrderTraversal(heap)
+Both are MIN-heaps; heapType "Max" raises ValueError.
+The value is its own key for PairingHeap (any comparable: 5, (5, "v") ...);
+for RadixHeap the key is the value itself (int) or value[0] (tuple).
+Methods push(key, item) / pop() / decrease_key(node, key) give handles for
+decrease-key.
+
+===============================================================================
+Pairing heap — link and two-pass extract-min
+===============================================================================
+link(a, b): the root with the larger key becomes the LEFTMOST child of the other
+
+      1                 1
+     /   link 3  →     /
+    4 - 2             3 - 4 - 2        (children as a sibling list)
+
+extract-min(1): children  c1 c2 c3 c4 c5
+    pass 1 (left → right, in pairs):  link(c1,c2)  link(c3,c4)  c5
+    pass 2 (right → left):            link(link(c5, c34), c12)   → new root
+
+===============================================================================
+Radix heap — buckets by highest differing bit from `last`
+===============================================================================
+    last = 8 (0b1000)      key 8  → bucket 0  (equal to last)
+                           key 9  → bucket 1  (0b1001 ^ 0b1000 = 0b1    → 1 bit)
+                           key 12 → bucket 3  (0b1100 ^ 0b1000 = 0b100  → 3 bits)
+                           key 40 → bucket 6  (0b101000 ^ 0b1000 → 6 bits)
+    bucket 0 empty → take the first non-empty bucket, last = its min key,
+    re-bucket its items: each one lands in a LOWER bucket → every key moves
+    down at most log C times in total.
+"""
+
+from operator import itemgetter
+from typing import Any, Optional
+
+
+def _check_min(heapType):
+    if heapType not in ("Min", "MIN", "min"):
+        raise ValueError("pairing / radix heaps here are Min-heaps only")
+
+
+# -----------------------------------------------------------------------
+# 1️⃣ PAIRING HEAP
+# -----------------------------------------------------------------------
+class PairingNode:
+    __slots__ = ("key", "item", "child", "sibling", "prev")
+
+    def __init__(self, key, item):
+        self.key = key
+        self.item = item
+        self.child = None       # leftmost child
+        self.sibling = None     # next sibling to the right
+        self.prev = None        # left sibling, or the parent for a leftmost child
+
+
+class PairingHeap:
+    def __init__(self):
+        self.root: Optional[PairingNode] = None
+        self.heapSize = 0
+
+    def __len__(self):
+        return self.heapSize
+
+    @staticmethod
+    def _link(a: PairingNode, b: PairingNode) -> PairingNode:
+        """Make the larger-key root the leftmost child of the other. ⏱️ O(1)"""
+        if b.key < a.key:
+            a, b = b, a
+        first = a.child
+        b.prev = a
+        b.sibling = first
+        if first is not None:
+            first.prev = b
+        a.child = b
+        return a
+
+    def push(self, key, item=None) -> PairingNode:
+        """Insert; returns the node (handle for decrease_key). ⏱️ O(1)"""
+        node = PairingNode(key, item)
+        self.root = node if self.root is None else self._link(self.root, node)
+        self.heapSize += 1
+        return node
+
+    def meld(self, other: "PairingHeap"):
+        """Move every node of `other` into this heap. ⏱️ O(1)"""
+        if other.root is not None:
+            self.root = other.root if self.root is None else self._link(self.root, other.root)
+            self.heapSize += other.heapSize
+            other.root, other.heapSize = None, 0
+
+    def peek(self):
+        """(key, item) of the minimum. ⏱️ O(1)"""
+        if self.root is None:
+            raise IndexError("peek from empty heap")
+        return self.root.key, self.root.item
+
+    def pop(self):
+        """Remove the minimum, return (key, item). ⏱️ O(log n) amortized"""
+        root = self.root
+        if root is None:
+            raise IndexError("pop from empty heap")
+        self.heapSize -= 1
+        self.root = self._merge_pairs(root.child)
+        root.child = None
+        return root.key, root.item
+
+    def _merge_pairs(self, first: Optional[PairingNode]) -> Optional[PairingNode]:
+        """Two-pass pairing of a sibling list, without recursion."""
+        if first is None:
+            return None
+        link = self._link
+        pairs = []
+        node = first
+        while node is not None:                     # pass 1: left → right
+            a = node
+            b = a.sibling
+            if b is None:
+                a.prev = a.sibling = None
+                pairs.append(a)
+                break
+            node = b.sibling
+            a.prev = a.sibling = b.prev = b.sibling = None
+            pairs.append(link(a, b))
+        root = pairs.pop()
+        while pairs:                                # pass 2: right → left
+            root = link(pairs.pop(), root)
+        root.prev = None
+        return root
+
+    def decrease_key(self, node: PairingNode, key):
+        """Lower node.key: cut its subtree and link it to the root. ⏱️ O(1) (amortized o(log n))"""
+        if node.key < key:
+            raise ValueError("decrease_key: new key is larger than the current one")
+        node.key = key
+        if node is self.root:
+            return
+        # unlink `node` from its sibling list
+        if node.prev.child is node:                 # leftmost child: prev is the parent
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+        self.root = self._link(self.root, node)
+
+    def __iter__(self):
+        """Items in tree (pre-order) order, not sorted."""
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.item
+            if node.sibling is not None:
+                stack.append(node.sibling)
+            if node.child is not None:
+                stack.append(node.child)
+
+
+# -----------------------------------------------------------------------
+# 2️⃣ MONOTONE RADIX HEAP
+# -----------------------------------------------------------------------
+class RadixHeap:
+    def __init__(self):
+        self.buckets = [[]]     # buckets[i] = list of (key, item); grows as keys grow
+        self.last = 0           # last extracted key (keys pushed must be ≥ last)
+        self.heapSize = 0
+
+    def __len__(self):
+        return self.heapSize
+
+    def push(self, key: int, item=None):
+        """⏱️ O(1) amortized"""
+        if key < self.last:
+            raise ValueError(f"radix heap is monotone: key {key} < last extracted {self.last}")
+        index = (key ^ self.last).bit_length()
+        buckets = self.buckets
+        while len(buckets) <= index:
+            buckets.append([])
+        buckets[index].append((key, item))
+        self.heapSize += 1
+
+    def _pull(self):
+        """Make bucket 0 non-empty: redistribute the first non-empty bucket."""
+        buckets = self.buckets
+        i = 1
+        while not buckets[i]:
+            i += 1
+        moving = buckets[i]
+        buckets[i] = []
+        last = self.last = min(moving, key=itemgetter(0))[0]     # keys only: items may not be orderable
+        for entry in moving:
+            buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+    def peek(self):
+        """
+        (key, item) of the minimum, WITHOUT moving `last` (so keys between the
+        last extracted key and the peeked one may still be pushed).
+        On ties it is the entry the next pop() returns: _pull keeps bucket
+        order and pop() takes from the end → the LAST key-minimal entry.
+        ⏱️ O(1) if bucket 0 is non-empty, else O(size of the first bucket)
+        """
+        if not self.heapSize:
+            raise IndexError("peek from empty heap")
+        for bucket in self.buckets:
+            if bucket:
+                if bucket is self.buckets[0]:
+                    return bucket[-1]
+                key = min(bucket, key=itemgetter(0))[0]
+                for entry in reversed(bucket):
+                    if entry[0] == key:
+                        return entry
+
+    def pop(self):
+        """Remove the minimum, return (key, item). ⏱️ O(log C) amortized"""
+        if not self.heapSize:
+            raise IndexError("pop from empty heap")
+        if not self.buckets[0]:
+            self._pull()
+        self.heapSize -= 1
+        return self.buckets[0].pop()
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            for _, item in bucket:
+                yield item
+
+
+# -----------------------------------------------------------------------
+# 3️⃣ Binary-Heap-style functions (drop-in for insertNode / extractNode ...)
+# -----------------------------------------------------------------------
+def _key_of(rootnode, node_value):
+    if isinstance(rootnode, RadixHeap) and isinstance(node_value, tuple):
+        return node_value[0]
+    return node_value
+
+
+def insertNode(rootnode, node_value, heapType: str = "Min"):
+    _check_min(heapType)
+    rootnode.push(_key_of(rootnode, node_value), node_value)
+    return f"The value {node_value} has been successfully inserted into {heapType} Heap"
+
+
+def extractNode(rootnode, heapType: str = "Min") -> Any:
+    """Remove and return the smallest value (None when empty, like the binary Heap)."""
+    _check_min(heapType)
+    if not rootnode.heapSize:
+        return None
+    return rootnode.pop()[1]
+
+
+def peekOfHeap(rootnode):
+    if not rootnode or rootnode.heapSize == 0:
+        return "Tree is Empty"
+    return rootnode.peek()[1]
+
+
+def sizeOfHeap(rootnode):
+    if rootnode is None:
+        return "Tree is Empty"
+    return rootnode.heapSize
+
+
+def levelOrderTraversal(rootnode):
+    """Print the stored values (structure order, not sorted)."""
+    if not rootnode or rootnode.heapSize == 0:
+        print("Tree is Empty")
+        return
+    print(" ".join(str(v) for v in rootnode))
+
+
+# -----------------------------------------------------------------------
+# DEMO (Dijkstra benchmark: 14_Graph/10_Shortest_Path_Heaps.py)
+# -----------------------------------------------------------------------
+if __name__ == "__main__":
+    for make in (PairingHeap, RadixHeap):
+        heap = make()
+        for v in [4, 5, 6, 3, 2, 1, 7]:
+            insertNode(heap, v, "Min")
+        print(f"{make.__name__}: size {sizeOfHeap(heap)}, peek {peekOfHeap(heap)}, levelOrder:",
+              end=" ")
+        levelOrderTraversal(heap)
+        print("   extract all:", [extractNode(heap, "Min") for _ in range(7)])
+
+    ph = PairingHeap()
+    nodes = {name: ph.push(d, name) for name, d in [("a", 10), ("b", 20), ("c", 30), ("d", 40)]}
+    ph.pop()
+    ph.decrease_key(nodes["d"], 5)
+    print("\nPairingHeap decrease_key(d, 5) → pop:", ph.pop())
+
+    rh = RadixHeap()
+    for d, v in [(7, "x"), (3, "y"), (12, "z")]:
+        insertNode(rh, (d, v))
+    print("RadixHeap buckets:", [b for b in rh.buckets], "| extract:", extractNode(rh))
+    tie = RadixHeap()
+    for d, task in [(9, {"b": 2}), (5, {"a": 1}), (5, {"c": 3})]:
+        tie.push(d, task)                   # equal keys, dict payloads: never compared
+    peeked = tie.peek()
+    assert peeked is tie.pop()
+    print("RadixHeap tie on key 5 → peek is pop:", peeked)
+    try:
+        rh.push(1, "too small")
+    except ValueError as exc:
+        print("monotone check:", exc)
+
+
+"""
+===============================================================================
+📘 SUMMARY TABLE
+===============================================================================
+Operation        Binary Heap     Pairing Heap              Radix Heap (monotone)
+-------------------------------------------------------------------------------
+insert           O(log n)        O(1)                      O(1)
+peek             O(1)            O(1)                      O(1) amortized
+extract-min      O(log n)        O(log n) amortized        O(log C) amortized
+decrease-key     O(log n)*       O(1) cut + link           — (re-insert, skip stale)
+meld             O(n)            O(1)                      —
+keys             any             any comparable            ints ≥ last extracted
+Space            O(n) array      O(n) nodes, 5 slots each  O(n) + O(log C) buckets
+* needs a position map (07_Indexed_Binary_Heap.py)
+===============================================================================
+"""
@@ -0,0 +1,108 @@
+import os
+import importlib.util
+import random
+import unittest
+
+
+def load_indexed_heap_module():
+    here = os.path.dirname(__file__)
+    path = os.path.join(here, "07_Indexed_Binary_Heap.py")
+    spec = importlib.util.spec_from_file_location("indexed_binary_heap_mod", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+IndexedHeap = load_indexed_heap_module().IndexedHeap
+
+
+class TestIndexedHeap(unittest.TestCase):
+    def assertConsistent(self, heap):
+        """Heap order holds and pos maps every item to its slot."""
+        keys, items = heap.keys, heap.items
+        for i in range(2, len(keys)):
+            self.assertLessEqual(keys[i // 2], keys[i])
+        self.assertEqual(heap.pos, {item: i for i, item in enumerate(items) if i})
+
+    def drain(self, heap):
+        return [heap.pop() for _ in range(len(heap))]
+
+    def test_heapify_and_pop_in_order(self):
+        values = random.Random(1).sample(range(1000), 200)
+        heap = IndexedHeap(values)
+        self.assertConsistent(heap)
+        self.assertEqual(heap.peek(), min(values))
+        self.assertEqual(self.drain(heap), sorted(values))
+        with self.assertRaises(IndexError):
+            heap.pop()
+
+    def test_key_function_and_explicit_priority(self):
+        heap = IndexedHeap(["pear", "fig", "banana"], key=len)
+        heap.push("kiwi", 0)
+        self.assertEqual(heap.peek_priority(), 0)
+        self.assertEqual(self.drain(heap), ["kiwi", "fig", "pear", "banana"])
+
+    def test_decrease_key_update_remove(self):
+        heap = IndexedHeap()
+        for item, priority in [("a", 5), ("b", 9), ("c", 7), ("d", 3), ("e", 8)]:
+            heap.push(item, priority)
+        heap.decrease_key("e", 1)
+        self.assertEqual(heap.peek(), "e")
+        with self.assertRaises(ValueError):
+            heap.decrease_key("e", 4)
+        heap.update("d", 10)
+        heap.remove("c")
+        self.assertNotIn("c", heap)
+        self.assertConsistent(heap)
+        self.assertEqual(self.drain(heap), ["e", "a", "b", "d"])
+
+    def test_duplicates_rejected(self):
+        heap = IndexedHeap([5, 6])
+        with self.assertRaises(ValueError):
+            heap.push(5)
+        with self.assertRaises(ValueError):
+            heap.push_pop(5)                # even when 5 would come straight back
+        with self.assertRaises(ValueError):
+            heap.replace(6)
+        with self.assertRaises(ValueError):
+            IndexedHeap([1, 1])
+        self.assertConsistent(heap)
+        self.assertEqual(self.drain(heap), [5, 6])
+
+    def test_push_pop_and_replace(self):
+        heap = IndexedHeap([5, 7, 9])
+        self.assertEqual(heap.push_pop(1), 1)          # smaller than root: heap untouched
+        self.assertEqual(heap.push_pop(8), 5)
+        self.assertEqual(heap.replace(2), 7)           # root returned even though 2 < 7
+        self.assertConsistent(heap)
+        self.assertEqual(self.drain(heap), [2, 8, 9])
+        with self.assertRaises(IndexError):
+            heap.replace(1)
+
+    def test_random_operations_match_reference(self):
+        rng = random.Random(20)
+        heap, ref = IndexedHeap(), {}
+        for step in range(3000):
+            op = rng.randrange(4)
+            if op == 0 or not ref:
+                item = step
+                ref[item] = rng.randrange(100)
+                heap.push(item, ref[item])
+            elif op == 1:
+                smallest = min(ref.values())
+                self.assertEqual(ref.pop(heap.pop()), smallest)
+            elif op == 2:
+                item = rng.choice(list(ref))
+                ref[item] = rng.randrange(100)
+                heap.update(item, ref[item])
+            else:
+                item = rng.choice(list(ref))
+                del ref[item]
+                heap.remove(item)
+            self.assertEqual(len(heap), len(ref))
+        self.assertConsistent(heap)
+        self.assertEqual([ref[item] for item in self.drain(heap)], sorted(ref.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
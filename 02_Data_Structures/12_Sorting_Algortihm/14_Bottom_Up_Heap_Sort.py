@@ -0,0 +1,281 @@
+"""
+===============================================================================
+📘 Bottom_Up_HeapSort_Notes.py — Bottom-up (Wegener) heapsort, iterative,
+   Floyd construction, early-out sift, in-place heap_select(k) + counters
+===============================================================================
+
+What this file contains:
+- heap_sort(customList)        : ascending heapsort, ONE loop, no helper calls
+- heap_select(customList, k)   : stop after k extractions → the k largest sit
+                                 sorted at the end of the list (top-k, in place)
+- count_operations(...)        : comparisons and element writes of any sort
+                                 function (works on heapSort from 12_Heap_Sort.py
+                                 too, without changing it)
+- A benchmark against heapSort from 12_Heap_Sort.py on 10⁶ ints
+
+Run:
+    python 14_Bottom_Up_Heap_Sort.py
+
+Why a rewrite?
+- heapSort (12_Heap_Sort.py) calls the recursive heapify for every index:
+  one Python frame per LEVEL, and at every level TWO comparisons
+  (left vs smallest, right vs smallest) plus a 3-assignment swap.
+- The element sifted down during extraction came from the BOTTOM of the heap
+  (the old last leaf), so it almost always sinks back to the bottom. The
+  "parent vs child" comparison on the way down is nearly always wasted.
+- A min-heap leaves the list descending → an extra reverse() pass.
+===============================================================================
+"""
+
+# -----------------------------------------------------------------------------
+# 1) THE THREE IDEAS
+# -----------------------------------------------------------------------------
+# (a) MAX-heap: the largest goes to the end of the list at every extraction,
+#     so the list ends up ascending — no reverse().
+#
+# (b) HOLE instead of swaps: take the sifted value x out, move children UP into
+#     the hole, write x once at the end → 1 write per level instead of a swap.
+#
+# (c) BOTTOM-UP sift (Wegener, 1993):
+#       1. DESCEND: follow the larger child all the way to a leaf, moving each
+#          child up into the hole.          → ONE comparison per level
+#       2. CLIMB:   walk back up from the leaf while parent < x, moving the
+#          parent down (early-out: stops at the first parent ≥ x).
+#                                            → usually 1-2 comparisons
+#     Classic sift: 2 comparisons × log n levels.
+#     Bottom-up  : log n + (a few)          → ≈ half the comparisons.
+#
+#     Extraction with x = 1 (came from the last leaf), heap of size 7:
+#
+#            9                    hole                 8
+#          /   \                 /    \               /  \
+#         8     7     →         8      7    →        6    7
+#        / \   / \             / \    / \           / \   /
+#       6   5 4   1           6   5  4                   5 4
+#                        descend: 8>7 → hole    ...hole reaches a leaf,
+#                        moves to 8's slot,     climb: parent 6 ≥ 1 → stop,
+#                        6>5 → 6 moves up       write x=1 at the leaf
+#
+# Floyd construction: sift every non-leaf from n//2 - 1 down to 0 → O(n).
+# The same bottom-up sift is used for the build, so the build and the
+# extraction share ONE loop body (a "phase" test picks the next root/x).
+# -----------------------------------------------------------------------------
+
+import importlib.util
+import os
+import random
+import time
+
+
+def load_heap_sort_module():
+    """Load 12_Heap_Sort.py (the original heapSort; its name starts with a digit)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "heap_sort_notes", os.path.join(here, "12_Heap_Sort.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# -----------------------------------------------------------------------------
+# 2) ENGINE — build + extraction in one loop, no recursion, no helper calls
+# -----------------------------------------------------------------------------
+def _bottom_up_heap_sort(customList, stop):
+    """
+    Floyd build, then extract maxima until the heap region is customList[:stop].
+    stop = 1 → fully sorted;  stop = n - k → the k largest sorted at the end.
+    Only `<` is used on the elements.
+    """
+    n = len(customList)
+    build = n // 2              # Floyd: roots n//2 - 1 ... 0 still to sift
+    end = n                     # heap region is customList[:end]
+    while end > stop:
+        if build:               # phase A: build heap
+            build -= 1
+            root = build
+            x = customList[root]
+        else:                   # phase B: move max to the tail, sift the old last leaf
+            end -= 1
+            x = customList[end]
+            customList[end] = customList[0]
+            root = 0
+
+        # DESCEND to a leaf along the larger child (1 comparison per level)
+        hole = root
+        child = 2 * hole + 1
+        last = end - 1          # below `last` both children exist → no bound check
+        while child < last:
+            if customList[child] < customList[child + 1]:
+                child += 1
+            customList[hole] = customList[child]
+            hole = child
+            child = 2 * hole + 1
+        if child == last:       # a lone left child at the very bottom
+            customList[hole] = customList[child]
+            hole = child
+
+        # CLIMB back up while the parent is smaller than x (early-out)
+        while hole > root:
+            parent = (hole - 1) >> 1
+            if not customList[parent] < x:
+                break
+            customList[hole] = customList[parent]
+            hole = parent
+        customList[hole] = x
+
+
+def heap_sort(customList):
+    """
+    Sort customList in place, ascending (bottom-up heapsort).
+    ⏱️ O(n log n) worst case, ≈ n log2 n + O(n) comparisons | 💾 O(1)
+    """
+    _bottom_up_heap_sort(customList, 1)
+    return customList
+
+
+def heap_select(customList, k):
+    """
+    In-place partial heapsort: after the call the k largest elements are at
+    customList[-k:] in ascending order (the rest is an unsorted max-heap).
+    Returns that tail slice (largest last), like sorted(customList)[-k:].
+    ⏱️ O(n + k log n) | 💾 O(1) besides the returned slice
+    """
+    n = len(customList)
+    if k <= 0:
+        return []
+    k = min(k, n)
+    _bottom_up_heap_sort(customList, max(n - k, 1))
+    return customList[n - k:]
+
+
+# -----------------------------------------------------------------------------
+# 3) COUNTERS — comparisons and element writes of ANY sort function
+# -----------------------------------------------------------------------------
+# Instead of threading counters through the hot loops (which would slow the
+# timed versions), the input is wrapped:
+#   - every element becomes a _Counted whose __lt__ bumps the comparison count
+#   - the list becomes a _CountingList whose __setitem__ bumps the write count
+# A swap  a[i], a[j] = a[j], a[i]  is 2 writes; a hole move is 1 write.
+# (list.reverse() runs in C and does not go through __setitem__: heapSort's
+#  final reverse adds n more writes that are reported separately.)
+class _Counts:
+    __slots__ = ("comparisons", "writes")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.writes = 0
+
+
+class _Counted:
+    __slots__ = ("value", "counts")
+
+    def __init__(self, value, counts):
+        self.value = value
+        self.counts = counts
+
+    def __lt__(self, other):
+        self.counts.comparisons += 1
+        return self.value < other.value
+
+
+class _CountingList(list):
+    def __init__(self, values, counts):
+        super().__init__(values)
+        self.counts = counts
+
+    def __setitem__(self, index, value):
+        self.counts.writes += 1
+        super().__setitem__(index, value)
+
+
+def count_operations(sort_function, values):
+    """
+    Run sort_function on a wrapped copy of values.
+    Returns {"comparisons", "writes", "swaps"} (swaps = writes / 2, the cost
+    in swap units of the classic version).
+    """
+    counts = _Counts()
+    wrapped = _CountingList((_Counted(v, counts) for v in values), counts)
+    sort_function(wrapped)
+    result = [item.value for item in wrapped]
+    if result != sorted(values):
+        raise AssertionError(f"{sort_function.__name__} did not sort the input")
+    return {"comparisons": counts.comparisons, "writes": counts.writes,
+            "swaps": counts.writes / 2}
+
+
+# -----------------------------------------------------------------------------
+# 4) BENCHMARK — against heapSort from 12_Heap_Sort.py
+# -----------------------------------------------------------------------------
+def _timed(fn, data):
+    values = list(data)
+    start = time.perf_counter()
+    fn(values)
+    return time.perf_counter() - start, values
+
+
+def benchmark(n=1_000_000, count_n=100_000, k=100):
+    old = load_heap_sort_module()
+    rng = random.Random(24)
+    data = [rng.randrange(2**31) for _ in range(n)]
+    expected = sorted(data)
+
+    print(f"Sorting {n:,} random ints:")
+    for name, fn in [("heapSort (12_Heap_Sort.py)", old.heapSort),
+                     ("heap_sort (bottom-up)", heap_sort),
+                     ("sorted() (Timsort, C)", lambda a: a.sort())]:
+        secs, result = _timed(fn, data)
+        assert result == expected, name
+        print(f"  {name:<28} {secs:>7.2f}s")
+
+    secs, _ = _timed(lambda a: heap_select(a, k), data)
+    print(f"  heap_select(k={k})            {secs:>7.2f}s   "
+          f"(Floyd build + {k} extractions only)")
+
+    sample = data[:count_n]
+    print(f"\nOperation counts on {count_n:,} ints "
+          f"(n log2 n ≈ {count_n * (count_n.bit_length() - 1):,}):")
+    for name, fn in [("heapSort (12_Heap_Sort.py)", old.heapSort),
+                     ("heap_sort (bottom-up)", heap_sort)]:
+        c = count_operations(fn, sample)
+        print(f"  {name:<28} {c['comparisons']:>12,} comparisons   "
+              f"{c['writes']:>12,} writes  (= {c['swaps']:,.0f} swaps)")
+    print(f"  (heapSort also runs list.reverse(): {count_n:,} more writes, in C)")
+
+
+# -----------------------------------------------------------------------------
+# 5) RUN EXAMPLE
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    cList = [2, 1, 7, 6, 5, 3, 4, 9, 8]
+    print("Input:              ", cList)
+    print("heap_sort:          ", heap_sort(list(cList)))
+    partial = list(cList)
+    print("heap_select(k=3):   ", heap_select(partial, 3), "→ list now", partial)
+    print("counts heap_sort:   ", count_operations(heap_sort, cList))
+    print("counts heapSort:    ", count_operations(load_heap_sort_module().heapSort, cList))
+    print()
+    benchmark()
+
+
+# -----------------------------------------------------------------------------
+# 6) SUMMARY
+# -----------------------------------------------------------------------------
+"""
+Version                        Comparisons        Writes / level   Frames   Extra pass
+-------------------------------------------------------------------------------------
+heapSort (12_Heap_Sort.py)     ≈ 2 n log2 n       swap (2)         1/level  reverse()
+heap_sort (bottom-up)          ≈ n log2 n + O(n)  hole move (1)    none     none
+heap_select(k)                 O(n + k log n)     hole move (1)    none     none
+
+- Time O(n log n) worst case for both sorts, O(1) extra space (no recursion
+  stack in the bottom-up version).
+- Not stable (same as every heapsort).
+- heap_select(k) is the partial form: build once (O(n)), pull only k maxima.
+- On ints the wall-clock gain is small (≈5-10%): comparing two small ints is
+  as cheap as any other bytecode, so halving comparisons mostly saves the
+  interpreter loop. The gap grows with expensive comparisons (tuples, strings,
+  objects with __lt__), where comparisons dominate the cost.
+- sorted() stays far faster in CPython (Timsort in C); heapsort's value is the
+  O(1)-space, O(n log n)-worst-case guarantee.
+"""
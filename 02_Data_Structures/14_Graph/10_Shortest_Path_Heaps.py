@@ -0,0 +1,222 @@
+# =============================================================================
+#   📘 Shortest_Path_Heaps_Notes.py — Dijkstra on the Graph class with
+#      binary / indexed / pairing / radix heaps swapped in
+# =============================================================================
+"""
+This note runs Dijkstra's shortest paths on the dictionary Graph from
+05_Create_Graph.py and swaps the priority queue underneath it:
+
+        ✔ Heap + insertNode / extractNode   (10_Tree/04_Binary_Heap/04_...)
+        ✔ IndexedHeap with decrease_key      (10_Tree/04_Binary_Heap/07_...)
+        ✔ PairingHeap, lazy and decrease_key (10_Tree/04_Binary_Heap/11_...)
+        ✔ RadixHeap (monotone integer keys)  (10_Tree/04_Binary_Heap/11_...)
+        ✔ heapq (C reference)
+
+Weighted graph, same Graph class — a neighbour is stored as (vertex, weight):
+
+        graph_dict = {
+            0: [(1, 7), (2, 3)],
+            1: [(3, 2)],
+            ...
+        }
+        graph.addEdge(0, (1, 7))       # edge 0 → 1 with weight 7
+
+Two ways to handle "found a shorter path to v":
+
+    LAZY           push (new_dist, v) again; when an outdated copy is
+                   extracted later, skip it (dist[v] is already smaller)
+                   → heap holds up to E entries, no position map needed
+    DECREASE-KEY   keep ONE entry per vertex and lower its key in place
+                   → heap holds ≤ V entries, needs a handle / position map
+"""
+
+import importlib.util
+import os
+import random
+import time
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_HEAP_DIR = os.path.join(_HERE, "..", "10_Tree", "04_Binary_Heap")
+INF = float("inf")
+
+
+def _load(path, name):
+    """Load a note file by path (file names start with a digit)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def load_graph_class():
+    """Graph from 05_Create_Graph.py (that note prints a demo at import → silenced)."""
+    import contextlib
+    import io
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return _load(os.path.join(_HERE, "05_Create_Graph.py"), "create_graph_mod").Graph
+
+
+Graph = load_graph_class()
+
+binary_heap = _load(os.path.join(_HEAP_DIR, "04_Extract_Node_Binary_Heap.py"), "extract_node_heap")
+indexed_heap = _load(os.path.join(_HEAP_DIR, "07_Indexed_Binary_Heap.py"), "indexed_heap")
+pairing_radix = _load(os.path.join(_HEAP_DIR, "11_Pairing_and_Radix_Heap.py"), "pairing_radix_heap")
+
+
+# =============================================================================
+# 📌 1. Random weighted graph (directed, integer weights)
+# =============================================================================
+def random_graph(vertices, edges, max_weight=1_000, seed=0):
+    """Graph with `edges` random directed edges; every vertex reachable from 0."""
+    rng = random.Random(seed)
+    graph = Graph({v: [] for v in range(vertices)})
+    for v in range(1, vertices):                    # a random spanning path
+        graph.addEdge(v - 1, (v, rng.randint(1, max_weight)))
+    for _ in range(edges - (vertices - 1)):
+        graph.addEdge(rng.randrange(vertices), (rng.randrange(vertices), rng.randint(1, max_weight)))
+    return graph
+
+
+# =============================================================================
+# 📌 2. LAZY Dijkstra — any heap module with insertNode / extractNode
+# =============================================================================
+def dijkstra_lazy(graph, source, heap, insertNode, extractNode, sizeOfHeap):
+    """
+    Works unchanged with the binary Heap, PairingHeap and RadixHeap because
+    they share the insertNode / extractNode / sizeOfHeap functions.
+    Time: O(E log E) with a binary heap
+    """
+    adjacency = graph.graph_dict
+    dist = {source: 0}
+    insertNode(heap, (0, source), "Min")
+    while sizeOfHeap(heap):
+        d, v = extractNode(heap, "Min")
+        if d > dist[v]:
+            continue                                # stale copy
+        for u, w in adjacency[v]:
+            nd = d + w
+            if nd < dist.get(u, INF):
+                dist[u] = nd
+                insertNode(heap, (nd, u), "Min")
+    return dist
+
+
+# =============================================================================
+# 📌 3. DECREASE-KEY Dijkstra — one heap entry per vertex
+# =============================================================================
+def dijkstra_indexed(graph, source):
+    """IndexedHeap: push / pop / decrease_key via the position map. O(E log V)"""
+    adjacency = graph.graph_dict
+    heap = indexed_heap.IndexedHeap()
+    heap.push(source, 0)
+    dist = {}
+    while heap:
+        d = heap.peek_priority()
+        v = heap.pop()
+        dist[v] = d
+        for u, w in adjacency[v]:
+            if u in dist:
+                continue
+            nd = d + w
+            if u not in heap:
+                heap.push(u, nd)
+            elif nd < heap.priority(u):
+                heap.decrease_key(u, nd)
+    return dist
+
+
+def dijkstra_pairing(graph, source):
+    """PairingHeap: node handles make decrease_key an O(1) cut + link."""
+    adjacency = graph.graph_dict
+    heap = pairing_radix.PairingHeap()
+    handles = {source: heap.push(0, source)}
+    dist = {}
+    while heap.heapSize:
+        d, v = heap.pop()
+        dist[v] = d
+        for u, w in adjacency[v]:
+            if u in dist:
+                continue
+            nd = d + w
+            node = handles.get(u)
+            if node is None:
+                handles[u] = heap.push(nd, u)
+            elif nd < node.key:
+                heap.decrease_key(node, nd)
+    return dist
+
+
+def dijkstra_heapq(graph, source):
+    import heapq
+
+    adjacency = graph.graph_dict
+    dist = {source: 0}
+    heap = [(0, source)]
+    while heap:
+        d, v = heapq.heappop(heap)
+        if d > dist[v]:
+            continue
+        for u, w in adjacency[v]:
+            nd = d + w
+            if nd < dist.get(u, INF):
+                dist[u] = nd
+                heapq.heappush(heap, (nd, u))
+    return dist
+
+
+# =============================================================================
+# 📌 4. Benchmark
+# =============================================================================
+def benchmark(vertices=100_000, edges=1_000_000, sources=2):
+    start = time.perf_counter()
+    graph = random_graph(vertices, edges)
+    print(f"Graph: {vertices:,} vertices, {edges:,} weighted edges "
+          f"(built in {time.perf_counter() - start:.1f}s); {sources} Dijkstra runs each")
+
+    m = pairing_radix
+    contenders = [
+        ("heapq (C, lazy)", dijkstra_heapq),
+        ("Heap + insertNode (lazy)", lambda g, s: dijkstra_lazy(
+            g, s, binary_heap.Heap(edges + 1),
+            binary_heap.insertNode, binary_heap.extractNode, binary_heap.sizeOfHeap)),
+        ("IndexedHeap (decrease_key)", dijkstra_indexed),
+        ("PairingHeap (lazy)", lambda g, s: dijkstra_lazy(
+            g, s, m.PairingHeap(), m.insertNode, m.extractNode, m.sizeOfHeap)),
+        ("PairingHeap (decrease_key)", dijkstra_pairing),
+        ("RadixHeap (lazy)", lambda g, s: dijkstra_lazy(
+            g, s, m.RadixHeap(), m.insertNode, m.extractNode, m.sizeOfHeap)),
+    ]
+    reference = [dijkstra_heapq(graph, s) for s in range(sources)]
+    for name, run in contenders:
+        start = time.perf_counter()
+        for s in range(sources):
+            assert run(graph, s) == reference[s], name
+        secs = (time.perf_counter() - start) / sources
+        print(f"  {name:<28} {secs:>6.2f}s per run")
+
+
+if __name__ == "__main__":
+    g = random_graph(6, 10, max_weight=9, seed=1)
+    print("graph_dict:", g.graph_dict)
+    print("heapq      :", dict(sorted(dijkstra_heapq(g, 0).items())))
+    print("pairing    :", dict(sorted(dijkstra_pairing(g, 0).items())))
+    print("radix      :", dict(sorted(dijkstra_lazy(
+        g, 0, pairing_radix.RadixHeap(), pairing_radix.insertNode,
+        pairing_radix.extractNode, pairing_radix.sizeOfHeap).items())))
+    print()
+    benchmark()
+
+
+# =============================================================================
+# 📊 TIME & SPACE COMPLEXITY
+# =============================================================================
+"""
+Priority queue                 Dijkstra time               Heap size
+-----------------------------------------------------------------------------
+binary heap, lazy              O(E log E)                  ≤ E
+binary heap + decrease_key     O(E log V)                  ≤ V (+ position map)
+pairing heap + decrease_key    O(E + V log V) amortized*   ≤ V (+ handles)
+radix heap, lazy (int keys)    O(E + V log C)              ≤ E
+* decrease-key is o(log n) amortized; O(1) in practice
+"""